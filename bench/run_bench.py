@@ -3,7 +3,8 @@
 Performance benchmark harness for Rookeen.
 
 Runs analyses on fixed inputs, capturing timing and return codes.
-Results are stored as CSV for trend analysis.
+Cases run in a persistent `rookeen serve` worker by default (--isolated spawns
+one CLI process per case). Results are stored as CSV for trend analysis.
 
 INDUSTRY-STANDARD UNIX PIPELINE COMPOSABILITY:
 - --quiet: Suppress all non-essential output (for pipelines)
@@ -14,13 +15,17 @@ INDUSTRY-STANDARD UNIX PIPELINE COMPOSABILITY:
 """
 
 import argparse
+import atexit
 import csv
 import json
 import os
+import queue
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from subprocess import DEVNULL, PIPE, run
+from subprocess import DEVNULL, PIPE, Popen, run
+from types import SimpleNamespace
 from typing import Any
 
 """Benchmark cases configuration.
@@ -88,40 +93,15 @@ if os.getenv("OPENAI_API_KEY") or os.getenv("ROOKEEN_OPENAI_API_KEY"):
     )
 
 
-def run_benchmark(
-    name: str,
-    file: str,
-    lang: str,
-    analyzers: list[str],
-    quiet: bool = False,
-    extra_args: list[str] | None = None,
-) -> dict[str, Any]:
-    """Run a single benchmark case and return results.
+def build_cmd(
+    source: str, lang: str, analyzers: list[str], extra_args: list[str] | None = None
+) -> list[str]:
+    """Build the CLI arguments for a case (everything except the output path).
 
-    Args:
-        name: Benchmark case name
-        url: URL to analyze
-        lang: Language code
-        analyzers: List of analyzers to enable
-        quiet: If True, suppress progress output
+    `source` is a local file for `analyze-file`, or an http(s) URL for `analyze`.
     """
-    if not quiet:
-        print(f"Running benchmark: {name}", file=sys.stderr)
-
-    # Build command
-    cmd = [
-        "uv",
-        "run",
-        "python",
-        "-m",
-        "rookeen.cli",
-        "analyze-file",
-        file,
-        "--lang",
-        lang,
-        "-o",
-        f"results/_bench_{name}.json",
-    ]
+    is_url = source.startswith(("http://", "https://"))
+    cmd = ["analyze" if is_url else "analyze-file", source, "--lang", lang]
 
     # Add analyzer flags
     # Optional analyzers must be enabled via dedicated flags so they are registered.
@@ -148,13 +128,124 @@ def run_benchmark(
     # Add any extra CLI args (e.g., embeddings backend)
     if extra_args:
         cmd.extend(extra_args)
+    return cmd
+
+
+# Case argv is constant, so build it once here rather than inside the timed region
+for _case in CASES:
+    _case["cmd_base"] = build_cmd(
+        _case.get("file") or _case["url"],
+        _case["lang"],
+        _case.get("analyzers", []),
+        _case.get("extra_args", []),
+    )
+
+
+# Command prefix used to launch the Rookeen CLI in a child process
+CLI_PREFIX = ["uv", "run", "python", "-m", "rookeen.cli"]
+
+# Shared /dev/null descriptor for discarded child output, opened once per run
+try:
+    _NULL_FD: int = os.open(os.devnull, os.O_WRONLY)
+    atexit.register(os.close, _NULL_FD)
+except OSError:  # pragma: no cover - fall back to per-call DEVNULL
+    _NULL_FD = DEVNULL
+
+
+class BenchWorker:
+    """Long-lived `rookeen serve` process that runs benchmark cases as JSON jobs.
+
+    Keeping one interpreter alive amortizes import and spaCy model-load cost across
+    cases, so timings reflect analysis work rather than process startup.
+    """
+
+    def __init__(self, quiet: bool = False) -> None:
+        self.quiet = quiet
+        self._proc: Popen[str] | None = None
+
+    def start(self) -> None:
+        """Launch the worker (if not running) and wait until it answers a no-op job."""
+        if self._proc is not None and self._proc.poll() is None:
+            return
+        self._proc = Popen(
+            [*CLI_PREFIX, "serve"],
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=_NULL_FD if self.quiet else None,
+            text=True,
+            bufsize=1,
+        )
+        # Handshake so interpreter startup is not charged to the first timed case
+        self._request(["--version"])
+
+    def _request(self, args: list[str]) -> dict[str, Any]:
+        proc = self._proc
+        assert proc is not None and proc.stdin is not None and proc.stdout is not None
+        proc.stdin.write(json.dumps({"args": args}) + "\n")
+        proc.stdin.flush()
+        line = proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"benchmark worker exited with code {proc.wait()}")
+        reply: dict[str, Any] = json.loads(line)
+        return reply
+
+    def run(self, args: list[str]) -> SimpleNamespace:
+        """Run one CLI invocation in the worker; mirrors the fields of `subprocess.run`."""
+        self.start()
+        reply = self._request(args)
+        return SimpleNamespace(
+            returncode=reply["return_code"],
+            stdout=reply["stdout"],
+            stderr=reply.get("stderr", ""),
+        )
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        if self._proc.stdin is not None:
+            self._proc.stdin.close()
+        self._proc.wait()
+        self._proc = None
+
+
+def run_benchmark(
+    name: str,
+    file: str,
+    lang: str,
+    analyzers: list[str],
+    quiet: bool = False,
+    extra_args: list[str] | None = None,
+    worker: BenchWorker | None = None,
+    cmd_base: list[str] | None = None,
+) -> dict[str, Any]:
+    """Run a single benchmark case and return results.
+
+    Args:
+        name: Benchmark case name
+        url: URL to analyze
+        lang: Language code
+        analyzers: List of analyzers to enable
+        quiet: If True, suppress progress output
+        worker: Persistent worker to run the case in; None spawns a fresh CLI process
+        cmd_base: Precomputed CLI arguments (see `build_cmd`), minus the output path
+    """
+    if not quiet:
+        print(f"Running benchmark: {name}", file=sys.stderr)
+
+    base = cmd_base if cmd_base is not None else build_cmd(file, lang, analyzers, extra_args)
+    cmd = [*base, "-o", f"results/_bench_{name}.json"]
 
     # Run benchmark (capture output based on quiet mode)
-    t0 = time.time()
-    stdout_dest = DEVNULL if quiet else PIPE
-    stderr_dest = DEVNULL if quiet else PIPE
-    p = run(cmd, stdout=stdout_dest, stderr=stderr_dest, text=True)
-    dt = time.time() - t0
+    if worker is not None:
+        worker.start()
+    t0 = time.perf_counter()
+    if worker is not None:
+        p = worker.run(cmd)
+    else:
+        # stdout (the output path) is never inspected; stderr carries errors when not quiet
+        stderr_dest = _NULL_FD if quiet else PIPE
+        p = run([*CLI_PREFIX, *cmd], stdout=_NULL_FD, stderr=stderr_dest, text=True)
+    dt = time.perf_counter() - t0
 
     result = {
         "timestamp": datetime.now().isoformat(),
@@ -176,44 +267,133 @@ def run_benchmark(
         if p.stderr:
             result["error_stderr"] = p.stderr[:500]
     elif not quiet:
-        print(".3f", file=sys.stderr)
+        print(f"  OK ({dt:.3f}s)", file=sys.stderr)
 
     return result
 
 
+def run_case(
+    case: dict[str, Any], quiet: bool = False, worker: BenchWorker | None = None
+) -> dict[str, Any]:
+    """Run one CASES entry, converting unexpected exceptions into a failed result."""
+    name = case["name"]
+    file = case.get("file") or case["url"]
+    lang = case["lang"]
+    analyzers = case.get("analyzers", [])
+    extra_args = case.get("extra_args", [])
+    try:
+        return run_benchmark(
+            name,
+            file,
+            lang,
+            analyzers,
+            quiet=quiet,
+            extra_args=extra_args,
+            worker=worker,
+            cmd_base=case.get("cmd_base"),
+        )
+    except Exception as e:
+        if not quiet:
+            print(f"ERROR in {name}: {e}", file=sys.stderr)
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "case": name,
+            "source_file": file,
+            "language": lang,
+            "analyzers": ",".join(analyzers) if analyzers else "default",
+            "return_code": -1,
+            "seconds": 0,
+            "success": False,
+            "error": str(e),
+        }
+
+
+def run_cases(
+    cases: list[dict[str, Any]], jobs: int = 1, quiet: bool = False, isolated: bool = False
+) -> list[dict[str, Any]]:
+    """Run benchmark cases, optionally several at once, returning results in case order.
+
+    Unless `isolated` is set, cases run in persistent `rookeen serve` workers (one per
+    concurrent job); otherwise each case spawns its own CLI process. Either way the work
+    happens in child processes, so a thread pool is enough to overlap them. With jobs=1
+    cases run sequentially, which keeps per-case timings free of contention.
+    """
+    n_workers = max(1, min(jobs, len(cases)))
+    workers: list[BenchWorker] = [] if isolated else [BenchWorker(quiet) for _ in range(n_workers)]
+    idle: queue.Queue[BenchWorker | None] = queue.Queue()
+    for w in workers or [None]:
+        idle.put(w)
+
+    def _run(case: dict[str, Any]) -> dict[str, Any]:
+        worker = idle.get()
+        try:
+            return run_case(case, quiet=quiet, worker=worker)
+        finally:
+            idle.put(worker)
+
+    try:
+        if n_workers == 1:
+            return [_run(case) for case in cases]
+
+        results: list[dict[str, Any] | None] = [None] * len(cases)
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            futures = {ex.submit(_run, case): i for i, case in enumerate(cases)}
+            for fut in as_completed(futures):
+                results[futures[fut]] = fut.result()
+        return [r for r in results if r is not None]
+    finally:
+        for w in workers:
+            w.close()
+
+
 def output_table(results: list[dict[str, Any]], file: Any = sys.stdout) -> None:
     """Output results in human-readable table format."""
     if not results:
         print("No results to display", file=file)
         return
 
-    # Table headers
     headers = ["Case", "Language", "Analyzers", "Return Code", "Time (s)", "Status"]
-    col_widths = [
-        max(len(h), max(len(str(r.get(k.lower().replace(" ", "_"), ""))) for r in results))
-        for h, k in zip(
-            headers, ["case", "language", "analyzers", "return_code", "seconds", "success"], strict=False
-        )
-    ]
-
-    # Header row
-    header_line = " | ".join(f"{h:<{w}}" for h, w in zip(headers, col_widths, strict=False))
-    separator = "-+-".join("-" * w for w in col_widths)
-    print(header_line, file=file)
-    print(separator, file=file)
 
-    # Data rows
-    for result in results:
-        status = "✓" if result.get("success", False) else "✗"
+    # Render each row once (formatting the time a single time per result), tracking
+    # column widths in the same pass
+    rows: list[list[str]] = []
+    widths = [len(h) for h in headers]
+    for r in results:
+        seconds = r.get("seconds")
         row = [
-            result.get("case", ""),
-            result.get("language", ""),
-            result.get("analyzers", ""),
-            str(result.get("return_code", "")),
-            ".3f",
-            status,
+            str(r.get("case", "")),
+            str(r.get("language", "")),
+            str(r.get("analyzers", "")),
+            str(r.get("return_code", "")),
+            f"{seconds:.3f}" if isinstance(seconds, int | float) else "",
+            "✓" if r.get("success", False) else "✗",
         ]
-        print(" | ".join(f"{cell:<{w}}" for cell, w in zip(row, col_widths, strict=False)), file=file)
+        rows.append(row)
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    # Build the row format once and reuse it for every line
+    fmt = " | ".join(f"{{:<{w}}}" for w in widths)
+    print(fmt.format(*headers), file=file)
+    print("-+-".join("-" * w for w in widths), file=file)
+    for row in rows:
+        print(fmt.format(*row), file=file)
+
+
+CSV_FIELDNAMES = (
+    "timestamp",
+    "case",
+    "url",
+    "language",
+    "analyzers",
+    "return_code",
+    "seconds",
+    "success",
+)
+
+# Buffer size for result files so rows are flushed in few large writes
+_WRITE_BUFFER = 1 << 20
 
 
 def output_csv(results: list[dict[str, Any]], file: Any = sys.stdout) -> None:
@@ -221,36 +401,27 @@ def output_csv(results: list[dict[str, Any]], file: Any = sys.stdout) -> None:
     if not results:
         return
 
-    fieldnames = [
-        "timestamp",
-        "case",
-        "url",
-        "language",
-        "analyzers",
-        "return_code",
-        "seconds",
-        "success",
-    ]
-    writer = csv.DictWriter(file, fieldnames=fieldnames)
-    writer.writeheader()
-    for result in results:
-        # Remove error fields for CSV (they're optional)
-        csv_row = {k: v for k, v in result.items() if k in fieldnames}
-        writer.writerow(csv_row)
+    writer = csv.writer(file)
+    writer.writerow(CSV_FIELDNAMES)
+    # Optional error fields are left out; missing columns are written empty
+    writer.writerows([r.get(k, "") for k in CSV_FIELDNAMES] for r in results)
 
 
 def save_files(results: list[dict[str, Any]], quiet: bool) -> tuple[str, str]:
     """Save results to files and return paths. Returns (csv_path, json_path)."""
     os.makedirs("bench/results", exist_ok=True)
 
-    # Save as JSON (for compatibility with existing validation)
+    # Save as JSON (for compatibility with existing validation); compact when quiet
     json_path = "bench/results/latest.json"
-    with open(json_path, "w") as f:
-        json.dump(results, f, indent=2)
+    with open(json_path, "w", buffering=_WRITE_BUFFER) as f:
+        if quiet:
+            json.dump(results, f, separators=(",", ":"))
+        else:
+            json.dump(results, f, indent=2)
 
     # Save as CSV for trend analysis
     csv_path = f"bench/results/{int(time.time())}.csv"
-    with open(csv_path, "w", newline="") as f:
+    with open(csv_path, "w", newline="", buffering=_WRITE_BUFFER) as f:
         output_csv(results, f)
 
     if not quiet:
@@ -282,6 +453,12 @@ EXAMPLES:
   # Table format for human reading
   %(prog)s --format table
 
+  # Run up to 4 cases concurrently
+  %(prog)s --jobs 4
+
+  # Spawn a fresh CLI process per case (includes startup cost in timings)
+  %(prog)s --isolated
+
   # Check if all benchmarks passed
   %(prog)s --json --quiet | jq 'all(.success)'
         """,
@@ -307,6 +484,20 @@ EXAMPLES:
 
     parser.add_argument("--no-save", action="store_true", help="Don't save results to files")
 
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Spawn a fresh CLI process per case instead of reusing a persistent worker",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of benchmark cases to run concurrently (default: 1, sequential)",
+    )
+
     args = parser.parse_args()
 
     # --json implies --quiet and overrides format
@@ -315,32 +506,7 @@ EXAMPLES:
         args.format = "json"
 
     # Run benchmarks
-    results = []
-    for case in CASES:
-        name = case["name"]
-        file = case["file"]
-        lang = case["lang"]
-        analyzers = case.get("analyzers", [])
-        extra_args = case.get("extra_args", [])
-        try:
-            result = run_benchmark(name, file, lang, analyzers, quiet=args.quiet, extra_args=extra_args)
-            results.append(result)
-        except Exception as e:
-            if not args.quiet:
-                print(f"ERROR in {name}: {e}", file=sys.stderr)
-            results.append(
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "case": name,
-                    "source_file": file,
-                    "language": lang,
-                    "analyzers": ",".join(analyzers) if analyzers else "default",
-                    "return_code": -1,
-                    "seconds": 0,
-                    "success": False,
-                    "error": str(e),
-                }
-            )
+    results = run_cases(CASES, jobs=args.jobs, quiet=args.quiet, isolated=args.isolated)
 
     # Save files unless disabled
     if not args.no_save:
@@ -349,11 +515,10 @@ EXAMPLES:
     # Print summary unless quiet
     if not args.quiet:
         successful = sum(1 for r in results if r.get("success", False))
-        # total_time = sum(r.get("seconds", 0) for r in results)
-        # avg_time = total_time / len(results) if results else 0
+        total_time = sum(r.get("seconds", 0) for r in results)
 
         print(f"\nSummary: {successful}/{len(results)} successful", file=sys.stderr)
-        print(".3f", file=sys.stderr)
+        print(f"Total: {total_time:.3f}s", file=sys.stderr)
 
     # Output results in requested format
     if args.format == "json":
@@ -1,15 +1,32 @@
-from .base import BaseAnalyzer, available_analyzers, get_analyzer, register_analyzer
-from .dependency import DependencyAnalyzer
-from .keywords import KeywordAnalyzer
-from .lexical_stats import LexicalStatsAnalyzer
-from .ner import NERAnalyzer
-from .pos import POSAnalyzer
-from .readability import ReadabilityAnalyzer
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+from .base import (
+    BaseAnalyzer,
+    available_analyzers,
+    get_analyzer,
+    get_analyzer_instance,
+    register_analyzer,
+)
+
+# Analyzer classes are resolved lazily (PEP 562) so importing the package does not
+# pull in every analyzer's dependencies.
+_LAZY: dict[str, str] = {
+    "DependencyAnalyzer": "dependency",
+    "KeywordAnalyzer": "keywords",
+    "LexicalStatsAnalyzer": "lexical_stats",
+    "NERAnalyzer": "ner",
+    "POSAnalyzer": "pos",
+    "ReadabilityAnalyzer": "readability",
+}
 
 __all__ = [
     "BaseAnalyzer",
     "available_analyzers",
     "get_analyzer",
+    "get_analyzer_instance",
     "register_analyzer",
     "LexicalStatsAnalyzer",
     "POSAnalyzer",
@@ -18,3 +35,16 @@ __all__ = [
     "KeywordAnalyzer",
     "DependencyAnalyzer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
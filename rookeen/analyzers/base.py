@@ -1,32 +1,47 @@
 from __future__ import annotations
 
+import functools
+import threading
 from abc import ABC, abstractmethod
-from typing import ClassVar, TypeVar
+from importlib.metadata import EntryPoint, entry_points
+from typing import TYPE_CHECKING, ClassVar, TypeVar
 
 from rookeen.models import AnalysisType, LinguisticAnalysisResult
 
-try:  # Import for type checking only to avoid hard dependency at import time
-    import spacy  # noqa: F401
+if TYPE_CHECKING:  # Import for type checking only to avoid importing spaCy with the registry
     from spacy.tokens import Doc
-except Exception:  # pragma: no cover
-    Doc = object
+
+    from rookeen.analyzers.context import AnalysisContext
 
 
 class BaseAnalyzer(ABC):
     """Abstract base class for all analyzers operating on spaCy Doc.
 
     Subclasses must set a unique `name` and an `analysis_type` from AnalysisType,
-    and implement the asynchronous `analyze` method.
+    and implement the synchronous `analyze` method. Analyzers that block on I/O or
+    on work that releases the GIL set `blocking = True` so the pipeline runs them in a
+    worker thread, overlapping with the CPU-bound analyzers. Analyzers that keep no
+    per-instance state set `stateless = True`; `get_analyzer_instance` then shares one
+    instance per process. `spacy_components` names the spaCy pipeline components whose
+    annotations the analyzer reads; the pipeline may skip loading optional components
+    no analyzer lists. None (the default) means the analyzer needs the full pipeline.
     """
 
     name: ClassVar[str]
     analysis_type: ClassVar[AnalysisType]
+    blocking: ClassVar[bool] = False
+    stateless: ClassVar[bool] = False
+    spacy_components: ClassVar[frozenset[str] | None] = None
 
     @abstractmethod
-    async def analyze(self, doc: Doc, lang: str) -> LinguisticAnalysisResult:
+    def analyze(
+        self, doc: Doc, lang: str, ctx: AnalysisContext | None = None
+    ) -> LinguisticAnalysisResult:
         """Run the analyzer over a spaCy Doc and return a structured result.
 
         The `lang` argument is the normalized ISO 639-1 language code for context.
+        `ctx` carries token attributes the pipeline already extracted for this Doc;
+        analyzers that use it should fall back to `AnalysisContext.for_doc(doc)`.
         """
         raise NotImplementedError
 
@@ -35,6 +50,34 @@ AnalyzerT = TypeVar("AnalyzerT", bound="BaseAnalyzer")
 
 
 _ANALYZER_REGISTRY: dict[str, type[BaseAnalyzer]] = {}
+_SHARED_INSTANCES: dict[type[BaseAnalyzer], BaseAnalyzer] = {}
+_SHARED_INSTANCES_LOCK = threading.Lock()
+
+# Entry-point group analyzers are discovered from. Declaring an analyzer there lets
+# it be listed from installed metadata and imported only when it is requested.
+ENTRY_POINT_GROUP = "rookeen.analyzers"
+
+# Built-in analyzers, mirroring pyproject.toml's entry points so they stay available
+# when running from a source tree without installed package metadata.
+_BUILTIN_ANALYZERS: dict[str, str] = {
+    "dependency": "rookeen.analyzers.dependency:DependencyAnalyzer",
+    "embeddings": "rookeen.analyzers.embeddings:EmbeddingsAnalyzer",
+    "keywords": "rookeen.analyzers.keywords:KeywordAnalyzer",
+    "lexical_stats": "rookeen.analyzers.lexical_stats:LexicalStatsAnalyzer",
+    "ner": "rookeen.analyzers.ner:NERAnalyzer",
+    "pos": "rookeen.analyzers.pos:POSAnalyzer",
+    "readability": "rookeen.analyzers.readability:ReadabilityAnalyzer",
+    "sentiment": "rookeen.analyzers.sentiment:SentimentAnalyzer",
+}
+
+
+@functools.cache
+def _analyzer_entry_points() -> dict[str, EntryPoint]:
+    """Return analyzer entry points by name, read once from installed metadata."""
+    eps = {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+    for name, value in _BUILTIN_ANALYZERS.items():
+        eps.setdefault(name, EntryPoint(name, value, ENTRY_POINT_GROUP))
+    return eps
 
 
 def register_analyzer(cls: type[AnalyzerT]) -> type[AnalyzerT]:
@@ -54,13 +97,34 @@ def register_analyzer(cls: type[AnalyzerT]) -> type[AnalyzerT]:
 
 
 def available_analyzers() -> list[str]:
-    """Return a sorted list of available analyzer names."""
-    return sorted(_ANALYZER_REGISTRY.keys())
+    """Return a sorted list of available analyzer names without importing them."""
+    return sorted(_ANALYZER_REGISTRY.keys() | _analyzer_entry_points().keys())
 
 
 def get_analyzer(name: str) -> type[BaseAnalyzer]:
-    """Fetch an analyzer class by its registered name."""
+    """Fetch an analyzer class by name, loading its entry point on first use."""
+    if name not in _ANALYZER_REGISTRY:
+        ep = _analyzer_entry_points().get(name)
+        if ep is not None:
+            cls = ep.load()
+            # Built-ins register on import; accept plain subclasses from third parties too
+            if isinstance(cls, type) and issubclass(cls, BaseAnalyzer):
+                _ANALYZER_REGISTRY.setdefault(name, cls)
     try:
         return _ANALYZER_REGISTRY[name]
     except KeyError as exc:  # pragma: no cover - simple guard
-        raise KeyError(f"Unknown analyzer '{name}'. Known: {sorted(_ANALYZER_REGISTRY)}") from exc
+        raise KeyError(f"Unknown analyzer '{name}'. Known: {available_analyzers()}") from exc
+
+
+def get_analyzer_instance(name: str) -> BaseAnalyzer:
+    """Return an analyzer instance by name, shared per process for stateless analyzers."""
+    cls = get_analyzer(name)
+    if not cls.stateless:
+        return cls()
+    instance = _SHARED_INSTANCES.get(cls)
+    if instance is None:
+        with _SHARED_INSTANCES_LOCK:
+            instance = _SHARED_INSTANCES.get(cls)
+            if instance is None:
+                instance = _SHARED_INSTANCES[cls] = cls()
+    return instance
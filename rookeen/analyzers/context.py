@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import weakref
+from collections import Counter
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
+
+from .token_arrays import lemma_ids, lower_counts
+
+if TYPE_CHECKING:
+    from spacy.strings import StringStore
+    from spacy.tokens import Doc
+
+__all__ = ["AnalysisContext"]
+
+
+class AnalysisContext:
+    """Token attributes extracted once per Doc and shared by all analyzers.
+
+    `arr` holds one `Doc.to_array` row per token with the columns listed in `ATTRS`;
+    derived masks and lemma counts are computed on first use. Contexts are cached per
+    Doc in a weak mapping, so `for_doc` returns the same instance while the Doc lives.
+    Attributes live in slots, keeping the per-Doc footprint to the arrays themselves.
+    """
+
+    __slots__ = (
+        "_alpha_mask",
+        "_alpha_nonstop_mask",
+        "_lemma_counts",
+        "_lemma_keys",
+        "_sentence_count",
+        "arr",
+        "strings",
+    )
+
+    ATTRS: ClassVar[tuple[str, ...]] = (
+        "POS",
+        "DEP",
+        "HEAD",
+        "IS_ALPHA",
+        "IS_STOP",
+        "LENGTH",
+        "LEMMA",
+        "ORTH",
+        "ENT_IOB",
+        "ENT_TYPE",
+        "SENT_START",
+    )
+    POS, DEP, HEAD, IS_ALPHA, IS_STOP, LENGTH = range(6)
+    LEMMA, ORTH, ENT_IOB, ENT_TYPE, SENT_START = range(6, 11)
+
+    _cache: ClassVar[weakref.WeakKeyDictionary[Doc, AnalysisContext]] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, doc: Doc) -> None:
+        self.strings: StringStore = doc.vocab.strings
+        self.arr: np.ndarray = doc.to_array(list(self.ATTRS))
+        self._alpha_mask: np.ndarray | None = None
+        self._alpha_nonstop_mask: np.ndarray | None = None
+        self._sentence_count: int | None = None
+        self._lemma_keys: np.ndarray | None = None
+        self._lemma_counts: Counter[str] | None = None
+
+    @classmethod
+    def for_doc(cls, doc: Doc) -> AnalysisContext:
+        """Return the shared context for `doc`, building it on first request."""
+        ctx = cls._cache.get(doc)
+        if ctx is None:
+            ctx = cls._cache[doc] = cls(doc)
+        return ctx
+
+    @property
+    def alpha_mask(self) -> np.ndarray:
+        """Boolean mask of alphabetic tokens."""
+        if self._alpha_mask is None:
+            self._alpha_mask = self.arr[:, self.IS_ALPHA] != 0
+        return self._alpha_mask
+
+    @property
+    def alpha_nonstop_mask(self) -> np.ndarray:
+        """Boolean mask of alphabetic, non-stopword tokens."""
+        if self._alpha_nonstop_mask is None:
+            self._alpha_nonstop_mask = self.alpha_mask & (self.arr[:, self.IS_STOP] == 0)
+        return self._alpha_nonstop_mask
+
+    @property
+    def sentence_count(self) -> int:
+        """Number of sentences `doc.sents` would yield, without building Span objects.
+
+        The first token always opens a sentence; later ones do when SENT_START is 1.
+        """
+        if self._sentence_count is None:
+            starts = self.arr[1:, self.SENT_START]
+            self._sentence_count = int((starts == 1).sum()) + (1 if len(self.arr) else 0)
+        return self._sentence_count
+
+    @property
+    def lemma_keys(self) -> np.ndarray:
+        """Lemma ids (or ORTH when a token has no lemma) of alpha, non-stop tokens."""
+        if self._lemma_keys is None:
+            rows = self.arr[self.alpha_nonstop_mask]
+            self._lemma_keys = lemma_ids(rows[:, self.LEMMA], rows[:, self.ORTH])
+        return self._lemma_keys
+
+    @property
+    def lemma_counts(self) -> Counter[str]:
+        """Lowercased lemma counts over alpha, non-stop tokens, in first-occurrence order."""
+        if self._lemma_counts is None:
+            self._lemma_counts = lower_counts(self.strings, self.lemma_keys)
+        return self._lemma_counts
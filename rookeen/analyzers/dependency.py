@@ -1,23 +1,42 @@
 from __future__ import annotations
 
 import time
-from collections import Counter
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from rookeen.analyzers.base import BaseAnalyzer, register_analyzer
+from rookeen.analyzers.context import AnalysisContext
 from rookeen.models import AnalysisType, LinguisticAnalysisResult
 
-try:
+if TYPE_CHECKING:
     from spacy.tokens import Doc
-except Exception:  # pragma: no cover
-    Doc = object
+
+
+def _top_pairs(pairs: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the `k` most frequent dense pair ids and their counts.
+
+    Counts go into a preallocated table with `np.bincount` (linear time, no sort over the
+    tokens); ties keep first-occurrence order, like `Counter.most_common`.
+    """
+    counts = np.bincount(pairs)
+    first = np.full(len(counts), len(pairs), dtype=np.int64)
+    np.minimum.at(first, pairs, np.arange(len(pairs), dtype=np.int64))
+    present = np.flatnonzero(counts)
+    top = present[np.lexsort((first[present], -counts[present]))[:k]]
+    return top, counts[top]
 
 
 @register_analyzer
 class DependencyAnalyzer(BaseAnalyzer):
     name = "dependency"
     analysis_type = AnalysisType.POS
+    spacy_components = frozenset({"parser"})
+    stateless = True
 
-    async def analyze(self, doc: Doc, lang: str) -> LinguisticAnalysisResult:
+    def analyze(
+        self, doc: Doc, lang: str, ctx: AnalysisContext | None = None
+    ) -> LinguisticAnalysisResult:
         start = time.perf_counter()
         if not hasattr(doc, "has_annotation") or not doc.has_annotation("DEP"):
             return LinguisticAnalysisResult(
@@ -28,15 +47,33 @@ class DependencyAnalyzer(BaseAnalyzer):
                 confidence=0.8,
                 metadata={},
             )
-        dep_counts: Counter[str] = Counter(t.dep_ for t in doc)
-        head_pos_counts: Counter[str] = Counter(f"{t.head.pos_}->{t.dep_}" for t in doc)
+        ctx = ctx or AnalysisContext.for_doc(doc)
+        arr = ctx.arr
+        strings = ctx.strings
+        # DEP values are string hashes; densify them once for both counts and pairing
+        dep_ids, dep_first, dep_index, dep_totals = np.unique(
+            arr[:, ctx.DEP], return_index=True, return_inverse=True, return_counts=True
+        )
+        dep_counts = {
+            strings[int(dep_ids[i])]: int(dep_totals[i])
+            for i in np.argsort(dep_first, kind="stable").tolist()
+        }
+
+        # HEAD is stored as a relative offset; pair each token's dep with its head's POS
+        heads = np.arange(len(arr), dtype=np.int64) + arr[:, ctx.HEAD].astype(np.int64)
+        pairs = arr[heads, ctx.POS].astype(np.int64) * len(dep_ids) + dep_index
+        pair_ids, pair_counts = _top_pairs(pairs, 20)
+        head_pos_dep: dict[str, int] = {}
+        for pair, count in zip(pair_ids.tolist(), pair_counts.tolist(), strict=True):
+            head_pos, dep = divmod(pair, len(dep_ids))
+            head_pos_dep[f"{strings[head_pos]}->{strings[int(dep_ids[dep])]}"] = count
         return LinguisticAnalysisResult(
             analysis_type=self.analysis_type,
             name=self.name,
             results={
                 "supported": True,
-                "dep_counts": dict(dep_counts),
-                "head_pos_dep": dict(head_pos_counts.most_common(20)),
+                "dep_counts": dep_counts,
+                "head_pos_dep": head_pos_dep,
             },
             processing_time=time.perf_counter() - start,
             confidence=0.9,
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
-
-from spacy.tokens.doc import Doc
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 from rookeen.analyzers.base import BaseAnalyzer, register_analyzer
-from rookeen.analyzers.embeddings_backends import get_backend
+from rookeen.analyzers.embeddings_backends import EmbeddingBackend, get_backend
 from rookeen.models import AnalysisType, LinguisticAnalysisResult
 
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
+    from rookeen.analyzers.context import AnalysisContext
+
 DEFAULT_BACKEND = os.getenv("ROOKEEN_EMBEDDINGS_BACKEND", "miniLM")
 DEFAULT_MODEL_MINILM = "sentence-transformers/all-MiniLM-L6-v2"
 
@@ -20,47 +26,101 @@ def _resolve_backend_and_model() -> tuple[str, str]:
     return backend, model
 
 
+# Backends built in this process, keyed by (backend, model, whether an API key is set), so
+# each model loads once and is shared by every analyzer call and the CLI preload
+_BACKENDS: dict[tuple[str, str, bool], EmbeddingBackend] = {}
+_BACKENDS_LOCK = threading.Lock()
+
+
+def shared_backend(
+    backend_key: str, model_name: str = "", api_key: str | None = None
+) -> EmbeddingBackend:
+    """Return the process-wide backend for a configuration, building it on first use.
+
+    Empty `model_name` selects the backend's default model; `api_key` is only used by
+    the openai-te3 backend.
+    """
+    kwargs: dict[str, object] = {}
+    if backend_key in ("miniLM", "miniLM-onnx"):
+        kwargs["model_name"] = model_name or DEFAULT_MODEL_MINILM
+    elif backend_key == "bge-m3":
+        kwargs["model_name"] = model_name or "BAAI/bge-m3"
+    elif backend_key == "openai-te3":
+        kwargs["model_name"] = model_name or os.getenv("ROOKEEN_OPENAI_MODEL", "text-embedding-3-small")
+        kwargs["api_key"] = api_key
+    key = (backend_key, str(kwargs.get("model_name", "")), kwargs.get("api_key") is not None)
+    with _BACKENDS_LOCK:
+        backend = _BACKENDS.get(key)
+        if backend is None:
+            backend = _BACKENDS[key] = get_backend(backend_key, **kwargs)
+    return backend
+
+
+def _build_backend() -> EmbeddingBackend:
+    backend_key, model_name = _resolve_backend_and_model()
+    api_key = os.getenv("ROOKEEN_OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
+    return shared_backend(backend_key, model_name, api_key)
+
+
+def _redact(exc: Exception) -> str:
+    # Avoid leaking secrets in error messages
+    msg = str(exc)
+    for k in (os.getenv("ROOKEEN_OPENAI_API_KEY"), os.getenv("OPENAI_API_KEY")):
+        if k:
+            msg = msg.replace(k, "***REDACTED***")
+    return msg
+
+
 @register_analyzer
 class EmbeddingsAnalyzer(BaseAnalyzer):
     """Analyzer for generating sentence embeddings using pluggable backends."""
 
     name = "embeddings"
     analysis_type = AnalysisType.EMBEDDINGS
+    spacy_components = frozenset()
+    # Model inference and API calls release the GIL; run off the event loop thread
+    blocking = True
+    stateless = True
 
-    async def analyze(self, doc: Doc, lang: str) -> LinguisticAnalysisResult:
+    def analyze(
+        self, doc: Doc, lang: str, ctx: AnalysisContext | None = None
+    ) -> LinguisticAnalysisResult:
         """Generate embeddings for the document text via selected backend."""
+        return self.analyze_batch([doc], lang)[0]
+
+    def analyze_batch(
+        self, docs: Sequence[Doc], lang: str
+    ) -> list[LinguisticAnalysisResult]:
+        """Generate embeddings for many documents with one backend call.
+
+        Texts are encoded in length-sorted order so each batch holds inputs of similar
+        size and padding is minimized; results are returned in the order of `docs`.
+        """
         start = time.perf_counter()
-        backend_key, model_name = _resolve_backend_and_model()
 
         # Construct backend
         try:
-            kwargs: dict[str, object] = {}
-            if backend_key == "miniLM":
-                kwargs["model_name"] = model_name or DEFAULT_MODEL_MINILM
-            elif backend_key == "bge-m3":
-                kwargs["model_name"] = model_name or "BAAI/bge-m3"
-            elif backend_key == "openai-te3":
-                kwargs["model_name"] = model_name or os.getenv("ROOKEEN_OPENAI_MODEL", "text-embedding-3-small")
-                kwargs["api_key"] = os.getenv("ROOKEEN_OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
-            m = get_backend(backend_key, **kwargs)
+            m = _build_backend()
         except Exception as e:
-            # Avoid leaking secrets in error messages
-            msg = str(e)
-            for k in (os.getenv("ROOKEEN_OPENAI_API_KEY"), os.getenv("OPENAI_API_KEY")):
-                if k:
-                    msg = msg.replace(k, "***REDACTED***")
-            return LinguisticAnalysisResult(
-                analysis_type=self.analysis_type,
-                name=self.name,
-                results={"supported": False, "note": f"embeddings backend unavailable: {msg}"},
-                processing_time=time.perf_counter() - start,
-                confidence=0.0,
-            )
+            result = {"supported": False, "note": f"embeddings backend unavailable: {_redact(e)}"}
+            return self._failed(len(docs), result, start)
 
         try:
-            vec = m.embed(doc.text)
+            texts = [d.text for d in docs]
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            vecs = m.embed_batch([texts[i] for i in order])
+            vectors: list[list[float]] = [[] for _ in texts]
+            for i, vec in zip(order, vecs, strict=True):
+                vectors[i] = vec
             prov = m.provenance()
-            return LinguisticAnalysisResult(
+        except Exception as e:
+            result = {"supported": False, "note": f"embedding failed: {_redact(e)}"}
+            return self._failed(len(docs), result, start)
+
+        # Attribute the shared encode time evenly across the batch
+        elapsed = (time.perf_counter() - start) / max(len(docs), 1)
+        return [
+            LinguisticAnalysisResult(
                 analysis_type=self.analysis_type,
                 name=self.name,
                 results={
@@ -68,19 +128,23 @@ class EmbeddingsAnalyzer(BaseAnalyzer):
                     **prov,
                     "vector": vec,
                 },
-                processing_time=time.perf_counter() - start,
+                processing_time=elapsed,
                 confidence=1.0,
             )
-        except Exception as e:
-            # Avoid leaking secrets in error messages
-            msg = str(e)
-            for k in (os.getenv("ROOKEEN_OPENAI_API_KEY"), os.getenv("OPENAI_API_KEY")):
-                if k:
-                    msg = msg.replace(k, "***REDACTED***")
-            return LinguisticAnalysisResult(
+            for vec in vectors
+        ]
+
+    def _failed(
+        self, count: int, results: dict[str, object], start: float
+    ) -> list[LinguisticAnalysisResult]:
+        elapsed = time.perf_counter() - start
+        return [
+            LinguisticAnalysisResult(
                 analysis_type=self.analysis_type,
                 name=self.name,
-                results={"supported": False, "note": f"embedding failed: {msg}"},
-                processing_time=time.perf_counter() - start,
+                results=dict(results),
+                processing_time=elapsed,
                 confidence=0.0,
             )
+            for _ in range(count)
+        ]
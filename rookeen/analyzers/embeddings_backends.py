@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-import math
+import base64
+import contextlib
+import hashlib
+import json
 import os
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import numpy as np
 
 if TYPE_CHECKING:
     from openai import OpenAI
@@ -12,6 +22,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "EmbeddingBackend",
+    "CachedBackend",
     "register_backend",
     "get_backend",
 ]
@@ -23,6 +34,7 @@ class EmbeddingBackend(ABC):
     Concrete implementations must provide:
     - load(): materialize any heavyweight resources (models, clients). Should be idempotent.
     - embed(text): return a single L2-normalized embedding vector as a list[float].
+    - embed_batch(texts): optional; defaults to calling embed() per text.
     - provenance(): return backend/model metadata, including keys like
       {"backend": str, "model": str, "dim": int, "normalized": bool}.
     """
@@ -39,6 +51,14 @@ class EmbeddingBackend(ABC):
         The vector should be L2-normalized for cosine-similarity compatibility.
         """
 
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Compute embeddings for many texts, preserving input order.
+
+        The default implementation calls `embed` per text; backends that can share a
+        forward pass or a request across inputs should override it.
+        """
+        return [self.embed(t) for t in texts]
+
     @abstractmethod
     def provenance(self) -> dict[str, Any]:
         """Return metadata describing the backend/model configuration."""
@@ -71,7 +91,8 @@ def get_backend(name: str, **kwargs: Any) -> EmbeddingBackend:
     """Instantiate a registered embeddings backend by key.
 
     Raises KeyError if the backend name is unknown.
-    Any keyword arguments are forwarded to the backend constructor.
+    Any keyword arguments are forwarded to the backend constructor. The returned backend
+    is wrapped in a `CachedBackend` unless ROOKEEN_EMBEDDINGS_CACHE is set to a false value.
     """
 
     try:
@@ -79,7 +100,248 @@ def get_backend(name: str, **kwargs: Any) -> EmbeddingBackend:
     except KeyError as exc:
         known = ", ".join(sorted(_REGISTRY)) or "<none>"
         raise KeyError(f"Unknown embeddings backend '{name}'. Known: [{known}]") from exc
-    return cls(**kwargs)
+    backend = cls(**kwargs)
+    if os.getenv("ROOKEEN_EMBEDDINGS_CACHE", "1").strip().lower() in {"0", "false", "no", "off"}:
+        return backend
+    return CachedBackend(backend)
+
+
+def _default_cache_dir() -> Path:
+    env = os.getenv("ROOKEEN_CACHE_DIR")
+    if env:
+        return Path(env).expanduser() / "emb"
+    return Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "rookeen" / "emb"
+
+
+class CachedBackend(EmbeddingBackend):
+    """Caching decorator around another embeddings backend.
+
+    Vectors are keyed by the wrapped backend's full provenance (backend, model and
+    variant such as device, dtype or quantization) plus blake2b(text), and kept in a
+    process-wide in-memory LRU backed by a SQLite store under ~/.cache/rookeen/emb (or
+    ROOKEEN_CACHE_DIR/emb). `embed_batch` only forwards cache misses to the wrapped
+    backend and returns copies, so callers never share a cached vector. The disk store
+    keeps at most ROOKEEN_EMBEDDINGS_CACHE_MAX entries and evicts the least recently
+    accessed ones beyond that.
+    """
+
+    _memory: ClassVar[OrderedDict[tuple[str, str, str, str], list[float]]] = OrderedDict()
+    _memory_max: ClassVar[int] = 4096
+    # Guards the in-memory LRU only; each instance's SQLite connection has its own lock
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        inner: EmbeddingBackend,
+        cache_dir: str | Path | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        self.inner = inner
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else _default_cache_dir()
+        if max_entries is None:
+            try:
+                max_entries = int(os.getenv("ROOKEEN_EMBEDDINGS_CACHE_MAX", "100000"))
+            except ValueError:
+                max_entries = 100000
+        self.max_entries = max_entries
+        self._scope: tuple[str, str, str] | None = None
+        self._db: sqlite3.Connection | None = None
+        self._db_failed = False
+        self._db_lock = threading.Lock()
+
+    def load(self) -> None:
+        self.inner.load()
+
+    def provenance(self) -> dict[str, Any]:
+        return self.inner.provenance()
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0]
+
+    def _cache_scope(self) -> tuple[str, str, str]:
+        """Return (backend, model, variant) identifying the vectors the backend produces.
+
+        Resolved on first use rather than at construction, since provenance may depend
+        on the device the backend detects.
+        """
+        if self._scope is None:
+            prov = dict(self.inner.provenance())
+            backend = str(prov.pop("backend", type(self.inner).__name__))
+            model = str(prov.pop("model", ""))
+            self._scope = (backend, model, json.dumps(prov, sort_keys=True, default=str))
+        return self._scope
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        scope = self._cache_scope()
+        keys = [hashlib.blake2b(t.encode("utf-8"), digest_size=16).hexdigest() for t in texts]
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for key in keys:
+                mkey = (*scope, key)
+                vec = self._memory.get(mkey)
+                if vec is not None:
+                    self._memory.move_to_end(mkey)
+                    found[key] = vec
+        missing = [k for k in dict.fromkeys(keys) if k not in found]
+        if missing:
+            found.update(self._disk_get(missing))
+
+        miss_texts: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in found:
+                miss_texts.setdefault(key, text)
+        if miss_texts:
+            vecs = self.inner.embed_batch(list(miss_texts.values()))
+            computed = dict(zip(miss_texts, vecs, strict=True))
+            self._disk_put(computed)
+            found.update(computed)
+
+        with self._lock:
+            for key, vec in found.items():
+                self._memory[(*scope, key)] = vec
+            while len(self._memory) > self._memory_max:
+                self._memory.popitem(last=False)
+        return [list(found[k]) for k in keys]
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Open the SQLite store; call with `_db_lock` held."""
+        if self._db is None and not self._db_failed:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(self.cache_dir / "embeddings.sqlite3", check_same_thread=False)
+                # Rows of the earlier schema were not keyed by variant (device/dtype/quantization)
+                db.execute("DROP TABLE IF EXISTS vectors")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    "backend TEXT, model TEXT, variant TEXT, key TEXT, vector BLOB, atime REAL, "
+                    "PRIMARY KEY (backend, model, variant, key))"
+                )
+                db.execute("CREATE INDEX IF NOT EXISTS embeddings_atime ON embeddings (atime)")
+                self._db = db
+            except (OSError, sqlite3.Error):
+                # An unwritable cache directory only disables the disk tier
+                self._db_failed = True
+        return self._db
+
+    def _disk_get(self, keys: list[str]) -> dict[str, list[float]]:
+        scope = self._cache_scope()
+        out: dict[str, list[float]] = {}
+        with self._db_lock:
+            db = self._connect()
+            if db is None:
+                return out
+            try:
+                with db:
+                    for i in range(0, len(keys), 500):
+                        chunk = keys[i : i + 500]
+                        marks = ",".join("?" * len(chunk))
+                        rows = db.execute(
+                            f"SELECT key, vector FROM embeddings WHERE backend = ? AND model = ? "
+                            f"AND variant = ? AND key IN ({marks})",
+                            (*scope, *chunk),
+                        ).fetchall()
+                        for key, blob in rows:
+                            out[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+                    if out:
+                        now = time.time()
+                        db.executemany(
+                            "UPDATE embeddings SET atime = ? WHERE backend = ? AND model = ? "
+                            "AND variant = ? AND key = ?",
+                            [(now, *scope, k) for k in out],
+                        )
+            except sqlite3.Error:
+                return out
+        return out
+
+    def _disk_put(self, vectors: dict[str, list[float]]) -> None:
+        if not vectors:
+            return
+        scope = self._cache_scope()
+        now = time.time()
+        rows = [
+            (*scope, k, np.asarray(v, dtype=np.float32).tobytes(), now) for k, v in vectors.items()
+        ]
+        with self._db_lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?, ?)", rows
+                    )
+                    (count,) = db.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+                    if count > self.max_entries:
+                        db.execute(
+                            "DELETE FROM embeddings WHERE rowid IN "
+                            "(SELECT rowid FROM embeddings ORDER BY atime LIMIT ?)",
+                            (count - self.max_entries,),
+                        )
+            except sqlite3.Error:
+                pass
+
+
+def _detect_device() -> str:
+    """Prefer Apple Silicon (MPS), then CUDA, else CPU."""
+    try:
+        import torch
+
+        if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+            return "mps"
+        if torch.cuda.is_available():
+            return "cuda"
+    except Exception:
+        pass
+    return "cpu"
+
+
+_TORCH_THREADS_CONFIGURED = False
+
+
+def _configure_torch_threads() -> None:
+    """Size torch's CPU thread pools once per process.
+
+    Intra-op threads default to all cores (override with ROOKEEN_TORCH_THREADS); inter-op
+    parallelism is pinned to one thread since encode runs a single graph at a time.
+    """
+    global _TORCH_THREADS_CONFIGURED
+    if _TORCH_THREADS_CONFIGURED:
+        return
+    _TORCH_THREADS_CONFIGURED = True
+    try:
+        import torch
+    except Exception:  # pragma: no cover - sentence-transformers import fails first
+        return
+    try:
+        threads = int(os.getenv("ROOKEEN_TORCH_THREADS", "") or os.cpu_count() or 1)
+    except ValueError:
+        threads = os.cpu_count() or 1
+    torch.set_num_threads(max(threads, 1))
+    # Only allowed before any inter-op work has started in this process
+    with contextlib.suppress(RuntimeError):
+        torch.set_num_interop_threads(1)
+
+
+def _half_precision_enabled(device: str) -> bool:
+    """Whether sentence-transformers models on `device` run in FP16."""
+    if device not in ("cuda", "mps"):
+        return False
+    flag = os.getenv("ROOKEEN_EMBEDDINGS_FP16", "1").strip().lower()
+    return flag not in {"0", "false", "no", "off"}
+
+
+def _use_half_precision(model: SentenceTransformer, device: str) -> None:
+    """Run a sentence-transformers model in FP16 on CUDA/MPS devices.
+
+    Halves memory bandwidth and lets CUDA matmuls use tensor cores; cosine similarity
+    drifts by well under 0.01. Disable with ROOKEEN_EMBEDDINGS_FP16=0. CPU stays FP32.
+    """
+    if not _half_precision_enabled(device):
+        return
+    import torch
+
+    torch.set_float32_matmul_precision("high")
+    model.half()
 
 
 @register_backend("bge-m3")
@@ -92,21 +354,8 @@ class BgeM3Backend(EmbeddingBackend):
 
     def __init__(self, model_name: str = "BAAI/bge-m3", device: str | None = None) -> None:
         self.model_name = model_name
-        # Default to CPU; auto-detect Apple Silicon (MPS) or CUDA when no explicit device provided
-        if device is None:
-            try:
-                import torch
-
-                if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                    self.device = "mps"
-                elif torch.cuda.is_available():
-                    self.device = "cuda"
-                else:
-                    self.device = "cpu"
-            except Exception:
-                self.device = "cpu"
-        else:
-            self.device = device
+        # None auto-detects at load() time, so constructing a backend does not import torch
+        self.device: str | None = device
         self._model: SentenceTransformer | None = None
 
     def load(self) -> None:
@@ -116,27 +365,53 @@ class BgeM3Backend(EmbeddingBackend):
             raise RuntimeError(
                 "sentence-transformers not installed; install rookeen[embeddings]"
             ) from exc
+        _configure_torch_threads()
+        if self.device is None:
+            self.device = _detect_device()
         self._model = SentenceTransformer(self.model_name, device=self.device)
+        _use_half_precision(self._model, self.device)
 
     def embed(self, text: str) -> list[float]:
         if self._model is None:
             self.load()
         assert self._model is not None
-        vec = self._model.encode([text], normalize_embeddings=False)[0]
-        # L2 normalize
-        norm = math.sqrt(float((vec ** 2).sum())) or 1.0
-        result: list[float] = (vec / norm).tolist()
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        if self._model is None:
+            self.load()
+        assert self._model is not None
+        if not texts:
+            return []
+        import torch
+
+        # sentence-transformers length-sorts inputs internally to minimize padding
+        with torch.inference_mode():
+            vecs = self._model.encode(
+                texts, batch_size=64, normalize_embeddings=True, convert_to_numpy=True
+            )
+        result: list[list[float]] = vecs.tolist()
         return result
 
     def provenance(self) -> dict[str, Any]:
+        device = self.device or _detect_device()
         return {
             "backend": "bge-m3",
             "model": self.model_name,
             "dim": 1024,
             "normalized": True,
+            "device": device,
+            "dtype": "float16" if _half_precision_enabled(device) else "float32",
         }
 
 
+def _decode_embedding(value: str | list[float]) -> np.ndarray:
+    """Decode an OpenAI embedding returned as base64 float32 bytes or as a float list."""
+    if isinstance(value, str):
+        return np.frombuffer(base64.b64decode(value), dtype=np.float32)
+    return np.asarray(value, dtype=np.float32)
+
+
 @register_backend("openai-te3")
 class OpenAITe3Backend(EmbeddingBackend):
     """OpenAI text-embedding-3 backend (API-based).
@@ -172,15 +447,31 @@ class OpenAITe3Backend(EmbeddingBackend):
                 timeout = None
         self._client = OpenAI(api_key=self.api_key, timeout=timeout) if timeout else OpenAI(api_key=self.api_key)
 
+    # The embeddings endpoint accepts at most this many inputs per request
+    max_batch = 2048
+
     def embed(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
         if self._client is None:
             self.load()
         assert self._client is not None
-        resp = self._client.embeddings.create(model=self.model_name, input=text)
-        vec = resp.data[0].embedding
-        # L2 normalize
-        norm = math.sqrt(sum(v * v for v in vec)) or 1.0
-        return [v / norm for v in vec]
+        results: list[list[float]] = []
+        for i in range(0, len(texts), self.max_batch):
+            # base64 returns the raw float32 buffer: a smaller payload and no JSON float parsing
+            resp = self._client.embeddings.create(
+                model=self.model_name,
+                input=texts[i : i + self.max_batch],
+                encoding_format="base64",
+            )
+            data = sorted(resp.data, key=lambda d: d.index)
+            arr = np.stack([_decode_embedding(d.embedding) for d in data])
+            # L2 normalize
+            norms = np.linalg.norm(arr, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            results.extend((arr / norms).tolist())
+        return results
 
     def provenance(self) -> dict[str, Any]:
         dim = 1536 if self.model_name.endswith("small") else 3072
@@ -202,20 +493,8 @@ class MiniLMBackend(EmbeddingBackend):
 
     def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2", device: str | None = None) -> None:
         self.model_name = model_name
-        if device is None:
-            try:
-                import torch
-
-                if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                    self.device = "mps"
-                elif torch.cuda.is_available():
-                    self.device = "cuda"
-                else:
-                    self.device = "cpu"
-            except Exception:
-                self.device = "cpu"
-        else:
-            self.device = device
+        # None auto-detects at load() time, so constructing a backend does not import torch
+        self.device: str | None = device
         self._model: SentenceTransformer | None = None
 
     def load(self) -> None:
@@ -225,23 +504,141 @@ class MiniLMBackend(EmbeddingBackend):
             raise RuntimeError(
                 "sentence-transformers not installed; install rookeen[embeddings]"
             ) from exc
+        _configure_torch_threads()
+        if self.device is None:
+            self.device = _detect_device()
         self._model = SentenceTransformer(self.model_name, device=self.device)
+        _use_half_precision(self._model, self.device)
 
     def embed(self, text: str) -> list[float]:
         if self._model is None:
             self.load()
         assert self._model is not None
-        vec = self._model.encode([text], normalize_embeddings=False)[0]
-        # L2 normalize
-        norm = math.sqrt(float((vec ** 2).sum())) or 1.0
-        result: list[float] = (vec / norm).tolist()
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        if self._model is None:
+            self.load()
+        assert self._model is not None
+        if not texts:
+            return []
+        import torch
+
+        # sentence-transformers length-sorts inputs internally to minimize padding
+        with torch.inference_mode():
+            vecs = self._model.encode(
+                texts, batch_size=64, normalize_embeddings=True, convert_to_numpy=True
+            )
+        result: list[list[float]] = vecs.tolist()
         return result
 
     def provenance(self) -> dict[str, Any]:
+        device = self.device or _detect_device()
         return {
             "backend": "miniLM",
             "model": self.model_name,
             "dim": 384,
             "normalized": True,
+            "device": device,
+            "dtype": "float16" if _half_precision_enabled(device) else "float32",
         }
 
+
+
+@register_backend("miniLM-onnx")
+class MiniLMOnnxBackend(EmbeddingBackend):
+    """MiniLM backend on ONNX Runtime with dynamic INT8 quantization (CPU).
+
+    On first load the model is exported to ONNX, graph-optimized (level 2: attention,
+    GELU and LayerNorm fusions) and, by default, quantized with optimum, then saved under ~/.cache/rookeen/onnx (or ROOKEEN_CACHE_DIR/onnx) and
+    reused. Embeddings are attention-masked mean pools of the last hidden state, like
+    the sentence-transformers MiniLM pipeline, and are L2-normalized.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        quantize: bool = True,
+        cache_dir: str | Path | None = None,
+        batch_size: int = 64,
+    ) -> None:
+        self.model_name = model_name
+        self.quantize = quantize
+        if cache_dir is None:
+            cache_dir = _default_cache_dir().parent / "onnx"
+        self.cache_dir = Path(cache_dir)
+        self.batch_size = batch_size
+        self._model: Any | None = None
+        self._tokenizer: Any | None = None
+
+    def load(self) -> None:
+        try:
+            from optimum.onnxruntime import (
+                ORTModelForFeatureExtraction,
+                ORTOptimizer,
+                ORTQuantizer,
+            )
+            from optimum.onnxruntime.configuration import (
+                AutoQuantizationConfig,
+                OptimizationConfig,
+            )
+            from transformers import AutoTokenizer
+        except Exception as exc:  # pragma: no cover - import-time failure path
+            raise RuntimeError(
+                "optimum[onnxruntime] not installed; install rookeen[onnx]"
+            ) from exc
+        suffix = "int8" if self.quantize else "fp32"
+        save_dir = self.cache_dir / f"{self.model_name.replace('/', '--')}-{suffix}"
+        file_name = "model_optimized_quantized.onnx" if self.quantize else "model_optimized.onnx"
+        if not (save_dir / file_name).exists():
+            model = ORTModelForFeatureExtraction.from_pretrained(
+                self.model_name, export=True, provider="CPUExecutionProvider"
+            )
+            model.save_pretrained(save_dir)
+            # Fuse before quantizing so the quantizer sees the fused MatMul/Attention ops
+            optimizer = ORTOptimizer.from_pretrained(model)
+            optimizer.optimize(
+                save_dir=save_dir,
+                optimization_config=OptimizationConfig(optimization_level=2),
+            )
+            if self.quantize:
+                quantizer = ORTQuantizer.from_pretrained(save_dir, file_name="model_optimized.onnx")
+                qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+                quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+            AutoTokenizer.from_pretrained(self.model_name).save_pretrained(save_dir)
+        self._model = ORTModelForFeatureExtraction.from_pretrained(
+            save_dir, file_name=file_name, provider="CPUExecutionProvider"
+        )
+        self._tokenizer = AutoTokenizer.from_pretrained(save_dir)
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        if self._model is None:
+            self.load()
+        assert self._model is not None and self._tokenizer is not None
+        results: list[list[float]] = []
+        for i in range(0, len(texts), self.batch_size):
+            inputs = self._tokenizer(
+                texts[i : i + self.batch_size],
+                padding=True,
+                truncation=True,
+                return_tensors="np",
+            )
+            hidden = np.asarray(self._model(**inputs).last_hidden_state, dtype=np.float32)
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            results.extend((pooled / norms).tolist())
+        return results
+
+    def provenance(self) -> dict[str, Any]:
+        return {
+            "backend": "miniLM-onnx",
+            "model": self.model_name,
+            "dim": 384,
+            "normalized": True,
+            "quantized": self.quantize,
+        }
@@ -1,60 +1,128 @@
 from __future__ import annotations
 
+import os
 import time
-from collections import Counter
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from rookeen.models import AnalysisType, LinguisticAnalysisResult
 
 from .base import BaseAnalyzer, register_analyzer
+from .context import AnalysisContext
 
 try:
     import yake
 except Exception:  # pragma: no cover
     yake = None
 
-try:
+if TYPE_CHECKING:
     from spacy.tokens import Doc
-except Exception:  # pragma: no cover
-    Doc = object
+
+
+# YAKE extractors load stopword lists on construction; reuse one per configuration
+_YAKE_CACHE: dict[tuple[str, int, int], yake.KeywordExtractor] = {}
+
+
+def _get_yake_extractor(lang: str, n: int = 1, top: int = 20) -> yake.KeywordExtractor:
+    key = (lang, n, top)
+    extractor = _YAKE_CACHE.get(key)
+    if extractor is None:
+        extractor = _YAKE_CACHE[key] = yake.KeywordExtractor(lan=lang, n=n, top=top)
+    return extractor
+
+
+def _rake_keywords(
+    ctx: AnalysisContext, top: int = 20, max_words: int = 3
+) -> list[tuple[str, float]]:
+    """RAKE keyphrases over the Doc's token arrays.
+
+    Candidate phrases are maximal runs of alpha, non-stop tokens (stopwords, punctuation
+    and numbers act as delimiters); runs longer than `max_words` are skipped. Each word
+    scores degree/frequency over the candidates and a phrase scores the sum of its words.
+    """
+    mask = ctx.alpha_nonstop_mask
+    if not mask.any():
+        return []
+    # Run boundaries of consecutive masked tokens
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    lengths = np.flatnonzero(edges == -1) - starts
+    # Masked tokens are exactly the runs in order; give each its run length
+    token_lengths = np.repeat(lengths, lengths)
+
+    # Dense ids of lowercased lemmas (different lemma ids can lower to the same word)
+    keys, inverse = np.unique(ctx.lemma_keys, return_inverse=True)
+    words = [ctx.strings[int(k)].lower() for k in keys.tolist()]
+    word_index: dict[str, int] = {}
+    lowered = np.array([word_index.setdefault(w, len(word_index)) for w in words])
+    word_ids = lowered[inverse]
+
+    keep = np.repeat(lengths <= max_words, lengths)
+    freq = np.bincount(word_ids[keep], minlength=len(word_index))
+    degree = np.bincount(word_ids[keep], weights=token_lengths[keep], minlength=len(word_index))
+    word_scores = np.divide(degree, freq, out=np.zeros(len(word_index)), where=freq > 0)
+
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    phrase_scores = np.add.reduceat(word_scores[word_ids], offsets)
+    vocab = list(word_index)
+    best: dict[str, float] = {}
+    for offset, length, score in zip(
+        offsets.tolist(), lengths.tolist(), phrase_scores.tolist(), strict=True
+    ):
+        if length > max_words:
+            continue
+        phrase = " ".join(vocab[w] for w in word_ids[offset : offset + length].tolist())
+        if score > best.get(phrase, -1.0):
+            best[phrase] = score
+    return sorted(best.items(), key=lambda kv: (-kv[1], kv[0]))[:top]
 
 
 @register_analyzer
 class KeywordAnalyzer(BaseAnalyzer):
     name = "keywords"
     analysis_type = AnalysisType.KEYWORDS
+    spacy_components = frozenset({"lemmatizer"})
 
-    def __init__(self, use_yake: bool | None = None) -> None:
+    def __init__(self, use_yake: bool | None = None, method: str | None = None) -> None:
         # If None, auto-enable if yake is importable
         self.use_yake = (yake is not None) if use_yake is None else use_yake
+        # Optional method override: "yake", "rake" or "frequency"
+        if method is None:
+            method = os.getenv("ROOKEEN_KEYWORDS_METHOD", "")
+        self.method = method.strip().lower()
 
-    async def analyze(self, doc: Doc, lang: str) -> LinguisticAnalysisResult:
+    def analyze(
+        self, doc: Doc, lang: str, ctx: AnalysisContext | None = None
+    ) -> LinguisticAnalysisResult:
         start_ts = time.perf_counter()
 
         results: dict[str, object]
         # method_note = ""
-        if self.use_yake and yake is not None:
+        if self.method == "rake":
+            # RAKE over token arrays: no regex passes over the raw text
+            results = {
+                "method": "rake",
+                "keywords": _rake_keywords(ctx or AnalysisContext.for_doc(doc)),
+            }
+        elif self.method != "frequency" and self.use_yake and yake is not None:
             # YAKE-based keyword extraction if available
             text = doc.text or ""
-            kw_extractor = yake.KeywordExtractor(lan=lang if len(lang) == 2 else "en", n=1, top=20)
+            kw_extractor = _get_yake_extractor(lang if len(lang) == 2 else "en")
             keywords: list[tuple[str, float]] = kw_extractor.extract_keywords(text)
             # YAKE returns lower score for more important keywords; invert to score=1/r
-            normalized: list[tuple[str, float]] = []
-            for phrase, score in keywords:
-                inv = 0.0
-                try:
-                    inv = 1.0 / float(score) if float(score) > 0 else 0.0
-                except Exception:  # pragma: no cover
-                    inv = 0.0
-                normalized.append((phrase, inv))
+            normalized: list[tuple[str, float]] = [
+                (phrase, 1.0 / float(score) if score > 0 else 0.0) for phrase, score in keywords
+            ]
             results = {
                 "method": "yake",
                 "keywords": normalized,
             }
         else:
             # Frequency-based TF over lemma-lower of alpha, non-stop tokens
-            alpha_nonstop = [t for t in doc if t.is_alpha and not t.is_stop]
-            total_alpha = len(alpha_nonstop)
-            lemma_counts = Counter((t.lemma_ or t.text).lower() for t in alpha_nonstop)
+            ctx = ctx or AnalysisContext.for_doc(doc)
+            total_alpha = int(ctx.alpha_nonstop_mask.sum())
+            lemma_counts = ctx.lemma_counts
             scored: list[tuple[str, float]] = []
             for lemma, count in lemma_counts.items():
                 score = (count / total_alpha) if total_alpha else 0.0
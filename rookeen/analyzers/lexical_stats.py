@@ -1,51 +1,51 @@
 from __future__ import annotations
 
+import heapq
 import time
-from collections import Counter
-from statistics import mean
+from typing import TYPE_CHECKING
 
 from rookeen.models import AnalysisType, LinguisticAnalysisResult
 
 from .base import BaseAnalyzer, register_analyzer
+from .context import AnalysisContext
 
-try:
+if TYPE_CHECKING:
     from spacy.tokens import Doc
-except Exception:  # pragma: no cover
-    Doc = object
 
 
 @register_analyzer
 class LexicalStatsAnalyzer(BaseAnalyzer):
     name = "lexical_stats"
     analysis_type = AnalysisType.LEXICAL_STATS
+    spacy_components = frozenset({"lemmatizer", "parser"})
+    stateless = True
 
-    async def analyze(self, doc: Doc, lang: str) -> LinguisticAnalysisResult:
+    def analyze(
+        self, doc: Doc, lang: str, ctx: AnalysisContext | None = None
+    ) -> LinguisticAnalysisResult:
         start_ts = time.perf_counter()
 
-        alpha_tokens = [t for t in doc if t.is_alpha and not t.is_stop]
-        total_tokens = len(alpha_tokens)
+        ctx = ctx or AnalysisContext.for_doc(doc)
+        mask = ctx.alpha_nonstop_mask
+        total_tokens = int(mask.sum())
+        total_len = int(ctx.arr[mask, ctx.LENGTH].sum())
+        lemma_counts = ctx.lemma_counts
+        if doc.has_annotation("SENT_START"):
+            sentences = ctx.sentence_count
+        else:
+            # Unset boundaries: let doc.sents raise its usual error
+            sentences = sum(1 for _ in doc.sents)
+        # Sentences partition the doc, so per-sentence alpha counts sum to the doc total
+        sent_alpha_total = int(ctx.alpha_mask.sum())
 
-        lemmas: list[str] = []
-        token_lengths: list[int] = []
-        for t in alpha_tokens:
-            lemma = (t.lemma_ or t.text).lower()
-            lemmas.append(lemma)
-            token_lengths.append(len(t.text))
-
-        unique_lemmas = len(set(lemmas))
-        sentences = sum(1 for _ in doc.sents) if hasattr(doc, "sents") else 0
-        avg_token_length = float(mean(token_lengths)) if token_lengths else 0.0
-
-        sent_lengths: list[int] = []
-        if hasattr(doc, "sents"):
-            for s in doc.sents:
-                sent_lengths.append(sum(1 for t in s if t.is_alpha))
-        avg_sentence_length_tokens = float(mean(sent_lengths)) if sent_lengths else 0.0
+        unique_lemmas = len(lemma_counts)
+        avg_token_length = (total_len / total_tokens) if total_tokens else 0.0
+        avg_sentence_length_tokens = (sent_alpha_total / sentences) if sentences else 0.0
 
         type_token_ratio = (unique_lemmas / total_tokens) if total_tokens else 0.0
 
-        lemma_counts: dict[str, int] = Counter(lemmas)
-        top_lemmas = sorted(lemma_counts.items(), key=lambda kv: (-kv[1], kv[0]))[:20]
+        # Partial selection: O(V log 20) instead of sorting the whole vocabulary
+        top_lemmas = heapq.nsmallest(20, lemma_counts.items(), key=lambda kv: (-kv[1], kv[0]))
 
         results = {
             "total_tokens": total_tokens,
@@ -1,30 +1,35 @@
 from __future__ import annotations
 
 import time
-from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from rookeen.models import AnalysisType, LinguisticAnalysisResult
 
 from .base import BaseAnalyzer, register_analyzer
+from .context import AnalysisContext
+from .token_arrays import ordered_counts
 
-try:
+if TYPE_CHECKING:
     from spacy.language import Language
     from spacy.tokens import Doc
-except Exception:  # pragma: no cover
-    Doc = object
-    Language = object
+
 
 
 @register_analyzer
 class NERAnalyzer(BaseAnalyzer):
     name = "ner"
     analysis_type = AnalysisType.NER
+    spacy_components = frozenset({"ner"})
 
     def __init__(self, nlp: Language | None = None) -> None:
         # Optional injection of nlp to introspect pipes if caller provides it
         self._nlp = nlp
 
-    async def analyze(self, doc: Doc, lang: str) -> LinguisticAnalysisResult:
+    def analyze(
+        self, doc: Doc, lang: str, ctx: AnalysisContext | None = None
+    ) -> LinguisticAnalysisResult:
         start_ts = time.perf_counter()
 
         # nlp = getattr(doc, "vocab", None)
@@ -40,8 +45,13 @@ class NERAnalyzer(BaseAnalyzer):
             except Exception:  # pragma: no cover
                 has_ner_pipe = False
 
-        ents = list(getattr(doc, "ents", []) or [])
-        if (not ents) and not has_ner_pipe:
+        # Entities start at B tokens with a label and run until the next non-I token,
+        # mirroring how spaCy builds doc.ents from the IOB columns
+        ctx = ctx or AnalysisContext.for_doc(doc)
+        iob = ctx.arr[:, ctx.ENT_IOB]
+        ent_type = ctx.arr[:, ctx.ENT_TYPE]
+        starts = np.flatnonzero((iob == 3) & (ent_type != 0))
+        if starts.size == 0 and not has_ner_pipe:
             processing_time = time.perf_counter() - start_ts
             return LinguisticAnalysisResult(
                 analysis_type=self.analysis_type,
@@ -56,17 +66,27 @@ class NERAnalyzer(BaseAnalyzer):
                 confidence=1.0,
             )
 
-        counts_by_label: dict[str, int] = Counter(ent.label_ for ent in ents)
-        examples_by_label: dict[str, list[str]] = defaultdict(list)
-        for ent in ents:
-            if len(examples_by_label[ent.label_]) < 10:
-                examples_by_label[ent.label_].append(ent.text)
-        total_entities = sum(counts_by_label.values())
+        boundaries = np.flatnonzero(iob != 1)
+        ends_at = np.searchsorted(boundaries, starts, side="right")
+        ends = np.append(boundaries, len(iob))[ends_at]
+        labels = ent_type[starts]
+
+        counts_by_label: dict[str, int] = {}
+        examples_by_label: dict[str, list[str]] = {}
+        label_ids, label_counts = ordered_counts(labels)
+        for label_id, count in zip(label_ids.tolist(), label_counts.tolist(), strict=True):
+            label = ctx.strings[label_id]
+            counts_by_label[label] = count
+            # Only the first ten entities per label are materialized as text
+            first = np.flatnonzero(labels == label_id)[:10]
+            spans = zip(starts[first].tolist(), ends[first].tolist(), strict=True)
+            examples_by_label[label] = [doc[s:e].text for s, e in spans]
+        total_entities = int(starts.size)
 
         results = {
             "supported": True,
-            "counts_by_label": dict(counts_by_label),
-            "examples_by_label": dict(examples_by_label),
+            "counts_by_label": counts_by_label,
+            "examples_by_label": examples_by_label,
             "total_entities": total_entities,
         }
 
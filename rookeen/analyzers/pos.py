@@ -1,27 +1,34 @@
 from __future__ import annotations
 
 import time
-from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
 
 from rookeen.models import AnalysisType, LinguisticAnalysisResult
 
 from .base import BaseAnalyzer, register_analyzer
+from .context import AnalysisContext
+from .token_arrays import lower_counts, ordered_counts, string_counts
 
-try:
+if TYPE_CHECKING:
     from spacy.tokens import Doc
-except Exception:  # pragma: no cover
-    Doc = object
 
 
 @register_analyzer
 class POSAnalyzer(BaseAnalyzer):
     name = "pos"
     analysis_type = AnalysisType.POS
+    spacy_components = frozenset({"attribute_ruler", "lemmatizer", "tagger"})
+    stateless = True
 
-    async def analyze(self, doc: Doc, lang: str) -> LinguisticAnalysisResult:
+    def analyze(
+        self, doc: Doc, lang: str, ctx: AnalysisContext | None = None
+    ) -> LinguisticAnalysisResult:
         start_ts = time.perf_counter()
 
-        upos_counts: dict[str, int] = Counter(t.pos_ for t in doc)
+        ctx = ctx or AnalysisContext.for_doc(doc)
+        strings = ctx.strings
+        pos = ctx.arr[:, ctx.POS]
+        upos_counts = string_counts(strings, pos)
 
         # Ratios relative to all tokens (avoid divide-by-zero)
         total_tokens = sum(upos_counts.values())
@@ -32,21 +39,18 @@ class POSAnalyzer(BaseAnalyzer):
         else:
             upos_ratios = {tag: 0.0 for tag in upos_counts}
 
-        # Top lemmas by UPOS
+        # Top lemmas by UPOS over alpha, non-stop tokens; untagged tokens count as "X"
         top_lemmas_by_upos: dict[str, list[tuple[str, int]]] = {}
-        buckets: dict[str, list[str]] = defaultdict(list)
-        for t in doc:
-            if t.is_alpha and not t.is_stop:
-                key = t.pos_ or "X"
-                lemma = (t.lemma_ or t.text).lower()
-                buckets[key].append(lemma)
-
-        for tag, lemmas in buckets.items():
-            counts = Counter(lemmas)
-            top_lemmas_by_upos[tag] = counts.most_common(5)
+        tags = pos[ctx.alpha_nonstop_mask]
+        tags[tags == 0] = strings["X"]
+        keys = ctx.lemma_keys
+        lowered: dict[int, str] = {}
+        for tag_id in ordered_counts(tags)[0].tolist():
+            counts = lower_counts(strings, keys[tags == tag_id], lowered)
+            top_lemmas_by_upos[strings[tag_id]] = counts.most_common(5)
 
         results = {
-            "upos_counts": dict(upos_counts),
+            "upos_counts": upos_counts,
             "upos_ratios": upos_ratios,
             "top_lemmas_by_upos": top_lemmas_by_upos,
         }
@@ -1,40 +1,181 @@
 from __future__ import annotations
 
+import math
 import time
+from collections import Counter
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from rookeen.models import AnalysisType, LinguisticAnalysisResult
 
 from .base import BaseAnalyzer, register_analyzer
 
-try:
+if TYPE_CHECKING:
     from spacy.tokens import Doc
-except Exception:  # pragma: no cover
-    Doc = object
+
+    from .context import AnalysisContext
+
+# textstat's default language; the analyzer never calls `textstat.set_lang`
+_TEXTSTAT_LANG = "en_US"
+
+
+@lru_cache(maxsize=64)
+def _compute_readability_base(text: str) -> dict[str, int]:
+    """Count the primitives every textstat formula is built from, in one pass over the words.
+
+    Mirrors textstat 0.7.10's own counting (same word list, sentence splitter,
+    CMUdict/Pyphen syllables and easy-word list), but syllabifies each distinct word
+    once instead of re-tokenizing the text inside every metric. The returned dict is
+    shared between callers and must not be mutated.
+    """
+    from textstat.backend import counts, selections, utils
+
+    lang = _TEXTSTAT_LANG
+    cmu = utils.get_cmudict(lang)
+    pyphen = utils.get_pyphen(lang)
+    easy = utils.get_lang_easy_words(lang)
+    fog_threshold = int(utils.get_lang_cfg(lang, "syllable_threshold"))
+
+    syllables: dict[str, int] = {}
+    n_syll = n_polysyll = n_hard = n_fog = 0
+    difficult: set[str] = set()
+    words = selections.list_words(text)
+    for word in words:
+        lower = word.lower()
+        n = syllables.get(lower)
+        if n is None:
+            try:
+                n = sum(1 for p in cmu[lower][0] if p[-1].isdigit())
+            except (TypeError, IndexError, KeyError):
+                n = len(pyphen.positions(lower)) + 1
+            syllables[lower] = n
+        n_syll += n
+        if n >= 3:
+            n_polysyll += 1
+        if lower in easy:
+            continue
+        n_hard += 1
+        if n >= 2:
+            difficult.add(word)
+        if n >= fog_threshold:
+            n_fog += 1
+
+    return {
+        "n_chars": counts.count_chars(text, True),
+        "n_letters": counts.count_letters(text),
+        "n_tokens": counts.count_words(text, rm_punctuation=False),
+        "n_words": len(words),
+        "n_sents": counts.count_sentences(text),
+        "n_syll": n_syll,
+        "n_polysyll": n_polysyll,
+        "n_diff": len(difficult),
+        "n_hard": n_hard,
+        "n_fog": n_fog,
+    }
+
+
+def _ratio(a: float, b: float) -> float:
+    return a / b if b else 0.0
+
+
+def _readability_scores(text: str) -> dict[str, float | int | str]:
+    """Derive the reported metrics from `_compute_readability_base` with textstat's formulas."""
+    from textstat.backend import metrics, utils
+
+    base = _compute_readability_base(text)
+    words = base["n_words"]
+    sents = base["n_sents"]
+    wps = _ratio(words, sents)
+    spw = _ratio(base["n_syll"], words)
+
+    if wps == 0 or spw == 0:
+        fre = fk = 0.0
+    else:
+        lang_root = utils.get_lang_root(_TEXTSTAT_LANG)
+        fre = (
+            utils.get_lang_cfg(lang_root, "fre_base")
+            - utils.get_lang_cfg(lang_root, "fre_sentence_length") * wps
+            - utils.get_lang_cfg(lang_root, "fre_syll_per_word") * spw
+        )
+        fk = (0.39 * wps) + (11.8 * spw) - 15.59
+
+    smog = (1.043 * (30 * (base["n_polysyll"] / sents)) ** 0.5) + 3.1291 if sents else 0.0
+
+    cpw = _ratio(base["n_chars"], base["n_tokens"])
+    ari = 0.0 if cpw == 0 or wps == 0 else (4.71 * cpw) + (0.5 * wps) - 21.43
+
+    letters = _ratio(base["n_letters"], words) * 100
+    sentences = _ratio(sents, words) * 100
+    cli = 0.0 if letters == 0 or sentences == 0 else (0.058 * letters) - (0.296 * sentences) - 15.8
+
+    if words:
+        per_hard = 100 * base["n_hard"] / words
+        dale_chall = (0.1579 * per_hard) + (0.0496 * wps) + (3.6365 if per_hard > 5 else 0.0)
+        fog = 0.4 * (wps + 100 * base["n_fog"] / words)
+    else:
+        dale_chall = fog = 0.0
+
+    linsear = metrics.linsear_write_formula(
+        text, _TEXTSTAT_LANG, strict_lower=False, strict_upper=True
+    )
+
+    # Readability consensus, as in textstat's `text_standard`
+    grade = [math.floor(fk), math.ceil(fk), round(fk)]
+    if 90 <= fre < 100:
+        grade.append(5)
+    elif 80 <= fre < 90:
+        grade.append(6)
+    elif 70 <= fre < 80:
+        grade.append(7)
+    elif 60 <= fre < 70:
+        grade.extend([8, 9])
+    elif 50 <= fre < 60:
+        grade.append(10)
+    elif 40 <= fre < 50:
+        grade.append(11)
+    elif 30 <= fre < 40:
+        grade.append(12)
+    else:
+        grade.append(13)
+    for score in (smog, cli, ari, dale_chall, linsear, fog):
+        grade.extend([math.floor(score), math.ceil(score), round(score)])
+    lower = Counter(grade).most_common(1)[0][0] - 1
+    standard = (
+        f"{lower}{utils.get_grade_suffix(lower)} and "
+        f"{lower + 1}{utils.get_grade_suffix(lower + 1)} grade"
+    )
+
+    return {
+        "flesch_reading_ease": float(fre),
+        "flesch_kincaid_grade": float(fk),
+        "smog_index": float(smog),
+        "automated_readability_index": float(ari),
+        "coleman_liau_index": float(cli),
+        "linsear_write_formula": float(linsear),
+        "dale_chall_readability_score": float(dale_chall),
+        "difficult_words": int(base["n_diff"]),
+        "text_standard": standard,
+    }
 
 
 @register_analyzer
 class ReadabilityAnalyzer(BaseAnalyzer):
     name = "readability"
     analysis_type = AnalysisType.READABILITY
+    spacy_components = frozenset()
+    stateless = True
 
-    async def analyze(self, doc: Doc, lang: str) -> LinguisticAnalysisResult:
+    def analyze(
+        self, doc: Doc, lang: str, ctx: AnalysisContext | None = None
+    ) -> LinguisticAnalysisResult:
         start_ts = time.perf_counter()
-        from textstat import textstat
 
         text = doc.text or ""
         # Compute language-agnostic metrics but caveat they are tuned for English
         results: dict[str, float | int | str | bool] = {
             "supported": True,
             "note": "Readability metrics are calibrated for English; interpret non-English results with caution.",
-            "flesch_reading_ease": float(textstat.flesch_reading_ease(text)),
-            "flesch_kincaid_grade": float(textstat.flesch_kincaid_grade(text)),
-            "smog_index": float(textstat.smog_index(text)),
-            "automated_readability_index": float(textstat.automated_readability_index(text)),
-            "coleman_liau_index": float(textstat.coleman_liau_index(text)),
-            "linsear_write_formula": float(textstat.linsear_write_formula(text)),
-            "dale_chall_readability_score": float(textstat.dale_chall_readability_score(text)),
-            "difficult_words": int(textstat.difficult_words(text)),
-            "text_standard": str(textstat.text_standard(text, float_output=False)),
+            **_readability_scores(text),
         }
 
         processing_time = time.perf_counter() - start_ts
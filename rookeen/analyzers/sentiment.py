@@ -1,42 +1,67 @@
 from __future__ import annotations
 
+import threading
 import time
-from typing import Any
+from collections.abc import Callable, Sequence
+from functools import cache, lru_cache, partial
+from typing import TYPE_CHECKING, Any
 
 from rookeen.analyzers.base import BaseAnalyzer, register_analyzer
+from rookeen.models import AnalysisType, LinguisticAnalysisResult
 
-try:  # Import for type checking only to avoid hard dependency at import time
+if TYPE_CHECKING:
     from spacy.tokens import Doc
-except Exception:  # pragma: no cover
-    Doc = object
-from rookeen.models import AnalysisType, LinguisticAnalysisResult
+
+    from rookeen.analyzers.context import AnalysisContext
+
+# Scores one text into the analyzer's `results` dict
+_Scorer = Callable[[str], dict[str, Any]]
 
 # Try multiple sentiment libraries in order of preference
-_sentiment_analyzer: tuple[str, Any] | None = None
+_sentiment_analyzer: tuple[str, _Scorer] | None = None
+_sentiment_resolved = False
+_sentiment_lock = threading.Lock()
 
+# Texts up to this length have their scores memoized; repeated boilerplate (navigation,
+# footers) is common across scraped pages, while long texts rarely repeat exactly
+_MEMO_MAX_CHARS = 4096
 
-def _get_sentiment_analyzer() -> tuple[str, Any] | None:
-    """Get the best available sentiment analyzer."""
-    global _sentiment_analyzer
 
-    if _sentiment_analyzer is not None:
+def _get_sentiment_analyzer() -> tuple[str, _Scorer] | None:
+    """Get the best available sentiment analyzer as `(method, scorer)`.
+
+    The scorer is bound to its library when resolved, so scoring a document is a single
+    call with no per-document dispatch on the method name. The probe runs once per
+    process, under a lock so concurrent first calls from worker threads do not load a
+    library twice; a negative result is cached too.
+    """
+    global _sentiment_analyzer, _sentiment_resolved
+
+    if _sentiment_resolved:
         return _sentiment_analyzer
+    with _sentiment_lock:
+        if not _sentiment_resolved:
+            _sentiment_analyzer = _resolve_sentiment_analyzer()
+            _sentiment_resolved = True
+    return _sentiment_analyzer
+
 
+def _resolve_sentiment_analyzer() -> tuple[str, _Scorer] | None:
     # Try VADER first (fastest, no dependencies)
     try:
         from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
-        _sentiment_analyzer = ("vader", SentimentIntensityAnalyzer())
-        return _sentiment_analyzer
+        return ("vader", partial(_score_vader, SentimentIntensityAnalyzer()))
     except ImportError:
         pass
 
     # Try TextBlob (good balance of speed and accuracy)
     try:
-        from textblob import TextBlob
+        # The pattern lexicon scorer behind TextBlob(...).sentiment, without building a
+        # TextBlob and a fresh namedtuple class for every document
+        from textblob.en import sentiment as pattern_sentiment
 
-        _sentiment_analyzer = ("textblob", TextBlob)
-        return _sentiment_analyzer
+        return ("textblob", partial(_score_textblob, pattern_sentiment))
     except ImportError:
         pass
 
@@ -46,89 +71,172 @@ def _get_sentiment_analyzer() -> tuple[str, Any] | None:
 
         nlp = spacy.load("en_core_web_sm")
         if hasattr(nlp, "sentiment") or any(hasattr(comp, "sentiment") for comp in nlp.pipeline):
-            _sentiment_analyzer = ("spacy", nlp)
-            return _sentiment_analyzer
+            return ("spacy", partial(_score_unsupported, "spacy"))
     except (ImportError, OSError):
         pass
 
     return None
 
 
+@cache
+def _vader_emoji_chars(sia: Any) -> frozenset[str]:
+    return frozenset(sia.emojis)
+
+
+class _VaderWindow:
+    """The slice of a `SentiText` that `sentiment_valence` reads around one token."""
+
+    __slots__ = ("is_cap_diff", "words_and_emoticons")
+
+    def __init__(self, is_cap_diff: bool) -> None:
+        self.is_cap_diff = is_cap_diff
+        self.words_and_emoticons: list[str] = []
+
+
+def _vader_polarity_scores(sia: Any, text: str) -> dict[str, float]:
+    """Return exactly what `sia.polarity_scores(text)` would, with less interpreter work.
+
+    `polarity_scores` first rewrites emoji one character at a time; for text without
+    emoji that rewrite is just `strip()`, so the tokenized `SentiText` is built directly
+    and the rest of VADER's pass runs on it. VADER gives every token without a lexicon
+    entry a valence of 0, and boosters, negations and "but" only rescale lexicon hits,
+    so a text with no token in the lexicon is returned as fully neutral right away.
+    """
+    from vaderSentiment.vaderSentiment import BOOSTER_DICT, SentiText
+
+    if not _vader_emoji_chars(sia).isdisjoint(text):
+        emoji_scores: dict[str, float] = sia.polarity_scores(text)
+        return emoji_scores
+
+    sentitext = SentiText(text.strip())
+    words = sentitext.words_and_emoticons
+    lowered = [w.lower() for w in words]
+    if sia.lexicon.keys().isdisjoint(lowered):
+        neu = 1.0 if words else 0.0
+        return {"neg": 0.0, "neu": neu, "pos": 0.0, "compound": 0.0}
+
+    # Tokens outside the lexicon score 0 in `sentiment_valence` too, so only lexicon hits
+    # call into VADER. Its negation and idiom checks lowercase the whole token list on
+    # every hit but only read tokens i-3..i+2, so each hit gets that window instead.
+    lexicon = sia.lexicon
+    window = _VaderWindow(sentitext.is_cap_diff)
+    sentiments: list[float] = []
+    last = len(words) - 1
+    for i, item in enumerate(words):
+        low = lowered[i]
+        if (
+            low not in lexicon
+            or low in BOOSTER_DICT
+            or (low == "kind" and i < last and lowered[i + 1] == "of")
+        ):
+            sentiments.append(0)
+            continue
+        lo = max(0, i - 3)
+        window.words_and_emoticons = words[lo : i + 3]
+        sentiments = sia.sentiment_valence(0, window, item, i - lo, sentiments)
+    sentiments = sia._but_check(words, sentiments)
+    scores: dict[str, float] = sia.score_valence(sentiments, sentitext.text)
+    return scores
+
+
+def _score_vader(sia: Any, text: str) -> dict[str, Any]:
+    scores = _vader_polarity_scores(sia, text)
+    # Convert VADER compound score to sentiment label
+    compound = scores["compound"]
+    if compound >= 0.05:
+        label = "positive"
+    elif compound <= -0.05:
+        label = "negative"
+    else:
+        label = "neutral"
+
+    return {
+        "supported": True,
+        "label": label,
+        "score": abs(compound),
+        "method": "vader",
+        "scores": scores,
+    }
+
+
+def _score_textblob(pattern_sentiment: Any, text: str) -> dict[str, Any]:
+    polarity, subjectivity = pattern_sentiment(text)
+
+    if polarity > 0.1:
+        label = "positive"
+    elif polarity < -0.1:
+        label = "negative"
+    else:
+        label = "neutral"
+
+    return {
+        "supported": True,
+        "label": label,
+        "score": abs(polarity),
+        "polarity": polarity,
+        "subjectivity": subjectivity,
+        "method": "textblob",
+    }
+
+
+def _score_unsupported(method: str, text: str) -> dict[str, Any]:
+    return {"supported": False, "note": f"Unsupported analyzer: {method}"}
+
+
+@lru_cache(maxsize=16384)
+def _score_memoized(scorer: _Scorer, text: str) -> dict[str, Any]:
+    """`scorer(text)`, cached per scorer so a different backend never sees stale scores.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return scorer(text)
+
+
 @register_analyzer
 class SentimentAnalyzer(BaseAnalyzer):
     """Production-ready sentiment analyzer using best available library."""
 
     name = "sentiment"
     analysis_type = AnalysisType.SENTIMENT
+    spacy_components = frozenset()
+    stateless = True
 
-    async def analyze(self, doc: Doc, lang: str) -> LinguisticAnalysisResult:
+    def analyze(
+        self, doc: Doc, lang: str, ctx: AnalysisContext | None = None
+    ) -> LinguisticAnalysisResult:
         """Analyze sentiment using the best available method."""
-        start = time.perf_counter()
-        text = doc.text
+        return self.analyze_batch([doc], lang)[0]
 
+    def analyze_batch(
+        self, docs: Sequence[Doc], lang: str
+    ) -> list[LinguisticAnalysisResult]:
+        """Analyze sentiment for many documents with a single analyzer lookup."""
         analyzer = _get_sentiment_analyzer()
+        return [self._analyze_text(doc.text, analyzer) for doc in docs]
+
+    def _analyze_text(
+        self, text: str, analyzer: tuple[str, _Scorer] | None
+    ) -> LinguisticAnalysisResult:
+        start_ns = time.perf_counter_ns()
         if not analyzer:
             return LinguisticAnalysisResult(
                 analysis_type=self.analysis_type,
                 name=self.name,
                 results={"supported": False, "note": "No sentiment analysis library available"},
-                processing_time=time.perf_counter() - start,
+                processing_time=(time.perf_counter_ns() - start_ns) / 1e9,
                 confidence=0.0,
             )
 
-        analyzer_type, analyzer_instance = analyzer
+        method, scorer = analyzer
 
         try:
-            if analyzer_type == "vader":
-                scores = analyzer_instance.polarity_scores(text)
-                # Convert VADER compound score to sentiment label
-                compound = scores["compound"]
-                if compound >= 0.05:
-                    label = "positive"
-                elif compound <= -0.05:
-                    label = "negative"
-                else:
-                    label = "neutral"
-
-                result = {
-                    "supported": True,
-                    "label": label,
-                    "score": abs(compound),
-                    "method": "vader",
-                    "scores": scores,
-                    "processing_time": time.perf_counter() - start,
-                }
-
-            elif analyzer_type == "textblob":
-                blob = analyzer_instance(text)
-                polarity = blob.sentiment.polarity
-                subjectivity = blob.sentiment.subjectivity
-
-                if polarity > 0.1:
-                    label = "positive"
-                elif polarity < -0.1:
-                    label = "negative"
-                else:
-                    label = "neutral"
-
-                result = {
-                    "supported": True,
-                    "label": label,
-                    "score": abs(polarity),
-                    "polarity": polarity,
-                    "subjectivity": subjectivity,
-                    "method": "textblob",
-                    "processing_time": time.perf_counter() - start,
-                }
-
-            else:
-                result = {"supported": False, "note": f"Unsupported analyzer: {analyzer_type}"}
-
+            memoize = len(text) <= _MEMO_MAX_CHARS
+            result = _score_memoized(scorer, text) if memoize else scorer(text)
         except Exception as e:
             result = {
                 "supported": False,
                 "note": f"Analysis failed: {e!s}",
-                "method": analyzer_type,
+                "method": method,
             }
 
         confidence = result.get("score", 0.0) if result.get("supported") else 0.0
@@ -137,6 +245,6 @@ class SentimentAnalyzer(BaseAnalyzer):
             analysis_type=self.analysis_type,
             name=self.name,
             results=result,
-            processing_time=time.perf_counter() - start,
+            processing_time=(time.perf_counter_ns() - start_ns) / 1e9,
             confidence=confidence,
         )
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from spacy.strings import StringStore
+
+__all__ = [
+    "lemma_ids",
+    "lower_counts",
+    "ordered_counts",
+    "string_counts",
+]
+
+
+def ordered_counts(ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the unique values of `ids` and their counts, in order of first occurrence.
+
+    Keeping first-occurrence order matches what `Counter` over the same tokens would
+    produce, so JSON key order and `most_common` tie-breaking stay unchanged.
+    """
+    if ids.size == 0:
+        return ids, np.zeros(0, dtype=np.int64)
+    uniq, first, counts = np.unique(ids, return_index=True, return_counts=True)
+    order = np.argsort(first, kind="stable")
+    return uniq[order], counts[order]
+
+
+def lemma_ids(lemma: np.ndarray, orth: np.ndarray) -> np.ndarray:
+    """Return LEMMA ids, falling back to ORTH where a token has no lemma (`lemma_ or text`)."""
+    return np.where(lemma != 0, lemma, orth)
+
+
+def string_counts(strings: StringStore, ids: np.ndarray) -> dict[str, int]:
+    """Count string ids from a `Doc.to_array` column and map them back to strings."""
+    uniq, counts = ordered_counts(ids)
+    return {strings[int(i)]: int(c) for i, c in zip(uniq.tolist(), counts.tolist(), strict=True)}
+
+
+def lower_counts(
+    strings: StringStore, ids: np.ndarray, lowered: dict[int, str] | None = None
+) -> Counter[str]:
+    """Count string ids by their lowercased string, in order of first occurrence.
+
+    Pass the same `lowered` dict across calls over one Doc to resolve each id only once.
+    """
+    if lowered is None:
+        lowered = {}
+    uniq, counts = ordered_counts(ids)
+    out: Counter[str] = Counter()
+    for i, c in zip(uniq.tolist(), counts.tolist(), strict=True):
+        key = lowered.get(i)
+        if key is None:
+            key = lowered[i] = strings[i].lower()
+        out[key] += c
+    return out
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import contextlib
+import dataclasses
+import functools
+import io
+import json
+import logging
+import os
 import sys
+import time
+from collections.abc import Callable, Iterator
+from typing import Any, TypeVar, cast
 
 import click
 
-from rookeen.cli_func import (
-    _get_version,
-    analyze_file,
-    analyze_url,
-    batch_analyze,
-)
-from rookeen.config import load_settings
-from rookeen.errors import USAGE, emit_and_exit
+from rookeen.config import AnalyzeOptions, _get_version, load_settings
+from rookeen.errors import GENERIC, USAGE, emit_and_exit
 
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
@@ -41,6 +45,237 @@ def cli(ctx: click.Context, config_path: str | None, errors_json: bool) -> None:
 
 
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Options of analyze, analyze-file and batch, in --help order. Each entry is
+# (param_decls, attrs, commands exposing it); all but --stdin are AnalyzeOptions fields.
+_ALL = frozenset({"analyze", "analyze-file", "batch"})
+_SHARED_OPTIONS: list[tuple[tuple[str, ...], dict[str, Any], frozenset[str]]] = [
+    (
+        ("--format", "format_"),
+        {
+            "type": click.Choice(["json", "md", "html", "all"], case_sensitive=False),
+            "default": None,
+            "help": "Output format(s). JSON is always written.",
+        },
+        _ALL,
+    ),
+    (
+        ("--lang", "lang_override"),
+        {
+            "type": str,
+            "default": None,
+            "help": "Override language detection (e.g., en,de,es,fr).",
+        },
+        _ALL,
+    ),
+    (
+        ("--languages", "preload_languages_csv"),
+        {
+            "type": str,
+            "default": None,
+            "help": "Comma-separated languages to preload models (e.g., en,de,es,fr).",
+        },
+        _ALL,
+    ),
+    (
+        ("--models-auto-download/--no-models-auto-download",),
+        {"default": None, "help": "Attempt to auto-download missing spaCy models."},
+        _ALL,
+    ),
+    (
+        ("--export-spacy-json/--no-export-spacy-json",),
+        {"default": False, "help": "Also write token-level spaCy JSON to <base>.spacy.json"},
+        _ALL,
+    ),
+    (
+        ("--export-docbin/--no-export-docbin",),
+        {"default": False, "help": "Also write DocBin snapshot to <base>.docbin"},
+        _ALL,
+    ),
+    (
+        ("--export-conllu/--no-export-conllu",),
+        {"default": False, "help": "Also write CoNLL-U format to <base>.conllu"},
+        _ALL,
+    ),
+    (
+        ("--conllu-engine",),
+        {
+            "type": click.Choice(["auto", "stanza", "basic"], case_sensitive=False),
+            "default": "auto",
+            "help": "Engine for CoNLL-U export: 'stanza' (UD-valid) or 'basic' (heuristic).",
+        },
+        _ALL,
+    ),
+    (
+        ("--ud-auto-download/--no-ud-auto-download",),
+        {
+            "default": True,
+            "help": "Auto-download Stanza models when using --export-conllu with stanza engine.",
+        },
+        _ALL,
+    ),
+    (
+        ("--allow-non-ud-conllu",),
+        {
+            "is_flag": True,
+            "default": False,
+            "help": "Allow heuristic basic exporter when UD engine is unavailable.",
+        },
+        _ALL,
+    ),
+    (
+        ("--stdin",),
+        {
+            "is_flag": True,
+            "default": False,
+            "help": "Read text from stdin instead of URL.",
+        },
+        frozenset({"analyze"}),
+    ),
+    (
+        ("--stdout",),
+        {
+            "is_flag": True,
+            "default": False,
+            "help": "Stream JSON to stdout (no files) for pipeline composition.",
+        },
+        frozenset({"analyze", "analyze-file"}),
+    ),
+    (
+        ("--export-parquet/--no-export-parquet",),
+        {"default": False, "help": "Also write analyzer summary table to <base>.parquet"},
+        _ALL,
+    ),
+    (
+        ("--rate-limit", "rate_limit"),
+        {
+            "type": float,
+            "default": 0.5,
+            "help": "Rate limit in requests per second (default: 0.5)",
+        },
+        frozenset({"analyze", "batch"}),
+    ),
+    (
+        ("--robots", "robots_policy"),
+        {
+            "type": click.Choice(["respect", "ignore"], case_sensitive=False),
+            "default": "respect",
+            "help": "Robots.txt policy: 'respect' or 'ignore' (default: respect)",
+        },
+        frozenset({"analyze", "batch"}),
+    ),
+    (
+        ("--trace-id", "trace_id"),
+        {"type": str, "default": None, "help": "Attach trace ID to logs."},
+        _ALL,
+    ),
+    (
+        ("--verbose", "verbose"),
+        {"is_flag": True, "default": False, "help": "Verbose logs."},
+        _ALL,
+    ),
+    (
+        ("--enable-embeddings",),
+        {
+            "is_flag": True,
+            "default": False,
+            "help": (
+                "Enable sentence embeddings analysis (requires 'rookeen[embeddings]'). Vectors "
+                "are cached on disk under ~/.cache/rookeen/emb; set ROOKEEN_EMBEDDINGS_CACHE=0 "
+                "to disable."
+            ),
+        },
+        _ALL,
+    ),
+    (
+        ("--enable-sentiment",),
+        {
+            "is_flag": True,
+            "default": False,
+            "help": "Enable sentiment analysis (requires 'rookeen[sentiment]')",
+        },
+        _ALL,
+    ),
+    (
+        ("--embeddings-backend",),
+        {
+            "type": click.Choice(
+                ["miniLM", "miniLM-onnx", "bge-m3", "openai-te3"], case_sensitive=False
+            ),
+            "default": None,
+            "help": "Embeddings backend to use when --enable-embeddings is set.",
+        },
+        _ALL,
+    ),
+    (
+        ("--embeddings-model",),
+        {
+            "type": str,
+            "default": None,
+            "help": "Model identifier for the selected backend (e.g., BAAI/bge-m3, text-embedding-3-small).",
+        },
+        _ALL,
+    ),
+    (
+        ("--openai-api-key",),
+        {
+            "type": str,
+            "default": None,
+            "help": "OpenAI API key for openai-te3 backend (falls back to env).",
+        },
+        _ALL,
+    ),
+    (
+        ("--embeddings-preload/--no-embeddings-preload",),
+        {
+            "is_flag": True,
+            "default": False,
+            "help": "Preload embeddings backend/model at startup to avoid first-call latency.",
+        },
+        _ALL,
+    ),
+    (
+        ("--enable", "enabled_analyzers"),
+        {
+            "multiple": True,
+            "help": "Enable specific analyzers by name (can be used multiple times)",
+        },
+        _ALL,
+    ),
+    (
+        ("--disable", "disabled_analyzers"),
+        {
+            "multiple": True,
+            "help": "Disable specific analyzers by name (can be used multiple times)",
+        },
+        _ALL,
+    ),
+]
+_OPTION_FIELDS = frozenset(f.name for f in dataclasses.fields(AnalyzeOptions))
+
+
+def analyze_options(command: str) -> Callable[[F], F]:
+    """Attach the analysis options of `command` and fold them into `opts`.
+
+    The decorated callback receives a single AnalyzeOptions keyword argument instead of
+    one parameter per option; options outside AnalyzeOptions are passed through.
+    """
+
+    def decorator(f: F) -> F:
+        @functools.wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            fields = {k: kwargs.pop(k) for k in list(kwargs) if k in _OPTION_FIELDS}
+            return f(*args, opts=AnalyzeOptions(**fields), **kwargs)
+
+        for decls, attrs, commands in reversed(_SHARED_OPTIONS):
+            if command in commands:
+                wrapper = click.option(*decls, **attrs)(wrapper)
+        return cast(F, wrapper)
+
+    return decorator
+
+
 @cli.command("analyze", short_help="Analyze web pages or text with 20+ linguistic analyzers (embeddings, sentiment, POS, NER, readability, etc.)")
 @click.argument("url", type=str, nargs=-1)
 @click.option(
@@ -51,175 +286,14 @@ def cli(ctx: click.Context, config_path: str | None, errors_json: bool) -> None:
     default=None,
     help="Base output path (JSON always saved).",
 )
-@click.option(
-    "--format",
-    "format_",
-    type=click.Choice(["json", "md", "html", "all"], case_sensitive=False),
-    default=None,
-    help="Output format(s). JSON is always written.",
-)
-@click.option(
-    "--lang",
-    "lang_override",
-    type=str,
-    default=None,
-    help="Override language detection (e.g., en,de,es,fr).",
-)
-@click.option(
-    "--languages",
-    "preload_languages_csv",
-    type=str,
-    default=None,
-    help="Comma-separated languages to preload models (e.g., en,de,es,fr).",
-)
-@click.option(
-    "--models-auto-download/--no-models-auto-download",
-    default=None,
-    help="Attempt to auto-download missing spaCy models.",
-)
-@click.option(
-    "--export-spacy-json/--no-export-spacy-json",
-    default=False,
-    help="Also write token-level spaCy JSON to <base>.spacy.json",
-)
-@click.option(
-    "--export-docbin/--no-export-docbin",
-    default=False,
-    help="Also write DocBin snapshot to <base>.docbin",
-)
-@click.option(
-    "--export-conllu/--no-export-conllu",
-    default=False,
-    help="Also write CoNLL-U format to <base>.conllu",
-)
-@click.option(
-    "--conllu-engine",
-    type=click.Choice(["auto", "stanza", "basic"], case_sensitive=False),
-    default="auto",
-    help="Engine for CoNLL-U export: 'stanza' (UD-valid) or 'basic' (heuristic).",
-)
-@click.option(
-    "--ud-auto-download/--no-ud-auto-download",
-    default=True,
-    help="Auto-download Stanza models when using --export-conllu with stanza engine.",
-)
-@click.option(
-    "--allow-non-ud-conllu",
-    is_flag=True,
-    default=False,
-    help="Allow heuristic basic exporter when UD engine is unavailable.",
-)
-@click.option(
-    "--stdin",
-    is_flag=True,
-    default=False,
-    help="Read text from stdin instead of URL.",
-)
-@click.option(
-    "--stdout",
-    is_flag=True,
-    default=False,
-    help="Stream JSON to stdout (no files) for pipeline composition.",
-)
-@click.option(
-    "--export-parquet/--no-export-parquet",
-    default=False,
-    help="Also write analyzer summary table to <base>.parquet",
-)
-@click.option(
-    "--rate-limit",
-    "rate_limit",
-    type=float,
-    default=0.5,
-    help="Rate limit in requests per second (default: 0.5)",
-)
-@click.option(
-    "--robots",
-    "robots_policy",
-    type=click.Choice(["respect", "ignore"], case_sensitive=False),
-    default="respect",
-    help="Robots.txt policy: 'respect' or 'ignore' (default: respect)",
-)
-@click.option("--trace-id", "trace_id", type=str, default=None, help="Attach trace ID to logs.")
-@click.option("--verbose", "verbose", is_flag=True, default=False, help="Verbose logs.")
-@click.option(
-    "--enable-embeddings",
-    is_flag=True,
-    default=False,
-    help="Enable sentence embeddings analysis (requires 'rookeen[embeddings]')",
-)
-@click.option(
-    "--enable-sentiment",
-    is_flag=True,
-    default=False,
-    help="Enable sentiment analysis (requires 'rookeen[sentiment]')",
-)
-@click.option(
-    "--embeddings-backend",
-    type=click.Choice(["miniLM", "bge-m3", "openai-te3"], case_sensitive=False),
-    default=None,
-    help="Embeddings backend to use when --enable-embeddings is set.",
-)
-@click.option(
-    "--embeddings-model",
-    type=str,
-    default=None,
-    help="Model identifier for the selected backend (e.g., BAAI/bge-m3, text-embedding-3-small).",
-)
-@click.option(
-    "--openai-api-key",
-    type=str,
-    default=None,
-    help="OpenAI API key for openai-te3 backend (falls back to env).",
-)
-@click.option(
-    "--embeddings-preload/--no-embeddings-preload",
-    is_flag=True,
-    default=False,
-    help="Preload embeddings backend/model at startup to avoid first-call latency.",
-)
-@click.option(
-    "--enable",
-    "enabled_analyzers",
-    multiple=True,
-    help="Enable specific analyzers by name (can be used multiple times)",
-)
-@click.option(
-    "--disable",
-    "disabled_analyzers",
-    multiple=True,
-    help="Disable specific analyzers by name (can be used multiple times)",
-)
+@analyze_options("analyze")
 @click.pass_context
 def cmd_analyze(
     ctx: click.Context,
     url: tuple[str, ...],
     output_base: str | None,
-    format_: str | None,
-    lang_override: str | None,
-    preload_languages_csv: str | None,
-    models_auto_download: bool | None,
-    export_spacy_json: bool,
-    export_docbin: bool,
-    export_conllu: bool,
-    conllu_engine: str,
-    ud_auto_download: bool,
-    allow_non_ud_conllu: bool,
     stdin: bool,
-    stdout: bool,
-    trace_id: str | None,
-    verbose: bool,
-    export_parquet: bool,
-    rate_limit: float,
-    robots_policy: str,
-    enable_embeddings: bool,
-    enable_sentiment: bool,
-    embeddings_backend: str | None,
-    embeddings_model: str | None,
-    openai_api_key: str | None,
-    embeddings_preload: bool,
-    enabled_analyzers: tuple[str, ...],
-    disabled_analyzers: tuple[str, ...],
+    opts: AnalyzeOptions,
 ) -> None:
     """Analyze a single URL or text from stdin."""
     settings = ctx.obj.get("settings")
@@ -230,67 +304,15 @@ def cmd_analyze(
     if not stdin and not url:
         raise click.UsageError("Must specify either URL or --stdin")
 
+    # Deferred so `--help`, `--version` and usage errors never load spaCy and the exporters
+    from rookeen.cli_func import analyze_stdin, analyze_url
+
     if stdin:
-        from rookeen.cli_func import analyze_stdin
-
-        analyze_stdin(
-            output_base=output_base,
-            format_=format_,
-            lang_override=lang_override,
-            preload_languages_csv=preload_languages_csv,
-            models_auto_download=models_auto_download,
-            export_spacy_json=export_spacy_json,
-            export_docbin=export_docbin,
-            export_conllu=export_conllu,
-            conllu_engine=conllu_engine,
-            ud_auto_download=ud_auto_download,
-            allow_non_ud_conllu=allow_non_ud_conllu,
-            stdout=stdout,
-            trace_id=trace_id,
-            verbose=verbose,
-            export_parquet=export_parquet,
-            enable_embeddings=enable_embeddings,
-            enable_sentiment=enable_sentiment,
-            embeddings_backend=embeddings_backend,
-            embeddings_model=embeddings_model,
-            openai_api_key=openai_api_key,
-            embeddings_preload=embeddings_preload,
-            enabled_analyzers=list(enabled_analyzers),
-            disabled_analyzers=list(disabled_analyzers),
-            settings=settings,
-        )
+        analyze_stdin(output_base=output_base, opts=opts, settings=settings)
     else:
         # URL mode - take first URL from tuple
         url_str = url[0] if isinstance(url, tuple) else url
-        analyze_url(
-            url=url_str,
-            output_base=output_base,
-            format_=format_,
-            lang_override=lang_override,
-            preload_languages_csv=preload_languages_csv,
-            models_auto_download=models_auto_download,
-            export_spacy_json=export_spacy_json,
-            export_docbin=export_docbin,
-            export_conllu=export_conllu,
-            conllu_engine=conllu_engine,
-            ud_auto_download=ud_auto_download,
-            allow_non_ud_conllu=allow_non_ud_conllu,
-            stdout=stdout,
-            trace_id=trace_id,
-            verbose=verbose,
-            export_parquet=export_parquet,
-            rate_limit=rate_limit,
-            robots_policy=robots_policy,
-            enable_embeddings=enable_embeddings,
-            enable_sentiment=enable_sentiment,
-            embeddings_backend=embeddings_backend,
-            embeddings_model=embeddings_model,
-            openai_api_key=openai_api_key,
-            embeddings_preload=embeddings_preload,
-            enabled_analyzers=list(enabled_analyzers),
-            disabled_analyzers=list(disabled_analyzers),
-            settings=settings,
-        )
+        analyze_url(url=url_str, output_base=output_base, opts=opts, settings=settings)
 
 
 @cli.command("analyze-file", short_help="Analyze local text files with 20+ linguistic analyzers (embeddings, sentiment, POS, NER, readability, etc.)")
@@ -303,182 +325,19 @@ def cmd_analyze(
     default=None,
     help="Base output path (JSON always saved).",
 )
-@click.option(
-    "--format",
-    "format_",
-    type=click.Choice(["json", "md", "html", "all"], case_sensitive=False),
-    default=None,
-    help="Output format(s). JSON is always written.",
-)
-@click.option(
-    "--lang",
-    "lang_override",
-    type=str,
-    default=None,
-    help="Override language detection (e.g., en,de,es,fr).",
-)
-@click.option(
-    "--languages",
-    "preload_languages_csv",
-    type=str,
-    default=None,
-    help="Comma-separated languages to preload models (e.g., en,de,es,fr).",
-)
-@click.option(
-    "--models-auto-download/--no-models-auto-download",
-    default=None,
-    help="Attempt to auto-download missing spaCy models.",
-)
-@click.option(
-    "--export-spacy-json/--no-export-spacy-json",
-    default=False,
-    help="Also write token-level spaCy JSON to <base>.spacy.json",
-)
-@click.option(
-    "--export-docbin/--no-export-docbin",
-    default=False,
-    help="Also write DocBin snapshot to <base>.docbin",
-)
-@click.option(
-    "--export-conllu/--no-export-conllu",
-    default=False,
-    help="Also write CoNLL-U format to <base>.conllu",
-)
-@click.option(
-    "--conllu-engine",
-    type=click.Choice(["auto", "stanza", "basic"], case_sensitive=False),
-    default="auto",
-    help="Engine for CoNLL-U export: 'stanza' (UD-valid) or 'basic' (heuristic).",
-)
-@click.option(
-    "--ud-auto-download/--no-ud-auto-download",
-    default=True,
-    help="Auto-download Stanza models when using --export-conllu with stanza engine.",
-)
-@click.option(
-    "--allow-non-ud-conllu",
-    is_flag=True,
-    default=False,
-    help="Allow heuristic basic exporter when UD engine is unavailable.",
-)
-@click.option(
-    "--stdout",
-    is_flag=True,
-    default=False,
-    help="Stream JSON to stdout (no files) for pipeline composition.",
-)
-@click.option(
-    "--export-parquet/--no-export-parquet",
-    default=False,
-    help="Also write analyzer summary table to <base>.parquet",
-)
-@click.option("--trace-id", "trace_id", type=str, default=None, help="Attach trace ID to logs.")
-@click.option("--verbose", "verbose", is_flag=True, default=False, help="Verbose logs.")
-@click.option(
-    "--enable-embeddings",
-    is_flag=True,
-    default=False,
-    help="Enable sentence embeddings analysis (requires 'rookeen[embeddings]')",
-)
-@click.option(
-    "--enable-sentiment",
-    is_flag=True,
-    default=False,
-    help="Enable sentiment analysis (requires 'rookeen[sentiment]')",
-)
-@click.option(
-    "--embeddings-backend",
-    type=click.Choice(["miniLM", "bge-m3", "openai-te3"], case_sensitive=False),
-    default=None,
-    help="Embeddings backend to use when --enable-embeddings is set.",
-)
-@click.option(
-    "--embeddings-model",
-    type=str,
-    default=None,
-    help="Model identifier for the selected backend (e.g., BAAI/bge-m3, text-embedding-3-small).",
-)
-@click.option(
-    "--openai-api-key",
-    type=str,
-    default=None,
-    help="OpenAI API key for openai-te3 backend (falls back to env).",
-)
-@click.option(
-    "--embeddings-preload/--no-embeddings-preload",
-    is_flag=True,
-    default=False,
-    help="Preload embeddings backend/model at startup to avoid first-call latency.",
-)
-@click.option(
-    "--enable",
-    "enabled_analyzers",
-    multiple=True,
-    help="Enable specific analyzers by name (can be used multiple times)",
-)
-@click.option(
-    "--disable",
-    "disabled_analyzers",
-    multiple=True,
-    help="Disable specific analyzers by name (can be used multiple times)",
-)
+@analyze_options("analyze-file")
 @click.pass_context
 def cmd_analyze_file(
     ctx: click.Context,
     path: str,
     output_base: str | None,
-    format_: str | None,
-    lang_override: str | None,
-    preload_languages_csv: str | None,
-    models_auto_download: bool | None,
-    export_spacy_json: bool,
-    export_docbin: bool,
-    export_conllu: bool,
-    conllu_engine: str,
-    ud_auto_download: bool,
-    allow_non_ud_conllu: bool,
-    stdout: bool,
-    trace_id: str | None,
-    verbose: bool,
-    export_parquet: bool,
-    enable_embeddings: bool,
-    enable_sentiment: bool,
-    embeddings_backend: str | None,
-    embeddings_model: str | None,
-    openai_api_key: str | None,
-    embeddings_preload: bool,
-    enabled_analyzers: tuple[str, ...],
-    disabled_analyzers: tuple[str, ...],
+    opts: AnalyzeOptions,
 ) -> None:
     """Analyze a local text file."""
+    from rookeen.cli_func import analyze_file
+
     settings = ctx.obj.get("settings")
-    analyze_file(
-        path=path,
-        output_base=output_base,
-        format_=format_,
-        lang_override=lang_override,
-        preload_languages_csv=preload_languages_csv,
-        models_auto_download=models_auto_download,
-        export_spacy_json=export_spacy_json,
-        export_docbin=export_docbin,
-        export_conllu=export_conllu,
-        conllu_engine=conllu_engine,
-        ud_auto_download=ud_auto_download,
-        allow_non_ud_conllu=allow_non_ud_conllu,
-        stdout=stdout,
-        trace_id=trace_id,
-        verbose=verbose,
-        export_parquet=export_parquet,
-        enable_embeddings=enable_embeddings,
-        enable_sentiment=enable_sentiment,
-        embeddings_backend=embeddings_backend,
-        embeddings_model=embeddings_model,
-        openai_api_key=openai_api_key,
-            embeddings_preload=embeddings_preload,
-        enabled_analyzers=list(enabled_analyzers),
-        disabled_analyzers=list(disabled_analyzers),
-        settings=settings,
-    )
+    analyze_file(path=path, output_base=output_base, opts=opts, settings=settings)
 
 
 @cli.command("batch", short_help="Batch analyze multiple URLs from file with full analyzer suite (rate limiting, robots.txt support)")
@@ -491,186 +350,127 @@ def cmd_analyze_file(
     default=None,
     help="Directory to write outputs.",
 )
-@click.option(
-    "--format",
-    "format_",
-    type=click.Choice(["json", "md", "html", "all"], case_sensitive=False),
-    default=None,
-)
-@click.option("--lang", "lang_override", type=str, default=None)
-@click.option("--languages", "preload_languages_csv", type=str, default=None)
-@click.option("--models-auto-download/--no-models-auto-download", default=None)
-@click.option(
-    "--export-spacy-json/--no-export-spacy-json",
-    default=False,
-    help="Also write token-level spaCy JSON to <base>.spacy.json",
-)
-@click.option(
-    "--export-docbin/--no-export-docbin",
-    default=False,
-    help="Also write DocBin snapshot to <base>.docbin",
-)
-@click.option(
-    "--export-conllu/--no-export-conllu",
-    default=False,
-    help="Also write CoNLL-U format to <base>.conllu",
-)
-@click.option(
-    "--conllu-engine",
-    type=click.Choice(["auto", "stanza", "basic"], case_sensitive=False),
-    default="auto",
-    help="Engine for CoNLL-U export: 'stanza' (UD-valid) or 'basic' (heuristic).",
-)
-@click.option(
-    "--ud-auto-download/--no-ud-auto-download",
-    default=True,
-    help="Auto-download Stanza models when using --export-conllu with stanza engine.",
-)
-@click.option(
-    "--allow-non-ud-conllu",
-    is_flag=True,
-    default=False,
-    help="Allow heuristic basic exporter when UD engine is unavailable.",
-)
-@click.option(
-    "--export-parquet/--no-export-parquet",
-    default=False,
-    help="Also write analyzer summary table to <base>.parquet",
-)
-@click.option(
-    "--rate-limit",
-    "rate_limit",
-    type=float,
-    default=0.5,
-    help="Rate limit in requests per second (default: 0.5)",
-)
-@click.option(
-    "--robots",
-    "robots_policy",
-    type=click.Choice(["respect", "ignore"], case_sensitive=False),
-    default="respect",
-    help="Robots.txt policy: 'respect' or 'ignore' (default: respect)",
-)
-@click.option("--trace-id", "trace_id", type=str, default=None, help="Attach trace ID to logs.")
-@click.option("--verbose", "verbose", is_flag=True, default=False)
-@click.option(
-    "--enable-embeddings",
-    is_flag=True,
-    default=False,
-    help="Enable sentence embeddings analysis (requires 'rookeen[embeddings]')",
-)
-@click.option(
-    "--enable-sentiment",
-    is_flag=True,
-    default=False,
-    help="Enable sentiment analysis (requires 'rookeen[sentiment]')",
-)
-@click.option(
-    "--embeddings-backend",
-    type=click.Choice(["miniLM", "bge-m3", "openai-te3"], case_sensitive=False),
-    default=None,
-    help="Embeddings backend to use when --enable-embeddings is set.",
-)
-@click.option(
-    "--embeddings-model",
-    type=str,
-    default=None,
-    help="Model identifier for the selected backend (e.g., BAAI/bge-m3, text-embedding-3-small).",
-)
-@click.option(
-    "--openai-api-key",
-    type=str,
-    default=None,
-    help="OpenAI API key for openai-te3 backend (falls back to env).",
-)
-@click.option(
-    "--embeddings-preload/--no-embeddings-preload",
-    is_flag=True,
-    default=False,
-    help="Preload embeddings backend/model at startup to avoid first-call latency.",
-)
-@click.option(
-    "--enable",
-    "enabled_analyzers",
-    multiple=True,
-    help="Enable specific analyzers by name (can be used multiple times)",
-)
-@click.option(
-    "--disable",
-    "disabled_analyzers",
-    multiple=True,
-    help="Disable specific analyzers by name (can be used multiple times)",
-)
+@analyze_options("batch")
 @click.pass_context
 def cmd_batch(
     ctx: click.Context,
     url_list_file: str,
     output_dir: str | None,
-    format_: str | None,
-    lang_override: str | None,
-    preload_languages_csv: str | None,
-    models_auto_download: bool | None,
-    export_spacy_json: bool,
-    export_docbin: bool,
-    export_conllu: bool,
-    conllu_engine: str,
-    ud_auto_download: bool,
-    allow_non_ud_conllu: bool,
-    trace_id: str | None,
-    verbose: bool,
-    export_parquet: bool,
-    rate_limit: float,
-    robots_policy: str,
-    enable_embeddings: bool,
-    enable_sentiment: bool,
-    embeddings_backend: str | None,
-    embeddings_model: str | None,
-    openai_api_key: str | None,
-    embeddings_preload: bool,
-    enabled_analyzers: tuple[str, ...],
-    disabled_analyzers: tuple[str, ...],
+    opts: AnalyzeOptions,
 ) -> None:
     """Analyze a list of URLs from a file (one per line; '#' comments allowed)."""
+    from rookeen.cli_func import batch_analyze
+
     settings = ctx.obj.get("settings")
     batch_analyze(
-        url_list_file=url_list_file,
-        output_dir=output_dir,
-        format_=format_,
-        lang_override=lang_override,
-        preload_languages_csv=preload_languages_csv,
-        models_auto_download=models_auto_download,
-        export_spacy_json=export_spacy_json,
-        export_docbin=export_docbin,
-        export_conllu=export_conllu,
-        conllu_engine=conllu_engine,
-        ud_auto_download=ud_auto_download,
-        allow_non_ud_conllu=allow_non_ud_conllu,
-        trace_id=trace_id,
-        verbose=verbose,
-        export_parquet=export_parquet,
-        rate_limit=rate_limit,
-        robots_policy=robots_policy,
-        enable_embeddings=enable_embeddings,
-        enable_sentiment=enable_sentiment,
-        embeddings_backend=embeddings_backend,
-        embeddings_model=embeddings_model,
-        openai_api_key=openai_api_key,
-        embeddings_preload=embeddings_preload,
-        enabled_analyzers=list(enabled_analyzers),
-        disabled_analyzers=list(disabled_analyzers),
-        settings=settings,
+        url_list_file=url_list_file, output_dir=output_dir, opts=opts, settings=settings
     )
 
 
+def _rebind_stream_handlers(old: Any, new: Any) -> None:
+    """Point every logging StreamHandler writing to `old` at `new`."""
+    for lg in list(logging.Logger.manager.loggerDict.values()):
+        if isinstance(lg, logging.Logger):
+            for h in lg.handlers:
+                if isinstance(h, logging.StreamHandler) and h.stream is old:
+                    h.setStream(new)
+
+
+@contextlib.contextmanager
+def _capture_stderr(buf: io.StringIO) -> Iterator[None]:
+    """Redirect stderr, including log handlers bound to it, into `buf`."""
+    stderr = sys.stderr
+    _rebind_stream_handlers(stderr, buf)
+    try:
+        with contextlib.redirect_stderr(buf):
+            yield
+    finally:
+        # Also covers loggers first created during the job, which bound to `buf`
+        _rebind_stream_handlers(buf, stderr)
+
+
+def _run_job(argv: list[str]) -> dict[str, Any]:
+    """Run one CLI invocation in-process, capturing its exit code, stdout and stderr.
+
+    Captured stderr is returned in the reply and also echoed to the worker's own
+    stderr once the job finishes.
+    """
+    out = io.StringIO()
+    err = io.StringIO()
+    # Analyze commands persist CLI values into the environment; isolate jobs from each other
+    saved_env = dict(os.environ)
+    start = time.perf_counter()
+    code = 0
+    try:
+        with contextlib.redirect_stdout(out), _capture_stderr(err):
+            try:
+                cli.main(args=argv, prog_name="rookeen", standalone_mode=False)
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except click.ClickException as e:
+                e.show()
+                code = e.exit_code
+            except click.Abort:
+                code = USAGE.code
+            except Exception as e:
+                sys.stderr.write(f"{e}\n")
+                code = 1
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+    seconds = time.perf_counter() - start
+    if err.getvalue():
+        sys.stderr.write(err.getvalue())
+        sys.stderr.flush()
+    return {
+        "return_code": code,
+        "seconds": seconds,
+        "stdout": out.getvalue(),
+        "stderr": err.getvalue(),
+    }
+
+
+@cli.command("serve", short_help="Run as a persistent worker executing JSON-encoded CLI jobs from stdin")
+def cmd_serve() -> None:
+    """Execute one job per stdin line and write one JSON result per stdout line.
+
+    Each job is a JSON object {"args": ["analyze-file", "in.txt", "--lang", "en", ...]}
+    holding the arguments that would follow `rookeen` on the command line (jobs cannot
+    use --stdin, which is the job channel). The reply is
+    {"return_code": int, "seconds": float, "stdout": str, "stderr": str}; the job's
+    logs and errors are also echoed to the worker's stderr. Loaded spaCy models stay cached between jobs, so import and
+    model-load cost is paid once.
+    """
+    out = sys.stdout
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+            argv = [str(a) for a in job["args"]]
+        except Exception as e:
+            sys.stderr.write(f"Invalid job: {e}\n")
+            reply: dict[str, Any] = {
+                "return_code": USAGE.code,
+                "seconds": 0.0,
+                "stdout": "",
+                "stderr": f"Invalid job: {e}\n",
+            }
+        else:
+            reply = _run_job(argv)
+        out.write(json.dumps(reply, ensure_ascii=False) + "\n")
+        out.flush()
+
 
 def main() -> None:
     """Main entry point with proper error handling."""
+    errors_json = "--errors-json" in sys.argv
     # Use Click's main function with custom exception handling
     try:
         cli.main(standalone_mode=False)
     except click.ClickException as e:
         # Handle Click's built-in exceptions (usage errors, etc.)
-        errors_json = "--errors-json" in sys.argv
         if errors_json:
             emit_and_exit(USAGE)
         else:
@@ -679,7 +479,6 @@ def main() -> None:
             sys.exit(e.exit_code)
     except click.Abort:
         # Handle Ctrl+C
-        errors_json = "--errors-json" in sys.argv
         if errors_json:
             emit_and_exit(USAGE)
         else:
@@ -689,10 +488,7 @@ def main() -> None:
         raise
     except Exception:
         # Handle any other unexpected exceptions
-        errors_json = "--errors-json" in sys.argv
         if errors_json:
-            from rookeen.errors import GENERIC
-
             emit_and_exit(GENERIC)
         else:
             raise
@@ -2,18 +2,25 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import gc
 import json
-import logging
 import os
+import re
 import sys
+import threading
 import time
-from collections.abc import Iterable
-from importlib import metadata
-from typing import Any
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
 import click
+from aiohttp import ClientError
 
-from rookeen.config import RookeenSettings
+from rookeen.config import AnalyzeOptions, RookeenSettings, _get_version
 from rookeen.errors import (
     FETCH,
     GENERIC,
@@ -22,11 +29,24 @@ from rookeen.errors import (
     RookeenError,
     emit_and_exit,
 )
-from rookeen.export import doc_to_conllu, doc_to_spacy_json, dump_docbin
-from rookeen.export.parquet import analyzers_to_parquet
 from rookeen.language import normalize_lang
 from rookeen.pipeline import AsyncLinguisticPipeline
-from rookeen.utils.logging import get_logger, new_trace_id
+from rookeen.utils.logging import TraceAdapter, get_logger, new_trace_id
+from rookeen.utils.robots import Throttle
+
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
+    from rookeen.models import LinguisticAnalysisResult, WebPageContent
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Output files are written through a 64 KiB buffer; json.dump emits many small chunks
+_WRITE_BUFFER_SIZE = 1 << 16
 
 # Exit codes per spec
 EXIT_OK = 0
@@ -35,67 +55,153 @@ EXIT_USAGE = 2
 EXIT_FETCH = 3
 EXIT_MODEL = 4
 
+# One match per character that is neither alphanumeric (Unicode-aware, as `str.isalnum`)
+# nor "-" / "_"; each becomes "-"
+_SLUG_UNSAFE_RE = re.compile(r"[^\w-]")
+# Runs of non-whitespace; `\s` covers the same characters as `str.split()`
+_WORD_RE = re.compile(r"\S+")
 
-def _get_version() -> str:
-    try:
-        return metadata.version("rookeen")
-    except Exception:
-        return "0.1.0"
+# Last (timestamp, sequence) handed out by `_output_stamp`
+_STAMP_LOCK = threading.Lock()
+_last_stamp: tuple[int, int] = (0, 0)
+
+
+# Output directories already created (or found) by this process
+_ENSURED_DIRS: set[str] = set()
 
 
 def _ensure_dir(path: str) -> None:
+    """Create the parent directory of `path`; each directory is checked once per process.
+
+    Concurrent callers may both reach `makedirs`, which `exist_ok` makes harmless.
+    """
     directory = os.path.dirname(path)
-    if directory and not os.path.exists(directory):
+    if directory and directory not in _ENSURED_DIRS:
         os.makedirs(directory, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
 
 
 def _slugify_filename(text: str) -> str:
-    safe = [c if c.isalnum() or c in ("-", "_") else "-" for c in text.strip()]
-    s = "".join(safe).strip("-")
+    s = _SLUG_UNSAFE_RE.sub("-", text.strip()).strip("-")
     return s or "output"
 
 
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words without materializing them as a list."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _decode_text(data: bytes, encoding: str = "utf-8", errors: str = "strict") -> str:
+    """Decode raw input in one pass, translating newlines as a text-mode read would."""
+    text = data.decode(encoding, errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_stdin() -> str:
+    """Read all of stdin as bytes and decode once, bypassing the TextIOWrapper."""
+    stdin = sys.stdin
+    buffer = getattr(stdin, "buffer", None)
+    if buffer is None:
+        # e.g. stdin replaced by a StringIO
+        return stdin.read()
+    return _decode_text(buffer.read(), stdin.encoding or "utf-8", stdin.errors or "strict")
+
+
+def _output_stamp() -> str:
+    """Second-resolution timestamp for default output names, unique within the process.
+
+    A name requested in the same second as the previous one gets a "_1", "_2", ...
+    suffix, so concurrent batch items and back-to-back runs never overwrite each other.
+    """
+    global _last_stamp
+    now = int(time.time())
+    with _STAMP_LOCK:
+        last, seq = _last_stamp
+        # Never step backwards, even if the wall clock does
+        _last_stamp = (last, seq + 1) if now <= last else (now, 0)
+        ts, seq = _last_stamp
+    return f"{ts}_{seq}" if seq else str(ts)
+
+
 def _derive_output_base_from_url(url: str, output_dir: str = "results") -> str:
     try:
-        from urllib.parse import urlparse
-
         p = urlparse(url)
         host = (p.netloc or "url").replace("www.", "")
         host_slug = _slugify_filename(host)
     except Exception:
         host_slug = "url"
-    ts = int(time.time())
-    return os.path.join(output_dir, f"{host_slug}_{ts}")
+    return os.path.join(output_dir, f"{host_slug}_{_output_stamp()}")
+
+
+def _has_json_suffix(path: str) -> bool:
+    # Lowercase only the last five characters, not the whole path
+    return path[-5:].lower() == ".json"
 
 
 def _normalize_output_base(output: str | None, default_base: str) -> str:
     if not output:
         return default_base
-    base = output
-    if base.lower().endswith(".json"):
-        base = base[:-5]
-    return base
-
-
-def _json_path_from_base(base: str) -> str:
-    return base if base.lower().endswith(".json") else base + ".json"
-
-
-def _spacy_json_path_from_base(base: str) -> str:
-    return base + ".spacy.json"
+    return output[:-5] if _has_json_suffix(output) else output
+
+
+@dataclass(frozen=True, slots=True)
+class _PathSet:
+    """Every output path derived from one output base, computed once per run."""
+
+    json: str
+    spacy_json: str
+    docbin: str
+    conllu: str
+    parquet: str
+
+    @classmethod
+    def from_base(cls, base: str) -> _PathSet:
+        return cls(
+            json=base if _has_json_suffix(base) else base + ".json",
+            spacy_json=base + ".spacy.json",
+            docbin=base + ".docbin",
+            conllu=base + ".conllu",
+            parquet=base + ".parquet",
+        )
 
 
-def _docbin_path_from_base(base: str) -> str:
-    return base + ".docbin"
+def _dumps_json(payload: dict[str, Any]) -> bytes:
+    """Serialize `payload` as indented UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        data: bytes = orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+        return data
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
 
 
-def _conllu_path_from_base(base: str) -> str:
-    return base + ".conllu"
+def _print_json(payload: dict[str, Any]) -> None:
+    """Write `payload` to stdout as indented JSON followed by a newline."""
+    if orjson is None:
+        # Encode incrementally so the whole document never exists as one str
+        json.dump(payload, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        return
+    data = _dumps_json(payload) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # e.g. stdout redirected to a StringIO by `rookeen serve`
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
 
 
 def _write_json(path: str, payload: dict[str, Any]) -> None:
-    _ensure_dir(path)
-    with open(path, "w", encoding="utf-8") as f:
+    if orjson is not None:
+        with open(path, "wb") as fb:
+            fb.write(_dumps_json(payload))
+        return
+    with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
 
 
@@ -105,48 +211,62 @@ def _build_pipeline(
     enable_sentiment: bool = False,
     enabled_analyzers: list[str] | None = None,
     disabled_analyzers: list[str] | None = None,
+    keep_components: Iterable[str] | None = None,
+) -> AsyncLinguisticPipeline:
+    """Build pipeline with selective analyzer control.
+
+    Pipelines are cached per configuration, so repeated runs in one process (such as the
+    jobs of `rookeen serve`) reuse the same analyzer instances. `keep_components` is
+    passed to the pipeline: None loads full spaCy models, otherwise optional components
+    used by neither those names nor the enabled analyzers are left out.
+    """
+    return _cached_pipeline(
+        tuple(preload_languages),
+        enable_embeddings,
+        enable_sentiment,
+        tuple(enabled_analyzers or ()),
+        tuple(disabled_analyzers or ()),
+        None if keep_components is None else tuple(sorted(set(keep_components))),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_pipeline(
+    preload_languages: tuple[str, ...],
+    enable_embeddings: bool,
+    enable_sentiment: bool,
+    enabled: tuple[str, ...],
+    disabled: tuple[str, ...],
+    keep_components: tuple[str, ...] | None,
 ) -> AsyncLinguisticPipeline:
-    """Build pipeline with selective analyzer control."""
-    from rookeen.analyzers.base import available_analyzers, get_analyzer
-
-    # Try to register optional analyzers if specific flags are used
-    if enable_embeddings:
-        with contextlib.suppress(ImportError):
-            from rookeen.analyzers.embeddings import EmbeddingsAnalyzer  # noqa: F401
-    if enable_sentiment:
-        with contextlib.suppress(ImportError):
-            from rookeen.analyzers.sentiment import SentimentAnalyzer  # noqa: F401
-
-    # Start with all available analyzers
-    if enabled_analyzers is None or len(enabled_analyzers) == 0:
-        enabled_analyzers = available_analyzers()
-
-    # Apply disable filters
-    if disabled_analyzers:
-        enabled_analyzers = [name for name in enabled_analyzers if name not in disabled_analyzers]
-
-    # Apply specific flags - ADD optional analyzers if explicitly requested
-    if enable_embeddings and "embeddings" not in enabled_analyzers:
-        enabled_analyzers.append("embeddings")
-    elif not enable_embeddings and "embeddings" in enabled_analyzers:
-        enabled_analyzers.remove("embeddings")
-
-    if enable_sentiment and "sentiment" not in enabled_analyzers:
-        enabled_analyzers.append("sentiment")
-    elif not enable_sentiment and "sentiment" in enabled_analyzers:
-        enabled_analyzers.remove("sentiment")
+    from rookeen.analyzers.base import available_analyzers, get_analyzer_instance
+
+    # Start with all available analyzers, drop disabled ones and keep the optional
+    # analyzers only when their flag is set, in one pass
+    optional = {"embeddings": enable_embeddings, "sentiment": enable_sentiment}
+    disabled_set = frozenset(disabled)
+    enabled_analyzers = [
+        name
+        for name in (enabled or available_analyzers())
+        if name not in disabled_set and optional.get(name, True)
+    ]
+    # ADD optional analyzers if explicitly requested (even when also disabled)
+    enabled_analyzers += [
+        name for name, on in optional.items() if on and name not in enabled_analyzers
+    ]
 
     # Instantiate analyzers
     analyzers = []
     for name in enabled_analyzers:
         try:
-            analyzer_cls = get_analyzer(name)
-            analyzers.append(analyzer_cls())
+            analyzers.append(get_analyzer_instance(name))
         except Exception:
             # Skip analyzers that can't be instantiated
             continue
 
-    return AsyncLinguisticPipeline(analyzers, preload_languages=preload_languages)
+    return AsyncLinguisticPipeline(
+        analyzers, preload_languages=preload_languages, keep_components=keep_components
+    )
 
 
 def _results_to_json(
@@ -159,18 +279,31 @@ def _results_to_json(
     content_title: str,
     content_word_count: int,
     content_char_count: int,
-    analyzers: list[Any],
+    analyzers: list[LinguisticAnalysisResult],
     timing: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     try:
-        from urllib.parse import urlparse
-
         domain = ""
         if source_type == "url":
             domain = urlparse(source_value).netloc
     except Exception:
         domain = ""
 
+    # Every pipeline result is a validated LinguisticAnalysisResult, so fields are read
+    # directly rather than probed with getattr defaults
+    entries: list[dict[str, Any]] = []
+    append = entries.append
+    for r in analyzers:
+        append(
+            {
+                "name": r.name,
+                "processing_time": float(r.processing_time),
+                "confidence": float(r.confidence),
+                "results": r.results,
+                "metadata": r.metadata,
+            }
+        )
+
     payload: dict[str, Any] = {
         "tool": "rookeen",
         "version": _get_version(),
@@ -190,59 +323,60 @@ def _results_to_json(
             "char_count": int(content_char_count),
             "word_count": int(content_word_count),
         },
-        "analyzers": [
-            {
-                "name": getattr(r, "name", getattr(r, "analysis_type", "unknown")),
-                "processing_time": float(getattr(r, "processing_time", 0.0)),
-                "confidence": float(getattr(r, "confidence", 1.0)),
-                "results": getattr(r, "results", {}),
-                "metadata": getattr(r, "metadata", {}),
-            }
-            for r in analyzers
-        ],
+        "analyzers": entries,
         "timing": timing or {},
     }
     return payload
 
 
-def _make_logger(verbose: bool) -> logging.Logger:
+def _make_logger(verbose: bool, trace: str) -> TraceAdapter:
     level = "DEBUG" if verbose else "INFO"
-    return get_logger("rookeen.cli", level=level)
+    return TraceAdapter(get_logger("rookeen.cli", level=level), trace)
+
+
+@dataclass(frozen=True, slots=True)
+class _EmbeddingsEnv:
+    """Effective embeddings settings: CLI values first, then the environment."""
+
+    backend: str | None
+    model: str | None
+    api_key: str | None
+
+
+def _resolve_embeddings_env(opts: AnalyzeOptions) -> _EmbeddingsEnv:
+    """Persist CLI embedding options to the environment and resolve the effective values.
+
+    CLI values are only written to unset variables, since analyzers resolve their
+    backend from the environment; each variable is read once.
+    """
+    env = os.environ
+    resolved: list[str | None] = []
+    for key, cli_value in (
+        ("ROOKEEN_EMBEDDINGS_BACKEND", opts.embeddings_backend),
+        ("ROOKEEN_EMBEDDINGS_MODEL", opts.embeddings_model),
+        ("ROOKEEN_OPENAI_API_KEY", opts.openai_api_key),
+    ):
+        current = env.get(key)
+        if cli_value and current is None:
+            env[key] = cli_value
+        resolved.append(cli_value or current)
+    backend, model, api_key = resolved
+    return _EmbeddingsEnv(
+        backend=backend, model=model, api_key=api_key or env.get("OPENAI_API_KEY")
+    )
 
 
-def _maybe_preload_embeddings(
-    embeddings_backend: str | None,
-    embeddings_model: str | None,
-    openai_api_key: str | None,
-) -> None:
-    if not embeddings_backend:
+def _maybe_preload_embeddings(embeddings: _EmbeddingsEnv) -> None:
+    if not embeddings.backend:
         return
     try:
-        from rookeen.analyzers.embeddings_backends import get_backend
+        from rookeen.analyzers.embeddings import shared_backend
     except Exception:
         return
-    kwargs: dict[str, object] = {}
-    if embeddings_backend == "miniLM":
-        kwargs["model_name"] = (
-            embeddings_model or "sentence-transformers/all-MiniLM-L6-v2"
-        )
-    elif embeddings_backend == "bge-m3":
-        kwargs["model_name"] = embeddings_model or "BAAI/bge-m3"
-    elif embeddings_backend == "openai-te3":
-        kwargs["model_name"] = embeddings_model or os.getenv(
-            "ROOKEEN_OPENAI_MODEL", "text-embedding-3-small"
-        )
-        kwargs["api_key"] = (
-            openai_api_key
-            or os.getenv("ROOKEEN_OPENAI_API_KEY")
-            or os.getenv("OPENAI_API_KEY")
-        )
-    try:
-        be = get_backend(embeddings_backend, **kwargs)
-        be.load()
-    except Exception:
-        # Best-effort preload; analyzer will still attempt lazily
-        pass
+    # Best-effort preload of the same shared backend instance the embeddings analyzer
+    # uses; on failure the analyzer still attempts it lazily
+    with contextlib.suppress(Exception):
+        shared_backend(embeddings.backend, embeddings.model or "", embeddings.api_key).load()
 
 
 def _parse_languages_csv(codes: str | None) -> list[str]:
@@ -258,801 +392,620 @@ def _parse_languages_csv(codes: str | None) -> list[str]:
     return out
 
 
-def analyze_url(
-    url: str,
-    output_base: str | None,
-    format_: str | None,
-    lang_override: str | None,
-    preload_languages_csv: str | None,
-    models_auto_download: bool | None,
-    export_spacy_json: bool,
-    export_docbin: bool,
-    export_conllu: bool,
-    conllu_engine: str,
-    ud_auto_download: bool,
-    allow_non_ud_conllu: bool,
-    stdout: bool,
-    trace_id: str | None,
-    verbose: bool,
-    export_parquet: bool,
-    rate_limit: float,
-    robots_policy: str,
-    enable_embeddings: bool,
-    enable_sentiment: bool,
-    embeddings_backend: str | None,
-    embeddings_model: str | None,
-    openai_api_key: str | None,
-    embeddings_preload: bool,
-    enabled_analyzers: list[str] | None,
-    disabled_analyzers: list[str] | None,
-    settings: RookeenSettings,
-) -> None:
-    """Analyze a single URL."""
-    logger = _make_logger(verbose)
-    trace = trace_id or new_trace_id()
-
-    # Persist CLI -> env for analyzer to resolve backend/model/api key
-    if embeddings_backend:
-        os.environ.setdefault("ROOKEEN_EMBEDDINGS_BACKEND", embeddings_backend)
-    if embeddings_model:
-        os.environ.setdefault("ROOKEEN_EMBEDDINGS_MODEL", embeddings_model)
-    if openai_api_key:
-        os.environ.setdefault("ROOKEEN_OPENAI_API_KEY", openai_api_key)
-
-    # Optional preload to avoid first-call latency
-    if embeddings_preload and (embeddings_backend or os.getenv("ROOKEEN_EMBEDDINGS_BACKEND")):
-        _maybe_preload_embeddings(
-            embeddings_backend or os.getenv("ROOKEEN_EMBEDDINGS_BACKEND"),
-            embeddings_model or os.getenv("ROOKEEN_EMBEDDINGS_MODEL"),
-            openai_api_key or os.getenv("ROOKEEN_OPENAI_API_KEY"),
-        )
+@dataclass(slots=True)
+class _Analysis:
+    """One analyzed source: its text and metadata, the spaCy Doc and analyzer output."""
+
+    title: str
+    text: str
+    word_count: int
+    char_count: int
+    doc: Doc
+    results: list[LinguisticAnalysisResult]
+    ctx: dict[str, Any]
+    timing: dict[str, Any]
+
 
-    effective_format = (format_ or settings.format).lower()
+@contextlib.contextmanager
+def _embeddings_context(opts: AnalyzeOptions) -> Iterator[None]:
+    """Persist embedding options and, if requested, preload the backend during the block.
+
+    The preload runs on a worker thread so the block (pipeline construction) overlaps
+    with the model load; it is joined on exit, before any analysis starts.
+    """
+    embeddings = _resolve_embeddings_env(opts)
+    if not (opts.embeddings_preload and embeddings.backend):
+        yield
+        return
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        future = ex.submit(_maybe_preload_embeddings, embeddings)
+        yield
+        future.result()
+
+
+def _export_components(opts: AnalyzeOptions) -> tuple[str, ...] | None:
+    """spaCy components the requested Doc exports read; None when they need the full Doc."""
+    if opts.stdout:
+        return ()
+    if opts.export_docbin:
+        return None
+    keep: set[str] = set()
+    if opts.export_spacy_json:
+        keep |= {"lemmatizer", "ner"}
+    if opts.export_conllu:
+        # The basic engine (directly or as fallback) writes the LEMMA column
+        keep.add("lemmatizer")
+    return tuple(sorted(keep))
+
+
+def _setup_pipeline(opts: AnalyzeOptions, settings: RookeenSettings) -> AsyncLinguisticPipeline:
+    """Apply embedding options to the environment, preload, and build the pipeline."""
     preload = (
-        _parse_languages_csv(preload_languages_csv)
-        if preload_languages_csv is not None
+        _parse_languages_csv(opts.preload_languages_csv)
+        if opts.preload_languages_csv is not None
         else list(settings.languages_preload)
     )
-    pipeline = _build_pipeline(
-        preload,
-        enable_embeddings=enable_embeddings,
-        enable_sentiment=enable_sentiment,
-        enabled_analyzers=enabled_analyzers,
-        disabled_analyzers=disabled_analyzers,
+    with _embeddings_context(opts):
+        return _build_pipeline(
+            preload,
+            enable_embeddings=opts.enable_embeddings,
+            enable_sentiment=opts.enable_sentiment,
+            enabled_analyzers=list(opts.enabled_analyzers),
+            disabled_analyzers=list(opts.disabled_analyzers),
+            keep_components=_export_components(opts),
+        )
+
+
+def _auto_download(opts: AnalyzeOptions, settings: RookeenSettings) -> bool:
+    if opts.models_auto_download is not None:
+        return opts.models_auto_download
+    return settings.models_auto_download
+
+
+async def _analyze_page(
+    pipeline: AsyncLinguisticPipeline,
+    url: str,
+    opts: AnalyzeOptions,
+    settings: RookeenSettings,
+) -> _Analysis:
+    content, doc, results, ctx, timing = await pipeline.analyze_web_page(
+        url,
+        lang_override=opts.lang_override,
+        auto_download=_auto_download(opts, settings),
+        default_language=settings.default_language or None,
+        rate_limit=opts.rate_limit,
+        robots_policy=opts.robots_policy,
+    )
+    return _page_analysis(content, doc, results, ctx, timing)
+
+
+def _page_analysis(
+    content: WebPageContent,
+    doc: Doc,
+    results: list[LinguisticAnalysisResult],
+    ctx: dict[str, Any],
+    timing: dict[str, Any],
+) -> _Analysis:
+    return _Analysis(
+        title=content.title,
+        text=content.text,
+        word_count=content.word_count,
+        char_count=content.char_count,
+        doc=doc,
+        results=results,
+        ctx=ctx,
+        timing=timing,
     )
 
-    default_base = _derive_output_base_from_url(url, settings.output_dir)
-    base = _normalize_output_base(output_base, default_base)
-    json_path = _json_path_from_base(base)
 
-    try:
-        logger.debug(
-            "starting_analysis",
-            extra={"trace_id": trace, "run_id": trace, "url": url},
-        )
+async def _analyze_text(
+    pipeline: AsyncLinguisticPipeline,
+    text: str,
+    title: str,
+    opts: AnalyzeOptions,
+    settings: RookeenSettings,
+) -> _Analysis:
+    doc, results, ctx, timing = await pipeline.analyze_text(
+        text,
+        lang_override=opts.lang_override,
+        auto_download=_auto_download(opts, settings),
+        default_language=settings.default_language or None,
+    )
+    return _Analysis(
+        title=title,
+        text=text,
+        word_count=_count_words(text),
+        char_count=len(text),
+        doc=doc,
+        results=results,
+        ctx=ctx,
+        timing=timing,
+    )
 
-        content, doc, results, ctx, timing = asyncio.run(
-            pipeline.analyze_web_page(
-                url,
-                lang_override=lang_override,
-                auto_download=(
-                    models_auto_download
-                    if models_auto_download is not None
-                    else settings.models_auto_download
-                ),
-                default_language=settings.default_language or None,
-                rate_limit=rate_limit,
-                robots_policy=robots_policy,
-            )
-        )
 
-        payload = _results_to_json(
-            source_type="url",
-            source_value=url,
-            language_code=ctx["language"],
-            language_conf=float(ctx["confidence"]),
-            model_name=ctx["model"],
-            content_title=content.title,
-            content_word_count=content.word_count,
-            content_char_count=content.char_count,
-            analyzers=results,
-            timing=timing,
-        )
+def _build_payload(source_type: str, source_value: str, analysis: _Analysis) -> dict[str, Any]:
+    return _results_to_json(
+        source_type=source_type,
+        source_value=source_value,
+        language_code=analysis.ctx["language"],
+        language_conf=float(analysis.ctx["confidence"]),
+        model_name=analysis.ctx["model"],
+        content_title=analysis.title,
+        content_word_count=analysis.word_count,
+        content_char_count=analysis.char_count,
+        analyzers=analysis.results,
+        timing=analysis.timing,
+    )
 
-        if stdout:
-            # Stream JSON to stdout for pipeline composition
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
-        else:
-            _write_json(json_path, payload)
-            if export_parquet:
-                try:
-                    parquet_path = base + ".parquet"
-                    analyzers_to_parquet(payload["analyzers"], parquet_path)
-                except Exception as exc:
-                    logger.error(
-                        "parquet_export_failed", extra={"trace_id": trace, "error": str(exc)}
-                    )
-
-        # Optional token-level exports (skip when using stdout)
-        if not stdout:
-            if export_spacy_json:
-                spacy_json_path = _spacy_json_path_from_base(base)
-                _ensure_dir(spacy_json_path)
-                with open(spacy_json_path, "w", encoding="utf-8") as f:
-                    json.dump(doc_to_spacy_json(doc), f, ensure_ascii=False, indent=2)
-            if export_docbin:
-                docbin_path = _docbin_path_from_base(base)
-                _ensure_dir(docbin_path)
-                dump_docbin(doc, docbin_path)
-            if export_conllu:
-                conllu_path = _conllu_path_from_base(base)
-                _ensure_dir(conllu_path)
-                engine = (conllu_engine or "auto").lower()
-                if engine in ("auto", "stanza"):
-                    try:
-                        from rookeen.export.ud_conllu import text_to_conllu
-
-                        raw_text = content.text
-                        conllu_text = text_to_conllu(
-                            raw_text, ctx["language"], auto_download=ud_auto_download
-                        )
-                        with open(conllu_path, "w", encoding="utf-8") as f:
-                            f.write(conllu_text)
-                    except Exception as e:
-                        if not allow_non_ud_conllu:
-                            raise RuntimeError(
-                                "Stanza engine unavailable; install 'rookeen[ud]' or pass --allow-non-ud-conllu --conllu-engine basic"
-                            ) from e
-                        logger.warning(
-                            "conllu_basic_fallback",
-                            extra={
-                                "trace_id": trace,
-                                "run_id": trace,
-                                "reason": str(e),
-                            },
-                        )
-                        with open(conllu_path, "w", encoding="utf-8") as f:
-                            f.write(doc_to_conllu(doc))
-                elif engine == "basic":
-                    logger.warning(
-                        "conllu_basic_non_ud",
-                        extra={
-                            "trace_id": trace,
-                            "run_id": trace,
-                            "recommendation": "Use --conllu-engine stanza for UD-compliant output",
-                        },
-                    )
-                    with open(conllu_path, "w", encoding="utf-8") as f:
-                        f.write(doc_to_conllu(doc))
 
-        if effective_format in ("md", "html", "all"):
-            click.echo("Note: MD/HTML rendering not implemented in this step; JSON written.")
+def _write_text(path: str, text: str) -> None:
+    """Write `text` as UTF-8 in one binary write, with "\n" line endings on every platform."""
+    with open(path, "wb") as fb:
+        fb.write(text.encode("utf-8"))
 
-        logger.debug(
-            "finished_analysis",
-            extra={
-                "trace_id": trace,
-                "run_id": trace,
-                "url": url,
-                "output": json_path if not stdout else "stdout",
-                "language": ctx["language"],
-            },
-        )
-        if not stdout:
-            click.echo(json_path)
-        sys.exit(EXIT_OK)
-    except ValueError as ve:
-        logger.error("usage_error", extra={"trace_id": trace, "run_id": trace})
-        emit_and_exit(RookeenError(USAGE.code, USAGE.name, f"{ve}"))
-    except RuntimeError as re:
-        msg = str(re)
-        if "spaCy model" in msg or "Installed '" in msg:
-            logger.error("model_error", extra={"trace_id": trace, "run_id": trace})
-            emit_and_exit(RookeenError(MODEL.code, MODEL.name, msg))
-        logger.error("generic_error", extra={"trace_id": trace, "run_id": trace})
-        emit_and_exit(RookeenError(GENERIC.code, GENERIC.name, msg))
-    except Exception as exc:
-        try:
-            import aiohttp
 
-            if isinstance(exc, aiohttp.ClientError):
-                logger.error("fetch_error", extra={"trace_id": trace, "run_id": trace})
-                emit_and_exit(RookeenError(FETCH.code, FETCH.name, f"{exc}"))
-        except Exception:
-            pass
-        logger.error("generic_error", extra={"trace_id": trace, "run_id": trace})
-        emit_and_exit(RookeenError(GENERIC.code, GENERIC.name, f"{exc}"))
+def _write_spacy_json(path: str, doc: Doc) -> None:
+    from rookeen.export.spacy_json import doc_to_spacy_json
 
+    _write_json(path, doc_to_spacy_json(doc))
 
-def analyze_stdin(
-    output_base: str | None,
-    format_: str | None,
-    lang_override: str | None,
-    preload_languages_csv: str | None,
-    models_auto_download: bool | None,
-    export_spacy_json: bool,
-    export_docbin: bool,
-    export_conllu: bool,
-    conllu_engine: str,
-    ud_auto_download: bool,
-    allow_non_ud_conllu: bool,
-    stdout: bool,
-    trace_id: str | None,
-    verbose: bool,
-    export_parquet: bool,
-    enable_embeddings: bool,
-    enable_sentiment: bool,
-    embeddings_backend: str | None,
-    embeddings_model: str | None,
-    openai_api_key: str | None,
-    embeddings_preload: bool,
-    enabled_analyzers: list[str] | None,
-    disabled_analyzers: list[str] | None,
-    settings: RookeenSettings,
+
+def _write_docbin(path: str, doc: Doc) -> None:
+    from rookeen.export.docbin import dump_docbin
+
+    dump_docbin(doc, path)
+
+
+def _write_conllu(
+    path: str,
+    analysis: _Analysis,
+    opts: AnalyzeOptions,
+    logger: TraceAdapter,
+    log_extra: dict[str, Any],
 ) -> None:
-    """Analyze text from stdin."""
-    logger = _make_logger(verbose)
-    trace = trace_id or new_trace_id()
-
-    # Persist CLI -> env for analyzer to resolve backend/model/api key
-    if embeddings_backend:
-        os.environ.setdefault("ROOKEEN_EMBEDDINGS_BACKEND", embeddings_backend)
-    if embeddings_model:
-        os.environ.setdefault("ROOKEEN_EMBEDDINGS_MODEL", embeddings_model)
-    if openai_api_key:
-        os.environ.setdefault("ROOKEEN_OPENAI_API_KEY", openai_api_key)
-
-    # Optional preload to avoid first-call latency
-    if embeddings_preload and (embeddings_backend or os.getenv("ROOKEEN_EMBEDDINGS_BACKEND")):
-        _maybe_preload_embeddings(
-            embeddings_backend or os.getenv("ROOKEEN_EMBEDDINGS_BACKEND"),
-            embeddings_model or os.getenv("ROOKEEN_EMBEDDINGS_MODEL"),
-            openai_api_key or os.getenv("ROOKEEN_OPENAI_API_KEY"),
+    from rookeen.export.conllu import doc_to_conllu
+
+    engine = (opts.conllu_engine or "auto").lower()
+    if engine in ("auto", "stanza"):
+        try:
+            from rookeen.export.ud_conllu import text_to_conllu
+
+            conllu_text = text_to_conllu(
+                analysis.text, analysis.ctx["language"], auto_download=opts.ud_auto_download
+            )
+            _write_text(path, conllu_text)
+        except Exception as e:
+            if not opts.allow_non_ud_conllu:
+                raise RuntimeError(
+                    "Stanza engine unavailable; install 'rookeen[ud]' or pass --allow-non-ud-conllu --conllu-engine basic"
+                ) from e
+            logger.warning(
+                "conllu_basic_fallback",
+                extra={"reason": str(e), **log_extra},
+            )
+            _write_text(path, doc_to_conllu(analysis.doc))
+    elif engine == "basic":
+        logger.warning(
+            "conllu_basic_non_ud",
+            extra={
+                "recommendation": "Use --conllu-engine stanza for UD-compliant output",
+                **log_extra,
+            },
         )
+        _write_text(path, doc_to_conllu(analysis.doc))
 
-    effective_format = (format_ or settings.format).lower()
-    preload = (
-        _parse_languages_csv(preload_languages_csv)
-        if preload_languages_csv is not None
-        else list(settings.languages_preload)
-    )
-    pipeline = _build_pipeline(
-        preload,
-        enable_embeddings=enable_embeddings,
-        enable_sentiment=enable_sentiment,
-        enabled_analyzers=enabled_analyzers,
-        disabled_analyzers=disabled_analyzers,
-    )
 
+def _write_parquet(
+    path: str,
+    payload: dict[str, Any],
+    logger: TraceAdapter,
+    log_extra: dict[str, Any],
+) -> None:
     try:
-        # Read text from stdin
-        text = sys.stdin.read()
+        # Imported on demand: pyarrow is optional and slow to import
+        from rookeen.export.parquet import analyzers_to_parquet
+
+        analyzers_to_parquet(payload["analyzers"], path)
     except Exception as exc:
-        logger.error("usage_error", extra={"trace_id": trace, "run_id": trace})
-        emit_and_exit(RookeenError(USAGE.code, USAGE.name, f"Failed to read from stdin: {exc}"))
+        logger.error(
+            "parquet_export_failed",
+            extra={**log_extra, "error": str(exc)},
+        )
 
-    default_base = os.path.join(settings.output_dir, f"stdin_{int(time.time())}")
-    base = _normalize_output_base(output_base, default_base)
-    json_path = _json_path_from_base(base)
 
-    try:
-        logger.debug(
-            "starting_stdin_analysis",
-            extra={"trace_id": trace, "run_id": trace, "text_length": len(text)},
+async def _write_outputs(
+    paths: _PathSet,
+    payload: dict[str, Any],
+    analysis: _Analysis,
+    opts: AnalyzeOptions,
+    logger: TraceAdapter,
+    log_extra: dict[str, Any],
+) -> None:
+    """Write the JSON payload and every export requested in `opts` to `paths`.
+
+    All outputs share one directory, created once up front. The writers are independent,
+    so each runs on a worker thread via `asyncio.to_thread` and they overlap with one
+    another (and, in batch mode, with other items' fetches); a failing writer is logged
+    as `export_failed` without stopping the others, and the first failure is re-raised
+    once all have finished. `log_extra` identifies the source in warnings (e.g. the URL
+    of a batch item).
+    """
+    _ensure_dir(paths.json)
+
+    doc = analysis.doc
+    tasks: dict[str, Callable[[], None]] = {
+        "json": functools.partial(_write_json, paths.json, payload),
+    }
+    if opts.export_parquet:
+        tasks["parquet"] = functools.partial(
+            _write_parquet, paths.parquet, payload, logger, log_extra
         )
-        doc, results, ctx, timing = asyncio.run(
-            pipeline.analyze_text(
-                text,
-                lang_override=lang_override,
-                auto_download=(
-                    models_auto_download
-                    if models_auto_download is not None
-                    else settings.models_auto_download
-                ),
-                default_language=settings.default_language or None,
-            )
+    if opts.export_spacy_json:
+        tasks["spacy_json"] = functools.partial(_write_spacy_json, paths.spacy_json, doc)
+    if opts.export_docbin:
+        tasks["docbin"] = functools.partial(_write_docbin, paths.docbin, doc)
+    if opts.export_conllu:
+        tasks["conllu"] = functools.partial(
+            _write_conllu, paths.conllu, analysis, opts, logger, log_extra
         )
 
-        payload = _results_to_json(
-            source_type="stdin",
-            source_value="<stdin>",
-            language_code=ctx["language"],
-            language_conf=float(ctx["confidence"]),
-            model_name=ctx["model"],
-            content_title="<stdin>",
-            content_word_count=len(text.split()),
-            content_char_count=len(text),
-            analyzers=results,
-            timing=timing,
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(task) for task in tasks.values()), return_exceptions=True
+    )
+    first_error: BaseException | None = None
+    for name, outcome in zip(tasks, outcomes, strict=True):
+        if not isinstance(outcome, BaseException):
+            continue
+        logger.error(
+            "export_failed",
+            extra={
+                **log_extra,
+                "export": name,
+                "error": str(outcome),
+            },
         )
+        if first_error is None:
+            first_error = outcome
+    if first_error is not None:
+        raise first_error
+
 
-        if stdout:
-            # Stream JSON to stdout for pipeline composition
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+def _run_analysis(
+    analysis_coro: Coroutine[Any, Any, _Analysis],
+    *,
+    source_type: str,
+    source_value: str,
+    output_base: str | None,
+    default_base: str,
+    opts: AnalyzeOptions,
+    settings: RookeenSettings,
+    logger: TraceAdapter,
+    event: str,
+    log_extra: dict[str, Any],
+) -> None:
+    """Run one analysis, emit its JSON and exports, and exit with the mapped error code.
+
+    Shared by `analyze_url`, `analyze_stdin` and `analyze_file`, which only differ in how
+    the analysis coroutine obtains its text. `event` names the start/finish log records.
+    """
+    effective_format = (opts.format_ or settings.format).lower()
+    paths = _PathSet.from_base(_normalize_output_base(output_base, default_base))
+
+    async def _analyze_and_emit() -> _Analysis:
+        # Analysis and output writing share one event loop
+        analysis = await analysis_coro
+        payload = _build_payload(source_type, source_value, analysis)
+        if opts.stdout:
+            # Stream JSON to stdout for pipeline composition; token-level exports are skipped
+            _print_json(payload)
         else:
-            _write_json(json_path, payload)
-            if export_parquet:
-                try:
-                    parquet_path = base + ".parquet"
-                    analyzers_to_parquet(payload["analyzers"], parquet_path)
-                except Exception as exc:
-                    logger.error(
-                        "parquet_export_failed", extra={"trace_id": trace, "error": str(exc)}
-                    )
-
-        # Optional token-level exports (skip when using stdout)
-        if not stdout:
-            if export_spacy_json:
-                spacy_json_path = _spacy_json_path_from_base(base)
-                _ensure_dir(spacy_json_path)
-                with open(spacy_json_path, "w", encoding="utf-8") as f:
-                    json.dump(doc_to_spacy_json(doc), f, ensure_ascii=False, indent=2)
-            if export_docbin:
-                docbin_path = _docbin_path_from_base(base)
-                _ensure_dir(docbin_path)
-                dump_docbin(doc, docbin_path)
-            if export_conllu:
-                conllu_path = _conllu_path_from_base(base)
-                _ensure_dir(conllu_path)
-                engine = (conllu_engine or "auto").lower()
-                if engine in ("auto", "stanza"):
-                    try:
-                        from rookeen.export.ud_conllu import text_to_conllu
-
-                        conllu_text = text_to_conllu(
-                            text, ctx["language"], auto_download=ud_auto_download
-                        )
-                        with open(conllu_path, "w", encoding="utf-8") as f:
-                            f.write(conllu_text)
-                    except Exception as e:
-                        if not allow_non_ud_conllu:
-                            raise RuntimeError(
-                                "Stanza engine unavailable; install 'rookeen[ud]' or pass --allow-non-ud-conllu --conllu-engine basic"
-                            ) from e
-                        logger.warning(
-                            "conllu_basic_fallback",
-                            extra={
-                                "trace_id": trace,
-                                "run_id": trace,
-                                "reason": str(e),
-                            },
-                        )
-                        with open(conllu_path, "w", encoding="utf-8") as f:
-                            f.write(doc_to_conllu(doc))
-                elif engine == "basic":
-                    logger.warning(
-                        "conllu_basic_non_ud",
-                        extra={
-                            "trace_id": trace,
-                            "run_id": trace,
-                            "recommendation": "Use --conllu-engine stanza for UD-compliant output",
-                        },
-                    )
-                    with open(conllu_path, "w", encoding="utf-8") as f:
-                        f.write(doc_to_conllu(doc))
+            await _write_outputs(paths, payload, analysis, opts, logger, {})
+        return analysis
+
+    try:
+        logger.debug(f"starting_{event}", extra=log_extra)
+        analysis = asyncio.run(_analyze_and_emit())
 
         if effective_format in ("md", "html", "all"):
             click.echo("Note: MD/HTML rendering not implemented in this step; JSON written.")
 
         logger.debug(
-            "finished_stdin_analysis",
+            f"finished_{event}",
             extra={
-                "trace_id": trace,
-                "run_id": trace,
-                "output": json_path if not stdout else "stdout",
-                "language": ctx["language"],
+                **log_extra,
+                "output": paths.json if not opts.stdout else "stdout",
+                "language": analysis.ctx["language"],
             },
         )
-        if not stdout:
-            click.echo(json_path)
+        if not opts.stdout:
+            click.echo(paths.json)
         sys.exit(EXIT_OK)
     except ValueError as ve:
-        logger.error("usage_error", extra={"trace_id": trace, "run_id": trace})
+        logger.error("usage_error")
         emit_and_exit(RookeenError(USAGE.code, USAGE.name, f"{ve}"))
     except RuntimeError as re:
         msg = str(re)
         if "spaCy model" in msg or "Installed '" in msg:
-            logger.error("model_error", extra={"trace_id": trace, "run_id": trace})
+            logger.error("model_error")
             emit_and_exit(RookeenError(MODEL.code, MODEL.name, msg))
-        logger.error("generic_error", extra={"trace_id": trace, "run_id": trace})
+        logger.error("generic_error")
         emit_and_exit(RookeenError(GENERIC.code, GENERIC.name, msg))
     except Exception as exc:
-        logger.error("generic_error", extra={"trace_id": trace, "run_id": trace})
+        if isinstance(exc, ClientError):
+            logger.error("fetch_error")
+            emit_and_exit(RookeenError(FETCH.code, FETCH.name, f"{exc}"))
+        logger.error("generic_error")
         emit_and_exit(RookeenError(GENERIC.code, GENERIC.name, f"{exc}"))
 
 
+def analyze_url(
+    url: str,
+    output_base: str | None,
+    opts: AnalyzeOptions,
+    settings: RookeenSettings,
+) -> None:
+    """Analyze a single URL."""
+    logger = _make_logger(opts.verbose, opts.trace_id or new_trace_id())
+    pipeline = _setup_pipeline(opts, settings)
+
+    _run_analysis(
+        _analyze_page(pipeline, url, opts, settings),
+        source_type="url",
+        source_value=url,
+        output_base=output_base,
+        default_base=_derive_output_base_from_url(url, settings.output_dir),
+        opts=opts,
+        settings=settings,
+        logger=logger,
+        event="analysis",
+        log_extra={"url": url},
+    )
+
+
+def analyze_stdin(
+    output_base: str | None,
+    opts: AnalyzeOptions,
+    settings: RookeenSettings,
+) -> None:
+    """Analyze text from stdin."""
+    logger = _make_logger(opts.verbose, opts.trace_id or new_trace_id())
+    pipeline = _setup_pipeline(opts, settings)
+
+    try:
+        # Read text from stdin
+        text = _read_stdin()
+    except Exception as exc:
+        logger.error("usage_error")
+        emit_and_exit(RookeenError(USAGE.code, USAGE.name, f"Failed to read from stdin: {exc}"))
+
+    _run_analysis(
+        _analyze_text(pipeline, text, "<stdin>", opts, settings),
+        source_type="stdin",
+        source_value="<stdin>",
+        output_base=output_base,
+        default_base=os.path.join(settings.output_dir, f"stdin_{_output_stamp()}"),
+        opts=opts,
+        settings=settings,
+        logger=logger,
+        event="stdin_analysis",
+        log_extra={"text_length": len(text)},
+    )
+
+
 def analyze_file(
     path: str,
     output_base: str | None,
-    format_: str | None,
-    lang_override: str | None,
-    preload_languages_csv: str | None,
-    models_auto_download: bool | None,
-    export_spacy_json: bool,
-    export_docbin: bool,
-    export_conllu: bool,
-    conllu_engine: str,
-    ud_auto_download: bool,
-    allow_non_ud_conllu: bool,
-    stdout: bool,
-    trace_id: str | None,
-    verbose: bool,
-    export_parquet: bool,
-    enable_embeddings: bool,
-    enable_sentiment: bool,
-    embeddings_backend: str | None,
-    embeddings_model: str | None,
-    openai_api_key: str | None,
-    embeddings_preload: bool,
-    enabled_analyzers: list[str] | None,
-    disabled_analyzers: list[str] | None,
+    opts: AnalyzeOptions,
     settings: RookeenSettings,
 ) -> None:
     """Analyze a local text file."""
-    logger = _make_logger(verbose)
-    trace = trace_id or new_trace_id()
-
-    # Persist CLI -> env for analyzer to resolve backend/model/api key
-    if embeddings_backend:
-        os.environ.setdefault("ROOKEEN_EMBEDDINGS_BACKEND", embeddings_backend)
-    if embeddings_model:
-        os.environ.setdefault("ROOKEEN_EMBEDDINGS_MODEL", embeddings_model)
-    if openai_api_key:
-        os.environ.setdefault("ROOKEEN_OPENAI_API_KEY", openai_api_key)
-
-    # Optional preload to avoid first-call latency
-    if embeddings_preload and (embeddings_backend or os.getenv("ROOKEEN_EMBEDDINGS_BACKEND")):
-        _maybe_preload_embeddings(
-            embeddings_backend or os.getenv("ROOKEEN_EMBEDDINGS_BACKEND"),
-            embeddings_model or os.getenv("ROOKEEN_EMBEDDINGS_MODEL"),
-            openai_api_key or os.getenv("ROOKEEN_OPENAI_API_KEY"),
-        )
-
-    effective_format = (format_ or settings.format).lower()
-    preload = (
-        _parse_languages_csv(preload_languages_csv)
-        if preload_languages_csv is not None
-        else list(settings.languages_preload)
-    )
-    pipeline = _build_pipeline(
-        preload,
-        enable_embeddings=enable_embeddings,
-        enable_sentiment=enable_sentiment,
-        enabled_analyzers=enabled_analyzers,
-        disabled_analyzers=disabled_analyzers,
-    )
+    logger = _make_logger(opts.verbose, opts.trace_id or new_trace_id())
+    pipeline = _setup_pipeline(opts, settings)
 
     try:
-        with open(path, encoding="utf-8") as f:
-            text = f.read()
+        with open(path, "rb") as f:
+            text = _decode_text(f.read())
     except Exception as exc:
-        logger.error("usage_error", extra={"trace_id": trace, "run_id": trace})
+        logger.error("usage_error")
         emit_and_exit(RookeenError(USAGE.code, USAGE.name, f"Failed to read file: {exc}"))
 
-    default_base = os.path.join(settings.output_dir, _slugify_filename(os.path.basename(path)))
-    base = _normalize_output_base(output_base, default_base)
-    json_path = _json_path_from_base(base)
+    abspath = os.path.abspath(path)
+    _run_analysis(
+        _analyze_text(pipeline, text, os.path.basename(path), opts, settings),
+        source_type="file",
+        source_value=abspath,
+        output_base=output_base,
+        default_base=os.path.join(settings.output_dir, _slugify_filename(os.path.basename(path))),
+        opts=opts,
+        settings=settings,
+        logger=logger,
+        event="file_analysis",
+        log_extra={"path": abspath},
+    )
 
-    try:
-        logger.debug(
-            "starting_file_analysis",
-            extra={"trace_id": trace, "run_id": trace, "path": os.path.abspath(path)},
-        )
-        doc, results, ctx, timing = asyncio.run(
-            pipeline.analyze_text(
-                text,
-                lang_override=lang_override,
-                auto_download=(
-                    models_auto_download
-                    if models_auto_download is not None
-                    else settings.models_auto_download
-                ),
-                default_language=settings.default_language or None,
-            )
-        )
 
-        payload = _results_to_json(
-            source_type="file",
-            source_value=os.path.abspath(path),
-            language_code=ctx["language"],
-            language_conf=float(ctx["confidence"]),
-            model_name=ctx["model"],
-            content_title=os.path.basename(path),
-            content_word_count=len(text.split()),
-            content_char_count=len(text),
-            analyzers=results,
-            timing=timing,
-        )
+# URLs fetched and then parsed together with one `nlp.pipe` call per language
+_BATCH_PARSE_SIZE = 16
+# Batch URLs processed between explicit garbage collections
+_BATCH_GC_EVERY = 32
 
-        if stdout:
-            # Stream JSON to stdout for pipeline composition
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
-        else:
-            _write_json(json_path, payload)
-            if export_parquet:
-                try:
-                    parquet_path = base + ".parquet"
-                    analyzers_to_parquet(payload["analyzers"], parquet_path)
-                except Exception as exc:
-                    logger.error(
-                        "parquet_export_failed", extra={"trace_id": trace, "error": str(exc)}
-                    )
-
-        # Optional token-level exports (skip when using stdout)
-        if not stdout:
-            if export_spacy_json:
-                spacy_json_path = _spacy_json_path_from_base(base)
-                _ensure_dir(spacy_json_path)
-                with open(spacy_json_path, "w", encoding="utf-8") as f:
-                    json.dump(doc_to_spacy_json(doc), f, ensure_ascii=False, indent=2)
-            if export_docbin:
-                docbin_path = _docbin_path_from_base(base)
-                _ensure_dir(docbin_path)
-                dump_docbin(doc, docbin_path)
-            if export_conllu:
-                conllu_path = _conllu_path_from_base(base)
-                _ensure_dir(conllu_path)
-                engine = (conllu_engine or "auto").lower()
-                if engine in ("auto", "stanza"):
-                    try:
-                        from rookeen.export.ud_conllu import text_to_conllu
-
-                        conllu_text = text_to_conllu(
-                            text, ctx["language"], auto_download=ud_auto_download
-                        )
-                        with open(conllu_path, "w", encoding="utf-8") as f:
-                            f.write(conllu_text)
-                    except Exception as e:
-                        if not allow_non_ud_conllu:
-                            raise RuntimeError(
-                                "Stanza engine unavailable; install 'rookeen[ud]' or pass --allow-non-ud-conllu --conllu-engine basic"
-                            ) from e
-                        logger.warning(
-                            "conllu_basic_fallback",
-                            extra={
-                                "trace_id": trace,
-                                "run_id": trace,
-                                "reason": str(e),
-                            },
-                        )
-                        with open(conllu_path, "w", encoding="utf-8") as f:
-                            f.write(doc_to_conllu(doc))
-                elif engine == "basic":
-                    logger.warning(
-                        "conllu_basic_non_ud",
-                        extra={
-                            "trace_id": trace,
-                            "run_id": trace,
-                            "recommendation": "Use --conllu-engine stanza for UD-compliant output",
-                        },
-                    )
-                    with open(conllu_path, "w", encoding="utf-8") as f:
-                        f.write(doc_to_conllu(doc))
 
-        if effective_format in ("md", "html", "all"):
-            click.echo("Note: MD/HTML rendering not implemented in this step; JSON written.")
+async def _export_batch_item(
+    url: str,
+    analysis: _Analysis,
+    output_dir: str,
+    opts: AnalyzeOptions,
+    logger: TraceAdapter,
+) -> str:
+    """Export one analyzed batch URL; returns the JSON output path."""
+    # Named once the fetch returns, so the timestamp reflects when the page was retrieved
+    base = os.path.join(
+        output_dir, _derive_output_base_from_url(url, output_dir).split("/", 1)[-1]
+    )
+    paths = _PathSet.from_base(base)
+    payload = _build_payload("url", url, analysis)
+    await _write_outputs(paths, payload, analysis, opts, logger, {"url": url})
+    logger.debug(
+        "finished_batch_item",
+        extra={
+            "url": url,
+            "output": paths.json,
+            "language": analysis.ctx["language"],
+        },
+    )
+    return paths.json
 
-        logger.debug(
-            "finished_file_analysis",
-            extra={
-                "trace_id": trace,
-                "run_id": trace,
-                "path": os.path.abspath(path),
-                "output": json_path if not stdout else "stdout",
-                "language": ctx["language"],
-            },
+
+async def _batch_async(
+    pipeline: AsyncLinguisticPipeline,
+    urls: list[str],
+    output_dir: str,
+    opts: AnalyzeOptions,
+    settings: RookeenSettings,
+    logger: TraceAdapter,
+    workers: int,
+) -> int:
+    """Process `urls` with up to `workers` fetches in flight; returns the failure count.
+
+    URLs are handled in chunks: a chunk's pages are fetched concurrently, then parsed
+    together through the shared spaCy model with `nlp.pipe` and analyzed per page. The
+    next chunk is fetched while the current one is analyzed and exported; the parse and
+    blocking analyzers run in worker threads, so only the in-loop analyzers share the
+    event loop with those fetches. `--rate-limit`
+    spaces requests to the same host, and fetch starts across all hosts are paced to
+    at most `max(1, --rate-limit)` per second. Output paths are echoed in input order.
+    """
+    sem = asyncio.BoundedSemaphore(workers)
+    # Overall pacing on top of the per-host spacing, never below one request a second
+    throttle = Throttle(max(1.0, opts.rate_limit))
+    chunk_size = max(_BATCH_PARSE_SIZE, workers)
+
+    async def fetch(url: str) -> WebPageContent:
+        async with sem, throttle:
+            logger.debug(
+                "starting_batch_item",
+                extra={"url": url},
+            )
+            return await pipeline.fetch_web_page(
+                url, rate_limit=opts.rate_limit, robots_policy=opts.robots_policy
+            )
+
+    def fetch_chunk(chunk: list[str]) -> asyncio.Future[list[Any]]:
+        return asyncio.gather(*(fetch(url) for url in chunk), return_exceptions=True)
+
+    async def analyze_chunk(chunk: list[str], fetched: list[Any]) -> list[Any]:
+        ok = [i for i, c in enumerate(fetched) if not isinstance(c, BaseException)]
+        analyzed = await pipeline.analyze_web_pages(
+            [fetched[i] for i in ok],
+            lang_override=opts.lang_override,
+            auto_download=_auto_download(opts, settings),
+            default_language=settings.default_language or None,
+            batch_size=_BATCH_PARSE_SIZE,
         )
-        if not stdout:
-            click.echo(json_path)
-        sys.exit(EXIT_OK)
-    except ValueError as ve:
-        logger.error("usage_error", extra={"trace_id": trace, "run_id": trace})
-        emit_and_exit(RookeenError(USAGE.code, USAGE.name, f"{ve}"))
-    except RuntimeError as re:
-        msg = str(re)
-        if "spaCy model" in msg or "Installed '" in msg:
-            logger.error("model_error", extra={"trace_id": trace, "run_id": trace})
-            emit_and_exit(RookeenError(MODEL.code, MODEL.name, msg))
-        logger.error("generic_error", extra={"trace_id": trace, "run_id": trace})
-        emit_and_exit(RookeenError(GENERIC.code, GENERIC.name, msg))
-    except Exception as exc:
-        logger.error("generic_error", extra={"trace_id": trace, "run_id": trace})
-        emit_and_exit(RookeenError(GENERIC.code, GENERIC.name, f"{exc}"))
+        outcomes: list[Any] = list(fetched)
+        exports: dict[int, Coroutine[Any, Any, str]] = {}
+        for i, item in zip(ok, analyzed, strict=True):
+            if isinstance(item, BaseException):
+                outcomes[i] = item
+            else:
+                analysis = _page_analysis(fetched[i], *item)
+                exports[i] = _export_batch_item(chunk[i], analysis, output_dir, opts, logger)
+        exported = await asyncio.gather(*exports.values(), return_exceptions=True)
+        for i, res in zip(exports, exported, strict=True):
+            outcomes[i] = res
+        return outcomes
+
+    failures = 0
+    processed_since_gc = 0
+    chunks = [urls[i : i + chunk_size] for i in range(0, len(urls), chunk_size)]
+    # One HTTP session for the whole batch, so connections are reused across URLs
+    async with pipeline.session_scope(workers):
+        next_fetch: asyncio.Future[list[Any]] | None = None
+        try:
+            for n, chunk in enumerate(chunks):
+                fetched = await (next_fetch or fetch_chunk(chunk))
+                next_fetch = fetch_chunk(chunks[n + 1]) if n + 1 < len(chunks) else None
+                outcomes = await analyze_chunk(chunk, fetched)
+                # The chunk's Docs are released with analyze_chunk; drop the fetched pages
+                # too instead of holding them while the next chunk downloads
+                del fetched
+                for url, outcome in zip(chunk, outcomes, strict=True):
+                    if isinstance(outcome, BaseException):
+                        failures += 1
+                        logger.error(
+                            "batch_item_error",
+                            extra={"url": url, "error": str(outcome)},
+                        )
+                    else:
+                        click.echo(outcome)
+                # Reclaim cyclic garbage left by parsing and exports at a fixed pace, so
+                # RSS stays flat on long URL lists
+                processed_since_gc += len(chunk)
+                if processed_since_gc >= _BATCH_GC_EVERY:
+                    gc.collect()
+                    processed_since_gc = 0
+        finally:
+            if next_fetch is not None:
+                next_fetch.cancel()
+    return failures
+
+
+def _eager_event_loop() -> asyncio.AbstractEventLoop:
+    loop = asyncio.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
 
 
 def batch_analyze(
     url_list_file: str,
     output_dir: str | None,
-    format_: str | None,
-    lang_override: str | None,
-    preload_languages_csv: str | None,
-    models_auto_download: bool | None,
-    export_spacy_json: bool,
-    export_docbin: bool,
-    export_conllu: bool,
-    conllu_engine: str,
-    ud_auto_download: bool,
-    allow_non_ud_conllu: bool,
-    trace_id: str | None,
-    verbose: bool,
-    export_parquet: bool,
-    rate_limit: float,
-    robots_policy: str,
-    enable_embeddings: bool,
-    enable_sentiment: bool,
-    embeddings_backend: str | None,
-    embeddings_model: str | None,
-    openai_api_key: str | None,
-    embeddings_preload: bool,
-    enabled_analyzers: list[str] | None,
-    disabled_analyzers: list[str] | None,
+    opts: AnalyzeOptions,
     settings: RookeenSettings,
 ) -> None:
-    """Analyze a list of URLs from a file (one per line; '#' comments allowed)."""
-    logger = _make_logger(verbose)
-    trace = trace_id or new_trace_id()
+    """Analyze a list of URLs from a file (one per line; '#' comments allowed).
+
+    Items run as tasks on one event loop with the eager task factory, so an item whose
+    awaits resolve immediately (e.g. robots.txt already cached) finishes without extra
+    trips through the scheduler; this is the preferred path for large URL lists.
+    """
+    logger = _make_logger(opts.verbose, opts.trace_id or new_trace_id())
     effective_output_dir = output_dir or settings.output_dir
     # effective_format = (format_ or settings.format).lower()
 
-    # Persist CLI -> env for analyzer to resolve backend/model/api key
-    if embeddings_backend:
-        os.environ.setdefault("ROOKEEN_EMBEDDINGS_BACKEND", embeddings_backend)
-    if embeddings_model:
-        os.environ.setdefault("ROOKEEN_EMBEDDINGS_MODEL", embeddings_model)
-    if openai_api_key:
-        os.environ.setdefault("ROOKEEN_OPENAI_API_KEY", openai_api_key)
-
-    # Optional preload to avoid first-call latency
-    if embeddings_preload and (embeddings_backend or os.getenv("ROOKEEN_EMBEDDINGS_BACKEND")):
-        _maybe_preload_embeddings(
-            embeddings_backend or os.getenv("ROOKEEN_EMBEDDINGS_BACKEND"),
-            embeddings_model or os.getenv("ROOKEEN_EMBEDDINGS_MODEL"),
-            openai_api_key or os.getenv("ROOKEEN_OPENAI_API_KEY"),
-        )
-
-    preload = (
-        _parse_languages_csv(preload_languages_csv)
-        if preload_languages_csv is not None
-        else list(settings.languages_preload)
-    )
-    pipeline = _build_pipeline(
-        preload,
-        enable_embeddings=enable_embeddings,
-        enable_sentiment=enable_sentiment,
-        enabled_analyzers=enabled_analyzers,
-        disabled_analyzers=disabled_analyzers,
-    )
+    pipeline = _setup_pipeline(opts, settings)
 
     try:
+        # Stream the file, keeping only the URL lines
         with open(url_list_file, encoding="utf-8") as f:
-            lines = [ln.strip() for ln in f.readlines()]
+            urls = [s for s in (ln.strip() for ln in f) if s and not s.startswith("#")]
     except Exception as exc:
-        logger.error("usage_error", extra={"trace_id": trace, "run_id": trace})
+        logger.error("usage_error")
         emit_and_exit(RookeenError(USAGE.code, USAGE.name, f"Failed to read URL list: {exc}"))
 
-    urls = [ln for ln in lines if ln and not ln.startswith("#")]
+    # Analyze each URL once, keeping first-occurrence order
+    listed = len(urls)
+    urls = list(dict.fromkeys(urls))
+    if len(urls) < listed:
+        logger.info("batch_urls_deduplicated", extra={"deduplicated": listed - len(urls)})
+
     if not urls:
-        logger.error("usage_error", extra={"trace_id": trace, "run_id": trace})
+        logger.error("usage_error")
         emit_and_exit(RookeenError(USAGE.code, USAGE.name, "No URLs to process."))
 
     os.makedirs(effective_output_dir, exist_ok=True)
 
-    failures = 0
-    for url in urls:
-        base = os.path.join(
+    failures = asyncio.run(
+        _batch_async(
+            pipeline,
+            urls,
             effective_output_dir,
-            _derive_output_base_from_url(url, effective_output_dir).split("/", 1)[-1],
-        )
-        json_path = _json_path_from_base(base)
-        try:
-            logger.debug(
-                "starting_batch_item",
-                extra={"trace_id": trace, "run_id": trace, "url": url},
-            )
-            content, doc, results, ctx, timing = asyncio.run(
-                pipeline.analyze_web_page(
-                    url,
-                    lang_override=lang_override,
-                    auto_download=(
-                        models_auto_download
-                        if models_auto_download is not None
-                        else settings.models_auto_download
-                    ),
-                    default_language=settings.default_language or None,
-                    rate_limit=rate_limit,
-                    robots_policy=robots_policy,
-                )
-            )
-            payload = _results_to_json(
-                source_type="url",
-                source_value=url,
-                language_code=ctx["language"],
-                language_conf=float(ctx["confidence"]),
-                model_name=ctx["model"],
-                content_title=content.title,
-                content_word_count=content.word_count,
-                content_char_count=content.char_count,
-                analyzers=results,
-                timing=timing,
-            )
-            _write_json(json_path, payload)
-            if export_parquet:
-                try:
-                    parquet_path = base + ".parquet"
-                    analyzers_to_parquet(payload["analyzers"], parquet_path)
-                except Exception as exc:
-                    logger.error(
-                        "parquet_export_failed",
-                        extra={"trace_id": trace, "url": url, "error": str(exc)},
-                    )
-            if export_spacy_json:
-                spacy_json_path = _spacy_json_path_from_base(base)
-                _ensure_dir(spacy_json_path)
-                with open(spacy_json_path, "w", encoding="utf-8") as f:
-                    json.dump(doc_to_spacy_json(doc), f, ensure_ascii=False, indent=2)
-            if export_docbin:
-                docbin_path = _docbin_path_from_base(base)
-                _ensure_dir(docbin_path)
-                dump_docbin(doc, docbin_path)
-            if export_conllu:
-                conllu_path = _conllu_path_from_base(base)
-                _ensure_dir(conllu_path)
-                engine = (conllu_engine or "auto").lower()
-                if engine in ("auto", "stanza"):
-                    try:
-                        from rookeen.export.ud_conllu import text_to_conllu
-
-                        raw_text = content.text
-                        conllu_text = text_to_conllu(
-                            raw_text, ctx["language"], auto_download=ud_auto_download
-                        )
-                        with open(conllu_path, "w", encoding="utf-8") as f:
-                            f.write(conllu_text)
-                    except Exception as e:
-                        if not allow_non_ud_conllu:
-                            raise RuntimeError(
-                                "Stanza engine unavailable; install 'rookeen[ud]' or pass --allow-non-ud-conllu --conllu-engine basic"
-                            ) from e
-                        logger.warning(
-                            "conllu_basic_fallback",
-                            extra={
-                                "trace_id": trace,
-                                "run_id": trace,
-                                "reason": str(e),
-                                "url": url,
-                            },
-                        )
-                        with open(conllu_path, "w", encoding="utf-8") as f:
-                            f.write(doc_to_conllu(doc))
-                elif engine == "basic":
-                    logger.warning(
-                        "conllu_basic_non_ud",
-                        extra={
-                            "trace_id": trace,
-                            "run_id": trace,
-                            "recommendation": "Use --conllu-engine stanza for UD-compliant output",
-                            "url": url,
-                        },
-                    )
-                    with open(conllu_path, "w", encoding="utf-8") as f:
-                        f.write(doc_to_conllu(doc))
-            logger.debug(
-                "finished_batch_item",
-                extra={
-                    "trace_id": trace,
-                    "run_id": trace,
-                    "url": url,
-                    "output": json_path,
-                    "language": ctx["language"],
-                },
-            )
-            click.echo(json_path)
-        except Exception as exc:
-            failures += 1
-            logger.error(
-                "batch_item_error",
-                extra={"trace_id": trace, "run_id": trace, "url": url, "error": str(exc)},
-            )
+            opts,
+            settings,
+            logger,
+            workers=max(1, settings.concurrency),
+        ),
+        loop_factory=_eager_event_loop,
+    )
 
     sys.exit(EXIT_OK if failures == 0 else EXIT_GENERIC)
 
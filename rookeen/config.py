@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import copy
+import functools
 import os
 import tomllib
+from dataclasses import dataclass
+from importlib import metadata
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -35,6 +39,49 @@ class RookeenSettings(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
 
+@functools.cache
+def _get_version() -> str:
+    """Installed rookeen version; the distribution metadata is looked up only once."""
+    try:
+        return metadata.version("rookeen")
+    except Exception:
+        return "0.1.0"
+
+
+@dataclass(frozen=True, slots=True)
+class AnalyzeOptions:
+    """Per-invocation options shared by the analyze, analyze-file and batch commands.
+
+    Unset values (None) fall back to RookeenSettings; fields a command does not expose
+    keep their defaults (e.g. `stdout` for batch, `rate_limit` for analyze-file).
+    """
+
+    format_: str | None = None
+    lang_override: str | None = None
+    preload_languages_csv: str | None = None
+    models_auto_download: bool | None = None
+    export_spacy_json: bool = False
+    export_docbin: bool = False
+    export_conllu: bool = False
+    conllu_engine: str = "auto"
+    ud_auto_download: bool = True
+    allow_non_ud_conllu: bool = False
+    stdout: bool = False
+    export_parquet: bool = False
+    rate_limit: float = 0.5
+    robots_policy: str = "respect"
+    trace_id: str | None = None
+    verbose: bool = False
+    enable_embeddings: bool = False
+    enable_sentiment: bool = False
+    embeddings_backend: str | None = None
+    embeddings_model: str | None = None
+    openai_api_key: str | None = None
+    embeddings_preload: bool = False
+    enabled_analyzers: tuple[str, ...] = ()
+    disabled_analyzers: tuple[str, ...] = ()
+
+
 def _parse_bool(value: str) -> bool:
     truthy = {"1", "true", "yes", "on", "y", "t"}
     falsy = {"0", "false", "no", "off", "n", "f"}
@@ -50,15 +97,30 @@ def _parse_list_csv(value: str) -> list[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
 
 
+# Parsed config tables by real path, with the (mtime_ns, size) they were read at
+_TOML_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
 def _load_toml_config(config_path: str | None) -> dict[str, Any]:
+    """Return the settings table of a TOML config file.
+
+    Parsed files are cached and reused until their modification time or size changes;
+    callers always receive their own copy.
+    """
     if not config_path:
         return {}
-    with open(config_path, "rb") as f:
-        data = tomllib.load(f)
-    # Support either flat keys or under a [rookeen] table
-    if isinstance(data, dict) and "rookeen" in data and isinstance(data["rookeen"], dict):
-        return dict(data["rookeen"])  # copy
-    return dict(data)
+    real = os.path.realpath(config_path)
+    st = os.stat(real)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _TOML_CACHE.get(real)
+    if cached is None or cached[0] != stamp:
+        with open(real, "rb") as f:
+            data = tomllib.load(f)
+        # Support either flat keys or under a [rookeen] table
+        if isinstance(data, dict) and "rookeen" in data and isinstance(data["rookeen"], dict):
+            data = data["rookeen"]
+        cached = _TOML_CACHE[real] = (stamp, data)
+    return copy.deepcopy(cached[1])
 
 
 def _apply_env_overrides(base: dict[str, Any], env_prefix: str = "ROOKEEN_") -> dict[str, Any]:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import io
+from functools import lru_cache
 from typing import Any
 
 from spacy.tokens import Doc
@@ -39,6 +41,10 @@ _SPACY_TO_UD_DEPREL: dict[str, str] = {
 }
 
 
+# Punctuation features are left out of FEATS
+_SKIPPED_FEATS = frozenset({"PunctType", "PunctSide"})
+
+
 def _get_morphological_features(token: Any, ud_pos: str | None = None) -> str:
     """
     Extract basic morphological features for UD FEATS column.
@@ -46,30 +52,34 @@ def _get_morphological_features(token: Any, ud_pos: str | None = None) -> str:
     This avoids overcommitting incorrect features.
     """
     try:
-        morph_str = str(token.morph)
-        if morph_str and morph_str != "{}":
-            feats: list[str] = []
-            for feat_pair in morph_str.strip("{}").split("|"):
-                if "=" in feat_pair:
-                    key, value = feat_pair.split("=", 1)
-                    if key not in ["PunctType", "PunctSide"]:
-                        feats.append(f"{key}={value}")
-            return "|".join(feats) if feats else "_"
+        # MorphAnalysis.to_dict maps each field to its (comma-joined) value in the same
+        # order as str(token.morph), without formatting and re-parsing that string
+        feats = [
+            f"{key}={value}"
+            for key, value in token.morph.to_dict().items()
+            if key not in _SKIPPED_FEATS
+        ]
+        return "|".join(feats) if feats else "_"
     except Exception:
         pass
     return "_"
 
 
-def _get_ud_deprel(token: Any, non_space_tokens: list[Any]) -> str:
+@lru_cache(maxsize=128)
+def _base_ud_deprel(spacy_dep: str) -> str:
+    """UD label for a spaCy dependency label, before context-aware corrections.
+
+    Documents use only a handful of distinct labels, so the result is cached.
+    """
+    return _SPACY_TO_UD_DEPREL.get(spacy_dep) or spacy_dep.lower()
+
+
+def _get_ud_deprel(token: Any) -> str:
     """
     Get UD-compliant dependency relation with context awareness.
     For example, obl vs nmod depends on the head's POS and context.
     """
-    spacy_dep = token.dep_
-    if spacy_dep in _SPACY_TO_UD_DEPREL:
-        ud_dep = _SPACY_TO_UD_DEPREL[spacy_dep]
-    else:
-        ud_dep = spacy_dep.lower()
+    ud_dep = _base_ud_deprel(token.dep_)
 
     # Context-aware corrections for prepositional phrases
     if ud_dep == "obl" and token.head:
@@ -98,17 +108,20 @@ def _get_ud_pos_and_tag(token: Any) -> tuple[str, str]:
     return token.pos_, token.tag_
 
 
+_CONLLU_FIELD_TRANS = str.maketrans({"\t": " ", "\n": " ", "\r": " "})
+
+
 def _escape_conllu_field(text: str) -> str:
     """
     Escape special characters in CoNLL-U fields.
     According to CoNLL-U spec, tabs and newlines should be avoided in fields.
     Also handle empty/whitespace-only strings.
     """
-    if not text or not text.strip():
+    stripped = text.strip()
+    if not stripped:
         return "_"
-    # Replace tabs with spaces, as tabs are field separators
-    # Strip leading/trailing whitespace
-    return text.strip().replace("\t", " ").replace("\n", " ").replace("\r", " ")
+    # Replace tabs (the field separator) and line breaks with spaces in one pass
+    return stripped.translate(_CONLLU_FIELD_TRANS)
 
 
 def doc_to_conllu(doc: Doc) -> str:
@@ -121,53 +134,54 @@ def doc_to_conllu(doc: Doc) -> str:
     Returns:
         String containing CoNLL-U formatted text
     """
-    lines = []
+    # Lines are written straight into one buffer, each terminated by a newline
+    buf = io.StringIO()
+    w = buf.write
 
     # Header comments warning about non-compliance of the basic exporter
-    lines.append("# NOTE: Heuristic spaCy-based CoNLL-U serializer (basic engine)")
-    lines.append("# This output is not guaranteed to be UD-valid for complex texts.")
-    lines.append(
-        "# Prefer the UD-native engine via --conllu-engine stanza for standards-compliant output."
-    )
+    w("# NOTE: Heuristic spaCy-based CoNLL-U serializer (basic engine)\n")
+    w("# This output is not guaranteed to be UD-valid for complex texts.\n")
+    w("# Prefer the UD-native engine via --conllu-engine stanza for standards-compliant output.\n")
 
     # Handle case where document has no sentence segmentation
     sentences = list(doc.sents) if doc.has_annotation("SENT_START") else [doc]
 
     for sent_id, sent in enumerate(sentences):
         # Add sentence-level comments
-        lines.append(f"# sent_id = {sent_id}")
-        lines.append(f"# text = {_escape_conllu_field(sent.text)}")
+        w(f"# sent_id = {sent_id}\n")
+        w(f"# text = {_escape_conllu_field(sent.text)}\n")
 
         # Filter out space tokens using spaCy's is_space flag
         non_space_tokens = [t for t in sent if not t.is_space]
+        # CoNLL-U ID of each kept token, keyed by its position in the Doc. Token objects
+        # are created per access, so lookups go through `token.i` rather than identity.
+        conllu_id = {t.i: i for i, t in enumerate(non_space_tokens, start=1)}
 
         # Build token data with corrected dependencies
         token_data = []
+        data_by_i: dict[int, dict[str, Any]] = {}
         for i, token in enumerate(non_space_tokens, start=1):
             # Get UD-compliant POS and tag
             ud_pos, ud_xpos = _get_ud_pos_and_tag(token)
 
             # Calculate head index - will be corrected below for PP structures
-            if token.dep_ == "ROOT":
+            if token.dep_ == "ROOT" or not token.head:
                 head_idx = 0
-            elif token.head and token.head in non_space_tokens:
-                head_idx = non_space_tokens.index(token.head) + 1
             else:
-                head_idx = 0
+                head_idx = conllu_id.get(token.head.i, 0)
 
             # Get UD-compliant deprel
-            ud_deprel = _get_ud_deprel(token, non_space_tokens)
-
-            token_data.append(
-                {
-                    "index": i,
-                    "token": token,
-                    "head_idx": head_idx,
-                    "ud_pos": ud_pos,
-                    "ud_xpos": ud_xpos,
-                    "ud_deprel": ud_deprel,
-                }
-            )
+            ud_deprel = _get_ud_deprel(token)
+
+            data_by_i[token.i] = {
+                "index": i,
+                "token": token,
+                "head_idx": head_idx,
+                "ud_pos": ud_pos,
+                "ud_xpos": ud_xpos,
+                "ud_deprel": ud_deprel,
+            }
+            token_data.append(data_by_i[token.i])
 
         # Fix prepositional phrase dependencies
         # When we have: noun <- prep <- ADP, ADP <- pobj <- noun
@@ -177,12 +191,12 @@ def doc_to_conllu(doc: Doc) -> str:
             # Check for pobj that depends on ADP (preposition)
             if token.dep_ == "pobj" and token.head and token.head.pos_ == "ADP" and token.head.head:
                 # Find the preposition in token_data
-                prep_data = next((d for d in token_data if d["token"] == token.head), None)
+                prep_data = data_by_i.get(token.head.i)
                 if prep_data:
                     # Change pobj to nmod, pointing to the preposition's head (the noun)
-                    grandparent = token.head.head
-                    if grandparent in non_space_tokens:
-                        data["head_idx"] = non_space_tokens.index(grandparent) + 1
+                    grandparent_id = conllu_id.get(token.head.head.i)
+                    if grandparent_id is not None:
+                        data["head_idx"] = grandparent_id
                         data["ud_deprel"] = "nmod"
 
                         # Change preposition deprel to case, pointing to the noun
@@ -195,13 +209,22 @@ def doc_to_conllu(doc: Doc) -> str:
         # to root and attach the copula with deprel 'cop'. Reattach subjects and
         # other dependents of the copula to the promoted predicate.
         try:
-            root_data = next((d for d in token_data if d["token"].dep_ == "ROOT"), None)
+            # One pass finds the root, the 'attr' candidates and each token's dependents
+            root_data = None
+            attrs: list[dict[str, Any]] = []
+            deps_by_head: dict[int, list[dict[str, Any]]] = {}
+            for d in token_data:
+                dep = d["token"].dep_
+                if dep == "ROOT":
+                    if root_data is None:
+                        root_data = d
+                elif dep == "attr":
+                    attrs.append(d)
+                deps_by_head.setdefault(d["head_idx"], []).append(d)
             attr_pred = None
             if root_data and root_data["token"].pos_ in ("AUX", "VERB"):
-                for d in token_data:
-                    if d["token"].dep_ == "attr" and d["token"].head == root_data["token"]:
-                        attr_pred = d
-                        break
+                root_i = root_data["token"].i
+                attr_pred = next((d for d in attrs if d["token"].head.i == root_i), None)
             if root_data and attr_pred:
                 original_root_idx = root_data["index"]
                 promoted_idx = attr_pred["index"]
@@ -212,10 +235,8 @@ def doc_to_conllu(doc: Doc) -> str:
                 root_data["head_idx"] = promoted_idx
                 root_data["ud_deprel"] = "cop"
                 # Reattach dependents that previously pointed to the copula root
-                for d in token_data:
-                    if d is root_data:
-                        continue
-                    if d["head_idx"] == original_root_idx:
+                for d in deps_by_head.get(original_root_idx, ()):
+                    if d is not root_data and d is not attr_pred:
                         d["head_idx"] = promoted_idx
         except Exception:
             # Best-effort normalization; ignore if anything unexpected occurs
@@ -225,33 +246,24 @@ def doc_to_conllu(doc: Doc) -> str:
         for data in token_data:
             token = data["token"]
 
-            # Build MISC field with SpaceAfter information
-            misc_parts = []
-            if not token.whitespace_:
-                misc_parts.append("SpaceAfter=No")
-            misc = "|".join(misc_parts) if misc_parts else "_"
-
-            # Build CoNLL-U fields (10 columns)
-            fields = [
-                str(data["index"]),  # ID
-                _escape_conllu_field(token.text),  # FORM
-                _escape_conllu_field(token.lemma_),  # LEMMA
-                data["ud_pos"],  # UPOS
-                data["ud_xpos"],  # XPOS
-                _get_morphological_features(token, data["ud_pos"]),  # FEATS
-                str(data["head_idx"]),  # HEAD
-                data["ud_deprel"],  # DEPREL
-                "_",  # DEPS (enhanced, empty)
-                misc,  # MISC
-            ]
-
-            lines.append("\t".join(fields))
+            # MISC field carries SpaceAfter information
+            misc = "_" if token.whitespace_ else "SpaceAfter=No"
+            ud_pos = data["ud_pos"]
+
+            # 10 columns: ID FORM LEMMA UPOS XPOS FEATS HEAD DEPREL DEPS(empty) MISC
+            w(
+                f"{data['index']}\t"
+                f"{_escape_conllu_field(token.text)}\t"
+                f"{_escape_conllu_field(token.lemma_)}\t"
+                f"{ud_pos}\t"
+                f"{data['ud_xpos']}\t"
+                f"{_get_morphological_features(token, ud_pos)}\t"
+                f"{data['head_idx']}\t"
+                f"{data['ud_deprel']}\t_\t{misc}\n"
+            )
 
         # Add blank line between sentences
-        lines.append("")
+        w("\n")
 
-    # Join with newlines, ensuring final empty line
-    result = "\n".join(lines)
-    if not result.endswith("\n\n"):
-        result += "\n"
-    return result
+    # Every line, including the blank one closing the last sentence, ends with a newline
+    return buf.getvalue()
@@ -7,7 +7,12 @@ def dump_docbin(doc: Doc, path: str) -> None:
     """Serialize a single spaCy Doc into a DocBin file on disk.
 
     The DocBin stores user data to preserve analyzer-specific extensions when present.
+    `DocBin.to_bytes` is already zlib-compressed; the bytes are produced before the
+    file is opened, so a serialization error leaves no empty file behind.
     """
     db = DocBin(store_user_data=True)
     db.add(doc)
-    db.to_disk(path)
+    data = db.to_bytes()
+    del db
+    with open(path, "wb") as f:
+        f.write(data)
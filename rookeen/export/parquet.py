@@ -12,17 +12,25 @@ except ImportError as e:
     ) from e
 
 
-def analyzers_to_parquet(analyzers: list[dict[str, Any]], path: str) -> None:
+def analyzers_to_parquet(
+    analyzers: list[dict[str, Any]],
+    path: str,
+    compression: str = "zstd",
+    compression_level: int | None = 3,
+) -> None:
     """
     Export a list of analyzer summary dicts to a Parquet file.
 
     Each analyzer dict should have keys: 'name', 'processing_time', 'confidence', 'results' (a dict), and optionally 'metadata' (a dict with 'model' and 'language').
-    Only flat, scalar values from 'results' are exported (int, float, str, bool).
+    Only flat, scalar values from 'results' are exported (int, float, str, bool), one
+    column per key seen in any analyzer; rows without the key hold null.
     If present, 'metadata.model' and 'metadata.language' are exported as columns.
 
     Args:
         analyzers: List of analyzer summary dicts.
         path: Output Parquet file path.
+        compression: Parquet codec (zstd by default; e.g. "snappy" or "none").
+        compression_level: Codec level, or None for the codec default.
     Raises:
         ValueError: If analyzers is not a list of dicts.
         IOError: If writing to the file fails.
@@ -30,39 +38,64 @@ def analyzers_to_parquet(analyzers: list[dict[str, Any]], path: str) -> None:
     logger = logging.getLogger("rookeen.export.parquet")
     if not isinstance(analyzers, list):
         raise ValueError("'analyzers' must be a list of dicts.")
-    rows: list[dict[str, Any]] = []
-    for a in analyzers:
-        # if not isinstance(a, dict):
-        #     logger.warning("Skipping non-dict analyzer entry: %r", a)
-        #     continue
-        r = {
-            "name": a.get("name"),
-            "processing_time": a.get("processing_time"),
-            "confidence": a.get("confidence"),
-        }
+    # Build columns directly (one list per column, None for missing cells) instead of
+    # per-row dicts; columns appear in first-seen order across all analyzers
+    n_rows = len(analyzers)
+    columns: dict[str, list[Any]] = {
+        "name": [],
+        "processing_time": [],
+        "confidence": [],
+        "metadata.model": [],
+        "metadata.language": [],
+    }
+    for i, a in enumerate(analyzers):
+        columns["name"].append(a.get("name"))
+        columns["processing_time"].append(a.get("processing_time"))
+        columns["confidence"].append(a.get("confidence"))
         # Add metadata columns if present
         metadata = a.get("metadata", {})
         if isinstance(metadata, dict):
-            r["metadata.model"] = metadata.get("model")
             lang = metadata.get("language")
+            columns["metadata.model"].append(metadata.get("model"))
             # language may be a dict or str
-            if isinstance(lang, dict):
-                r["metadata.language"] = lang.get("code")
-            else:
-                r["metadata.language"] = lang
+            columns["metadata.language"].append(
+                lang.get("code") if isinstance(lang, dict) else lang
+            )
         else:
-            r["metadata.model"] = None
-            r["metadata.language"] = None
+            columns["metadata.model"].append(None)
+            columns["metadata.language"].append(None)
         for k, v in a.get("results", {}).items():
             if isinstance(v, int | float | str | bool):
-                r[f"results.{k}"] = v
-        rows.append(r)
-    if not rows:
+                col = columns.get(f"results.{k}")
+                if col is None:
+                    col = columns[f"results.{k}"] = [None] * n_rows
+                col[i] = v
+    if not n_rows:
         logger.warning("No valid analyzer rows to export.")
     try:
-        table = pa.Table.from_pylist(rows)
-        pq.write_table(table, path)
-        logger.info("Wrote %d analyzer rows to Parquet: %s", len(rows), path)
+        table = pa.Table.from_pydict({name: _to_array(values) for name, values in columns.items()})
+        # Analyzer tables are small: one row group holds them all
+        pq.write_table(
+            table,
+            path,
+            compression=compression,
+            compression_level=compression_level,
+            row_group_size=max(1, min(n_rows, 10_000)),
+            use_dictionary=True,
+            write_statistics=True,
+        )
+        logger.info("Wrote %d analyzer rows to Parquet: %s", n_rows, path)
     except Exception as exc:
         logger.error("Failed to write Parquet: %s", exc)
         raise OSError(f"Failed to write Parquet file: {exc}") from exc
+
+
+def _to_array(values: list[Any]) -> pa.Array:
+    """Arrow array for one column, falling back to strings for mixed scalar types.
+
+    The same result key may hold e.g. a bool in one analyzer and a str in another.
+    """
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
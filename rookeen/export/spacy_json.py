@@ -2,31 +2,56 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 from spacy.tokens import Doc
 
+# Token attributes read with one `Doc.to_array` call, in column order
+_TOKEN_ATTRS: list[int | str] = [
+    "ORTH",
+    "LEMMA",
+    "POS",
+    "TAG",
+    "DEP",
+    "HEAD",
+    "ENT_TYPE",
+    "SPACY",
+    "IDX",
+]
+
 
 def doc_to_spacy_json(doc: Doc) -> dict[str, Any]:
     """Convert a spaCy Doc into a JSON-serializable structure.
 
     The structure includes document text, token-level attributes, and entities.
     This mirrors common expectations for downstream analytics and is stable across languages.
+    Token attributes are extracted as one array and string ids resolved through the
+    vocab's StringStore, rather than reading each attribute off a Token object.
     """
-    tokens: list[dict[str, Any]] = []
-    for i, tok in enumerate(doc):
-        tokens.append(
-            {
-                "id": i,
-                "text": tok.text,
-                "lemma": tok.lemma_,
-                "pos": tok.pos_,
-                "tag": tok.tag_,
-                "dep": tok.dep_,
-                "head": tok.head.i,
-                "ent_type": tok.ent_type_,
-                "whitespace": tok.whitespace_,
-                "idx": tok.idx,
-            }
+    strings = doc.vocab.strings
+    arr = doc.to_array(_TOKEN_ATTRS)
+    # HEAD is stored as a relative offset
+    heads = (np.arange(len(arr), dtype=np.int64) + arr[:, 5].astype(np.int64)).tolist()
+    # Resolve each distinct string id once
+    ids = arr[:, [0, 1, 2, 3, 4, 6]]
+    text_of = {i: strings[i] for i in np.unique(ids).tolist()}
+    cols = arr.T.tolist()
+    tokens: list[dict[str, Any]] = [
+        {
+            "id": i,
+            "text": text_of[orth],
+            "lemma": text_of[lemma],
+            "pos": text_of[pos],
+            "tag": text_of[tag],
+            "dep": text_of[dep],
+            "head": head,
+            "ent_type": text_of[ent],
+            "whitespace": " " if space else "",
+            "idx": idx,
+        }
+        for i, (orth, lemma, pos, tag, dep, _, ent, space, idx, head) in enumerate(
+            zip(*cols, heads, strict=True)
         )
+    ]
 
     ents: list[dict[str, Any]] = [
         {"start": ent.start, "end": ent.end, "label": ent.label_} for ent in doc.ents
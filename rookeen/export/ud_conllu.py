@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import gc
 import os
 import threading
+from collections import OrderedDict
 from typing import Any
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Cache of initialized Stanza pipelines keyed by normalized language code
-_PIPELINES: dict[str, Any] = {}
+# Cache of initialized Stanza pipelines keyed by normalized language code, least recently
+# used first. At most `_pipeline_cache_size()` pipelines are kept.
+_PIPELINES: OrderedDict[str, Any] = OrderedDict()
 _PIPELINES_LOCK = threading.Lock()
 
 
+def _pipeline_cache_size() -> int:
+    """Maximum number of cached Stanza pipelines (ROOKEEN_STANZA_CACHE, default 2)."""
+    try:
+        return max(1, int(os.getenv("ROOKEEN_STANZA_CACHE", "2")))
+    except ValueError:
+        return 2
+
+
 def _normalize_lang(lang: str | None) -> str:
     if not lang or not lang.strip():
         return "en"
@@ -30,6 +41,8 @@ def ensure_stanza_pipeline(lang: str, auto_download: bool = True) -> Any:
     Environment variables:
     - ROOKEEN_STANZA_USE_GPU: if set to "1" truthy, requests GPU usage for pipeline
     - ROOKEEN_STANZA_VERBOSE: if set to "1" truthy, enables Stanza verbose output
+    - ROOKEEN_STANZA_CACHE: how many pipelines to keep cached (default 2); the least
+      recently used one is dropped when another language is loaded
 
     Args:
         lang: IETF/ISO language code (e.g., "en", "en-US"). Only the base part is used.
@@ -45,6 +58,7 @@ def ensure_stanza_pipeline(lang: str, auto_download: bool = True) -> Any:
 
     with _PIPELINES_LOCK:
         if normalized_lang in _PIPELINES:
+            _PIPELINES.move_to_end(normalized_lang)
             return _PIPELINES[normalized_lang]
 
         try:
@@ -91,6 +105,12 @@ def ensure_stanza_pipeline(lang: str, auto_download: bool = True) -> Any:
             ) from exc
 
         _PIPELINES[normalized_lang] = pipeline
+        evicted = len(_PIPELINES) - _pipeline_cache_size()
+        for _ in range(evicted):
+            _PIPELINES.popitem(last=False)
+        if evicted > 0:
+            # Free the evicted pipelines' tensors now rather than at the next collection
+            gc.collect()
         return pipeline
 
 
@@ -130,37 +150,7 @@ def text_to_conllu(text: str, lang: str, auto_download: bool = True) -> str:
 
     # Use Stanza's built-in CoNLL-U conversion
     try:
-        import os
-        import tempfile
-
-        from stanza.utils.conll import CoNLL
-
-        # Use Stanza's write_doc2conll to generate UD-compliant CoNLL-U
-        # This handles SpaceAfter annotations and other UD compliance issues automatically
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".conllu", delete=False) as temp_file:
-            temp_filename = temp_file.name
-
-        try:
-            CoNLL.write_doc2conll(doc, temp_filename)
-
-            # Read the generated CoNLL-U content
-            with open(temp_filename, encoding="utf-8") as f:
-                conll_content = f.read()
-
-            # Post-process to fix feature sorting (Stanza doesn't sort features alphabetically)
-            conll_content = _fix_feature_sorting(conll_content)
-
-            # Ensure proper ending with double newline
-            if not conll_content.endswith("\n\n"):
-                conll_content += "\n"
-
-            return conll_content
-
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_filename):
-                os.unlink(temp_filename)
-
+        from stanza.utils.conll import CoNLL  # noqa: F401 - availability check
     except ImportError:
         # Fallback to manual construction if CoNLL utilities are not available
         logger.warning(
@@ -168,6 +158,19 @@ def text_to_conllu(text: str, lang: str, auto_download: bool = True) -> str:
         )
         return _manual_conllu_construction(doc, text)
 
+    # Serialize in memory: CoNLL.write_doc2conll writes exactly this text to its file,
+    # UD-compliant with SpaceAfter annotations and multi-word token ranges in place
+    conll_content = f"{doc:C}\n\n"
+
+    # Post-process to fix feature sorting (Stanza doesn't sort features alphabetically)
+    conll_content = _fix_feature_sorting(conll_content)
+
+    # Ensure proper ending with double newline
+    if not conll_content.endswith("\n\n"):
+        conll_content += "\n"
+
+    return conll_content
+
 
 def _fix_feature_sorting(conll_content: str) -> str:
     """
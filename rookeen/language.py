@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import gc
+import os
 import shutil
 import subprocess
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any
 
 from langdetect import DetectorFactory, detect_langs
@@ -27,7 +32,18 @@ _LANG_TO_MODEL: dict[str, str] = {
     "fr": "fr_core_news_sm",
 }
 
-_MODEL_CACHE: dict[str, spacy.Language] = {}
+# Loaded models keyed by language and the sorted names of excluded components, least
+# recently used first. At most `_model_cache_size()` models are kept.
+_MODEL_CACHE: OrderedDict[tuple[str, tuple[str, ...]], spacy.Language] = OrderedDict()
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _model_cache_size() -> int:
+    """Maximum number of cached spaCy models (ROOKEEN_SPACY_CACHE, default 4)."""
+    try:
+        return max(1, int(os.getenv("ROOKEEN_SPACY_CACHE", "4")))
+    except ValueError:
+        return 4
 
 
 def normalize_lang(code: str) -> str:
@@ -161,11 +177,15 @@ def _install_spacy_model(model_pkg: str) -> bool:
     return False
 
 
-def get_spacy_model(lang_code: str, auto_download: bool = False) -> Any:
+def get_spacy_model(
+    lang_code: str, auto_download: bool = False, exclude: Iterable[str] = ()
+) -> Any:
     """Load and cache a spaCy language model for the given language code.
 
     If the model is not installed and auto_download is True, it will attempt to
     download the appropriate small model. Otherwise, raises a descriptive error.
+    Components named in `exclude` (e.g. "ner") are not loaded at all; each distinct
+    exclusion set is cached separately.
     """
     if spacy is None:
         raise RuntimeError("spaCy is not installed. Please add 'spacy' to dependencies.")
@@ -176,19 +196,24 @@ def get_spacy_model(lang_code: str, auto_download: bool = False) -> Any:
             f"Unsupported language '{lang_code}'. Supported languages: {sorted(SUPPORTED_LANGS)}"
         )
 
-    if lang in _MODEL_CACHE:
-        return _MODEL_CACHE[lang]
+    excluded = tuple(sorted(set(exclude)))
+    key = (lang, excluded)
+    with _MODEL_CACHE_LOCK:
+        cached = _MODEL_CACHE.get(key)
+        if cached is not None:
+            _MODEL_CACHE.move_to_end(key)
+            return cached
 
     model_pkg = _LANG_TO_MODEL[lang]
 
     try:
-        nlp = spacy.load(model_pkg)
+        nlp = spacy.load(model_pkg, exclude=list(excluded))
     except Exception as load_err:
         if auto_download:
             installed = _install_spacy_model(model_pkg)
             if installed:
                 try:
-                    nlp = spacy.load(model_pkg)
+                    nlp = spacy.load(model_pkg, exclude=list(excluded))
                 except Exception as second_err:
                     raise RuntimeError(
                         f"Installed '{model_pkg}' but failed to load it. Error: {second_err}"
@@ -214,5 +239,30 @@ def get_spacy_model(lang_code: str, auto_download: bool = False) -> Any:
                 + "` or call get_spacy_model(..., auto_download=True)."
             ) from load_err
 
-    _MODEL_CACHE[lang] = nlp
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE[key] = nlp
+        _MODEL_CACHE.move_to_end(key)
+        evicted = len(_MODEL_CACHE) - _model_cache_size()
+        for _ in range(evicted):
+            _MODEL_CACHE.popitem(last=False)
+    if evicted > 0:
+        # Free the evicted models' weights now rather than at the next collection
+        gc.collect()
     return nlp
+
+
+def prune_spacy_models(keep: Iterable[str] = ()) -> int:
+    """Drop cached spaCy models except those for the languages in `keep`.
+
+    Lets long-running hosts release models for languages they no longer serve. Docs
+    created by a dropped model stay valid; the model is freed once they are gone.
+    Returns the number of models removed.
+    """
+    keep_langs = {normalize_lang(code) for code in keep}
+    with _MODEL_CACHE_LOCK:
+        stale = [key for key in _MODEL_CACHE if key[0] not in keep_langs]
+        for key in stale:
+            del _MODEL_CACHE[key]
+    if stale:
+        gc.collect()
+    return len(stale)
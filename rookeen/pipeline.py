@@ -2,17 +2,24 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import inspect
 import time
-from collections.abc import Iterable, Sequence
-from typing import Any
+from collections.abc import AsyncIterator, Iterable, Sequence
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
 
-from rookeen.analyzers.base import BaseAnalyzer
+from rookeen.analyzers.base import BaseAnalyzer, get_analyzer_instance
+from rookeen.analyzers.context import AnalysisContext
 from rookeen.analyzers.dependency import DependencyAnalyzer
 from rookeen.language import detect_language, get_spacy_model, model_name_for, normalize_lang
 from rookeen.models import LinguisticAnalysisResult, WebPageContent
 from rookeen.scraping import AsyncWebScraper
 from rookeen.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    import aiohttp
+
 try:  # pragma: no cover - import guard for type hints
     from spacy.language import Language
     from spacy.tokens import Doc
@@ -21,48 +28,124 @@ except Exception:  # pragma: no cover
     Language = object
 
 
+# HTTP session opened by `AsyncLinguisticPipeline.session_scope` for the current task tree
+_shared_session: ContextVar[aiohttp.ClientSession | None] = ContextVar(
+    "rookeen_shared_session", default=None
+)
+
+
+# spaCy components that may be left out of a model when nothing reads their annotations.
+# The parser always stays: it segments sentences and DependencyAnalyzer is added whenever
+# a model has one; tagger and attribute_ruler provide the POS tags most analyzers use.
+_OPTIONAL_COMPONENTS = frozenset({"lemmatizer", "ner"})
+
+# Docs of one `analyze_texts` call whose analyzers run at the same time
+_DOC_CONCURRENCY = 4
+
+
+def _unused_components(
+    analyzers: Iterable[BaseAnalyzer], keep_components: Iterable[str] | None
+) -> tuple[str, ...]:
+    """Optional spaCy components neither the analyzers nor `keep_components` need."""
+    if keep_components is None:
+        return ()
+    needed = set(keep_components)
+    for analyzer in analyzers:
+        components = type(analyzer).spacy_components
+        if components is None:
+            return ()
+        needed |= components
+    return tuple(sorted(_OPTIONAL_COMPONENTS - needed))
+
+
+@functools.cache
+def _accepts_ctx(cls: type[BaseAnalyzer]) -> bool:
+    """Whether an analyzer's `analyze` takes the optional `ctx` argument.
+
+    Analyzers written against the original `analyze(doc, lang)` signature keep working.
+    """
+    return "ctx" in inspect.signature(cls.analyze).parameters
+
+
+@functools.cache
+def _is_async(cls: type[BaseAnalyzer]) -> bool:
+    """Whether an analyzer still implements `analyze` as a coroutine function."""
+    return inspect.iscoroutinefunction(cls.analyze)
+
+
+@functools.cache
+def _has_batch(cls: type[BaseAnalyzer]) -> bool:
+    """Whether an analyzer offers a synchronous `analyze_batch(docs, lang)`."""
+    method = getattr(cls, "analyze_batch", None)
+    return callable(method) and not inspect.iscoroutinefunction(method)
+
+
 class AsyncLinguisticPipeline:
     """Asynchronous linguistic analysis pipeline built around spaCy.
 
     - Accepts a list of analyzers (instances of BaseAnalyzer)
-    - Produces a spaCy Doc once per text and runs analyzers concurrently
+    - Produces a spaCy Doc and its AnalysisContext once per text
+    - Runs CPU-bound analyzers inline and overlaps blocking ones in worker threads
     - Injects language/model metadata into each analyzer result
+
+    By default spaCy models load with every component, so returned Docs carry all
+    annotations. Callers that only need the analyzer results pass `keep_components`
+    (the components their own Doc consumers, such as exports, read); optional
+    components that neither those nor any analyzer's `spacy_components` list are then
+    excluded from the load and recorded in `exclude_components`.
     """
 
     def __init__(
-        self, analyzers: Sequence[BaseAnalyzer], preload_languages: Iterable[str] | None = None
+        self,
+        analyzers: Sequence[BaseAnalyzer],
+        preload_languages: Iterable[str] | None = None,
+        keep_components: Iterable[str] | None = None,
     ) -> None:
         self.analyzers: list[BaseAnalyzer] = list(analyzers)
         self.preload_languages: list[str] = list(preload_languages or [])
+        self.exclude_components: tuple[str, ...] = _unused_components(
+            self.analyzers, keep_components
+        )
 
-    async def _run_analyzer(
-        self, analyzer: BaseAnalyzer, doc: Doc, lang: str
-    ) -> LinguisticAnalysisResult:
+    def _call_analyzer(
+        self, analyzer: BaseAnalyzer, doc: Doc, lang: str, ctx: AnalysisContext
+    ) -> Any:
+        """Call `analyzer.analyze`; returns a coroutine for analyzers written as async."""
         # Provide nlp to analyzers that optionally accept it (e.g., NER uses has_pipe)
         nlp_obj: Language | None = getattr(doc, "_.nlp", None)
         # Some analyzers may define a private _nlp slot; set defensively
         if hasattr(analyzer, "_nlp") and nlp_obj is not None:
             with contextlib.suppress(Exception):  # pragma: no cover
                 analyzer._nlp = nlp_obj
-        return await analyzer.analyze(doc, lang)
+        if _accepts_ctx(type(analyzer)):
+            return analyzer.analyze(doc, lang, ctx)
+        return analyzer.analyze(doc, lang)
 
-    async def analyze_text(
-        self,
-        text: str,
-        lang_override: str | None,
-        auto_download: bool,
-        default_language: str | None = None,
-    ) -> tuple[Doc, list[LinguisticAnalysisResult], dict[str, Any], dict[str, Any]]:
-        # Start overall timing
-        started_at = time.time()
-        start_perf = time.perf_counter()
+    def _start_concurrent(
+        self, analyzer: BaseAnalyzer, doc: Doc, lang: str, ctx: AnalysisContext
+    ) -> asyncio.Future[LinguisticAnalysisResult]:
+        """Start a blocking or async analyzer without waiting for it.
+
+        Blocking analyzers are submitted to the default executor right away, so they run
+        while the inline analyzers execute on the loop thread rather than after them.
+        """
+        if _is_async(type(analyzer)):
+            task: asyncio.Future[LinguisticAnalysisResult] = asyncio.ensure_future(
+                self._call_analyzer(analyzer, doc, lang, ctx)
+            )
+            return task
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(None, self._call_analyzer, analyzer, doc, lang, ctx)
 
-        # 0) Preload spaCy models if requested
-        if self.preload_languages:
-            for code in self.preload_languages:
-                get_spacy_model(code, auto_download=auto_download)
+    def _preload(self, auto_download: bool) -> None:
+        """Load the spaCy models named in `preload_languages` (cached after the first call)."""
+        for code in self.preload_languages:
+            get_spacy_model(code, auto_download=auto_download, exclude=self.exclude_components)
 
-        # 1) Determine language with precedence: CLI --lang > config > auto-detect
+    def _resolve_language(
+        self, text: str, lang_override: str | None, default_language: str | None
+    ) -> tuple[str, float]:
+        """Determine language with precedence: CLI --lang > config > auto-detect."""
         logger = get_logger("rookeen.pipeline")
 
         if lang_override and lang_override.strip():
@@ -92,29 +175,100 @@ class AsyncLinguisticPipeline:
                 "Using auto-detected language",
                 extra={"language": lang_code, "confidence": lang_conf},
             )
+        return lang_code, lang_conf
 
-        # 2) Load spaCy model
-        nlp: Language = get_spacy_model(lang_code, auto_download=auto_download)
+    def _load_model(self, lang_code: str, auto_download: bool) -> Language:
+        if self.exclude_components:
+            get_logger("rookeen.pipeline").debug(
+                "Loading spaCy model without unused components",
+                extra={"language": lang_code, "exclude": list(self.exclude_components)},
+            )
+        nlp: Language = get_spacy_model(
+            lang_code, auto_download=auto_download, exclude=self.exclude_components
+        )
+        return nlp
+
+    def _parse_group(
+        self, lang_code: str, texts: list[str], auto_download: bool, batch_size: int
+    ) -> tuple[Language, list[Doc]]:
+        """Load the model for `lang_code` and parse `texts` with `nlp.pipe`."""
+        nlp = self._load_model(lang_code, auto_download)
+        return nlp, list(nlp.pipe(texts, batch_size=batch_size))
 
-        # 3) Create Doc once
-        doc: Doc = nlp(text)
+    async def _run_batch_analyzers(
+        self, docs: list[Doc], lang_code: str
+    ) -> dict[int, list[LinguisticAnalysisResult]]:
+        """Run analyzers offering `analyze_batch` once over `docs`.
 
-        # 3.5) Dynamically add DependencyAnalyzer if parser is present and not already included
-        analyzer_names = {getattr(a, "name", None) for a in self.analyzers}
+        Returns each batch analyzer's per-Doc results keyed by its position in
+        `self.analyzers`. Blocking ones run in the default executor, concurrently.
+        """
+        pending: dict[int, asyncio.Future[list[LinguisticAnalysisResult]]] = {}
+        done: dict[int, list[LinguisticAnalysisResult]] = {}
+        loop = asyncio.get_running_loop()
+        for i, analyzer in enumerate(self.analyzers):
+            if _has_batch(type(analyzer)) and analyzer.blocking:
+                pending[i] = loop.run_in_executor(
+                    None, analyzer.analyze_batch, docs, lang_code  # type: ignore[attr-defined]
+                )
+        try:
+            for i, analyzer in enumerate(self.analyzers):
+                if _has_batch(type(analyzer)) and i not in pending:
+                    done[i] = analyzer.analyze_batch(docs, lang_code)  # type: ignore[attr-defined]
+            for i, res in zip(pending, await asyncio.gather(*pending.values()), strict=True):
+                done[i] = res
+        finally:
+            for fut in pending.values():
+                fut.cancel()
+        return done
+
+    async def _run_analyzers(
+        self,
+        nlp: Language,
+        doc: Doc,
+        lang_code: str,
+        lang_conf: float,
+        batched: dict[int, LinguisticAnalysisResult] | None = None,
+    ) -> tuple[list[LinguisticAnalysisResult], dict[str, Any]]:
+        """Run every analyzer over `doc`; returns the results and the language context.
+
+        `batched` holds results already computed by `_run_batch_analyzers`, keyed by
+        analyzer position; those analyzers are not called again.
+        """
+        batched = batched or {}
+        # Dynamically add DependencyAnalyzer if parser is present and not already included.
+        # Added for this call only: the pipeline may be reused with models lacking a parser.
+        analyzers = self.analyzers
+        analyzer_names = {getattr(a, "name", None) for a in analyzers}
         if (
             hasattr(nlp, "has_pipe")
             and nlp.has_pipe("parser")
             and "dependency" not in analyzer_names
         ):
-            self.analyzers.append(DependencyAnalyzer())
+            analyzers = [*analyzers, get_analyzer_instance(DependencyAnalyzer.name)]
 
-        # 4) Run analyzers concurrently
-        tasks = [self._run_analyzer(analyzer, doc, lang_code) for analyzer in self.analyzers]
-        results: list[LinguisticAnalysisResult] = []
-        if tasks:
-            results = list(await asyncio.gather(*tasks))
+        # Run analyzers over token attributes extracted once for the Doc. Blocking and
+        # legacy async analyzers start first so they overlap with the inline CPU-bound ones.
+        ctx = AnalysisContext.for_doc(doc)
+        slots: list[LinguisticAnalysisResult | None] = [None] * len(analyzers)
+        for i, res in batched.items():
+            slots[i] = res
+        pending: dict[int, asyncio.Future[LinguisticAnalysisResult]] = {}
+        for i, analyzer in enumerate(analyzers):
+            if i not in batched and (analyzer.blocking or _is_async(type(analyzer))):
+                pending[i] = self._start_concurrent(analyzer, doc, lang_code, ctx)
+        try:
+            for i, analyzer in enumerate(analyzers):
+                if i not in pending and i not in batched:
+                    slots[i] = self._call_analyzer(analyzer, doc, lang_code, ctx)
+            for i, res in zip(pending, await asyncio.gather(*pending.values()), strict=True):
+                slots[i] = res
+        finally:
+            for fut in pending.values():
+                fut.cancel()
+        results = [res for res in slots if res is not None]
 
-        # 5) Inject metadata per result
+        # Inject metadata per result
         model_pkg = model_name_for(lang_code)
         for res in results:
             res.metadata = {
@@ -126,22 +280,146 @@ class AsyncLinguisticPipeline:
             if not getattr(res, "name", "") and hasattr(res, "analysis_type"):
                 res.name = res.analysis_type.value
 
-        # Calculate timing
-        ended_at = time.time()
-        total_seconds = time.perf_counter() - start_perf
-
-        # 6) Return doc, results, context, timing
         context: dict[str, Any] = {
             "language": lang_code,
             "confidence": lang_conf,
             "model": model_pkg,
         }
-        timing: dict[str, Any] = {
-            "started_at": started_at,
-            "ended_at": ended_at,
-            "total_seconds": total_seconds,
-        }
-        return doc, results, context, timing
+        return results, context
+
+    async def analyze_texts(
+        self,
+        texts: Sequence[str],
+        lang_override: str | None,
+        auto_download: bool,
+        default_language: str | None = None,
+        batch_size: int = 32,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Analyze many texts, creating their Docs with one `nlp.pipe` call per language.
+
+        Texts are grouped by resolved language so each spaCy model streams its group
+        through its components in minibatches of up to `batch_size`. Model loading and
+        parsing run in a worker thread, keeping the event loop free for other tasks such
+        as in-flight fetches. Analyzers offering
+        `analyze_batch` (e.g. embeddings, sentiment) are then called once per group; the
+        others run per Doc as in `analyze_text`, with at most `_DOC_CONCURRENCY` Docs in
+        flight.
+        Returns one `(doc, results, context, timing)` tuple per text, in input order.
+        With `return_exceptions`, a text that fails (e.g. an unsupported language) yields
+        its exception in place of a tuple, as with `asyncio.gather`; otherwise the first
+        failure is raised. Each text's `total_seconds` covers its own language detection
+        and analyzers plus an even share of its group's model load, parse and batch
+        analyzer time.
+        """
+        started_at = time.time()
+        self._preload(auto_download)
+
+        out: list[Any] = [None] * len(texts)
+        groups: dict[str, list[int]] = {}
+        langs: list[tuple[str, float]] = [("", 0.0)] * len(texts)
+        own_seconds = [0.0] * len(texts)
+        for i, text in enumerate(texts):
+            start_perf = time.perf_counter()
+            try:
+                langs[i] = self._resolve_language(text, lang_override, default_language)
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                out[i] = exc
+                continue
+            own_seconds[i] = time.perf_counter() - start_perf
+            groups.setdefault(langs[i][0], []).append(i)
+
+        sem = asyncio.Semaphore(_DOC_CONCURRENCY)
+
+        async def run(
+            i: int, nlp: Language, doc: Doc, batched: dict[int, LinguisticAnalysisResult]
+        ) -> None:
+            async with sem:
+                start_perf = time.perf_counter()
+                try:
+                    results, context = await self._run_analyzers(nlp, doc, *langs[i], batched)
+                except Exception as exc:
+                    if not return_exceptions:
+                        raise
+                    out[i] = exc
+                    return
+                own_seconds[i] += time.perf_counter() - start_perf
+                timing: dict[str, Any] = {
+                    "started_at": started_at,
+                    "ended_at": time.time(),
+                    "total_seconds": own_seconds[i],
+                }
+                out[i] = (doc, results, context, timing)
+
+        for lang_code, idxs in groups.items():
+            start_perf = time.perf_counter()
+            try:
+                # Load and parse off the event loop so concurrent fetches keep progressing
+                nlp, docs = await asyncio.to_thread(
+                    self._parse_group,
+                    lang_code,
+                    [texts[i] for i in idxs],
+                    auto_download,
+                    max(1, min(batch_size, len(idxs))),
+                )
+                by_analyzer = await self._run_batch_analyzers(docs, lang_code)
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                for i in idxs:
+                    out[i] = exc
+                continue
+            parse_share = (time.perf_counter() - start_perf) / len(idxs)
+            for i in idxs:
+                own_seconds[i] += parse_share
+            await asyncio.gather(
+                *(
+                    run(i, nlp, doc, {a: res[n] for a, res in by_analyzer.items()})
+                    for n, (i, doc) in enumerate(zip(idxs, docs, strict=True))
+                )
+            )
+        return out
+
+    async def analyze_text(
+        self,
+        text: str,
+        lang_override: str | None,
+        auto_download: bool,
+        default_language: str | None = None,
+    ) -> tuple[Doc, list[LinguisticAnalysisResult], dict[str, Any], dict[str, Any]]:
+        """Analyze one text; see `analyze_texts` for analyzing many at once."""
+        analyzed: tuple[Doc, list[LinguisticAnalysisResult], dict[str, Any], dict[str, Any]]
+        (analyzed,) = await self.analyze_texts(
+            [text], lang_override, auto_download, default_language
+        )
+        return analyzed
+
+    @contextlib.asynccontextmanager
+    async def session_scope(self, concurrency: int = 10) -> AsyncIterator[None]:
+        """Share one HTTP session across the `analyze_web_page` calls made within the block.
+
+        Connections, DNS lookups and TLS sessions are then reused between pages instead of
+        being set up per URL. The session lives in a context variable, so tasks started
+        inside the block see it while other threads and event loops sharing this pipeline
+        keep opening their own.
+        """
+        async with AsyncWebScraper(connection_limit=concurrency) as scraper:
+            token = _shared_session.set(scraper.session)
+            try:
+                yield
+            finally:
+                _shared_session.reset(token)
+
+    async def fetch_web_page(
+        self, url: str, rate_limit: float = 0.5, robots_policy: str = "respect"
+    ) -> WebPageContent:
+        """Fetch a web page without analyzing it, reusing the `session_scope` session if any."""
+        async with AsyncWebScraper(
+            rate_limit=rate_limit, robots_policy=robots_policy, session=_shared_session.get()
+        ) as scraper:
+            return await scraper.fetch_page(url)
 
     async def analyze_web_page(
         self,
@@ -160,8 +438,7 @@ class AsyncLinguisticPipeline:
         `WebPageContent` instance enriched with language fields by the pipeline, and `doc`
         is the spaCy Doc produced for the fetched text.
         """
-        async with AsyncWebScraper(rate_limit=rate_limit, robots_policy=robots_policy) as scraper:
-            content = await scraper.fetch_page(url)
+        content = await self.fetch_web_page(url, rate_limit, robots_policy)
         # Analyze the fetched text
         doc, results, context, timing = await self.analyze_text(
             content.text, lang_override, auto_download, default_language
@@ -170,3 +447,37 @@ class AsyncLinguisticPipeline:
         content.language = context["language"]
         content.language_confidence = float(context["confidence"])
         return content, doc, results, context, timing
+
+    async def analyze_web_pages(
+        self,
+        contents: Sequence[WebPageContent],
+        lang_override: str | None = None,
+        auto_download: bool = False,
+        default_language: str | None = None,
+        batch_size: int = 16,
+    ) -> list[
+        tuple[Doc, list[LinguisticAnalysisResult], dict[str, Any], dict[str, Any]]
+        | BaseException
+    ]:
+        """Analyze already fetched pages together through `analyze_texts`.
+
+        Batching needs the pages up front: fetch them first (e.g. concurrently with
+        `fetch_web_page`), then pass them here instead of calling `analyze_web_page` per
+        URL. Items come back in the order of `contents`; a page that fails yields its
+        exception instead of aborting the others. Successful pages are enriched with
+        their detected language.
+        """
+        out = await self.analyze_texts(
+            [content.text for content in contents],
+            lang_override,
+            auto_download,
+            default_language,
+            batch_size=batch_size,
+            return_exceptions=True,
+        )
+        for content, item in zip(contents, out, strict=True):
+            if not isinstance(item, BaseException):
+                context = item[2]
+                content.language = context["language"]
+                content.language_confidence = float(context["confidence"])
+        return out
@@ -10,13 +10,15 @@ import aiohttp
 from bs4 import BeautifulSoup
 
 from rookeen.models import WebPageContent
-from rookeen.utils.robots import politeness_delay
+from rookeen.utils.robots import async_politeness_delay
 
 
 class AsyncWebScraper:
     """Asynchronous web scraper for content extraction.
 
-    Uses aiohttp for fetching and BeautifulSoup for sanitization.
+    Uses aiohttp for fetching and BeautifulSoup for sanitization. Pass `session` to
+    borrow an already-open session (and its connection pool); a borrowed session is
+    left open on exit. `connection_limit` caps the connections of an owned session.
     """
 
     def __init__(
@@ -25,10 +27,14 @@ class AsyncWebScraper:
         max_retries: int = 3,
         rate_limit: float = 0.5,
         robots_policy: str = "respect",
+        session: aiohttp.ClientSession | None = None,
+        connection_limit: int = 10,
     ):
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_retries = max_retries
-        self.session: aiohttp.ClientSession | None = None
+        self.session: aiohttp.ClientSession | None = session
+        self._owns_session = session is None
+        self.connection_limit = connection_limit
         self.rate_limit = rate_limit
         self.robots_policy = robots_policy
         self.robots_parser: RobotFileParser | None = None
@@ -46,15 +52,18 @@ class AsyncWebScraper:
         }
 
     async def __aenter__(self) -> AsyncWebScraper:
-        self.session = aiohttp.ClientSession(
-            timeout=self.timeout,
-            headers=self.headers,
-            connector=aiohttp.TCPConnector(limit=10, limit_per_host=5),
-        )
+        if self._owns_session:
+            self.session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(
+                    limit=self.connection_limit, limit_per_host=5, ttl_dns_cache=300
+                ),
+            )
         return self
 
     async def __aexit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None) -> None:
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
 
     async def fetch_page(self, url: str) -> WebPageContent:
@@ -62,12 +71,12 @@ class AsyncWebScraper:
         if not self.session:
             raise RuntimeError("AsyncWebScraper not properly initialized")
 
-        # Check robots.txt before attempting to fetch
-        if not self._check_robots_txt(url):
+        # Check robots.txt before attempting to fetch; the read is blocking urllib I/O
+        if not await asyncio.to_thread(self._check_robots_txt, url):
             raise aiohttp.ClientError(f"Robots.txt disallows crawling: {url}")
 
         # Apply rate limiting
-        politeness_delay(url, self.rate_limit)
+        await async_politeness_delay(url, self.rate_limit)
 
         last_exc: Exception | None = None
         for attempt in range(1, self.max_retries + 1):
@@ -39,5 +39,21 @@ def get_logger(name: str, level: str | None = None) -> logging.Logger:
     return logger
 
 
+class TraceAdapter(logging.LoggerAdapter[logging.Logger]):
+    """Logger adapter that stamps every record with one trace/run id.
+
+    The ids are built once per run; call-site `extra` fields are merged over them
+    rather than replacing them, and only for records that pass the level check.
+    """
+
+    def __init__(self, logger: logging.Logger, trace: str) -> None:
+        super().__init__(logger, {"trace_id": trace, "run_id": trace})
+
+    def process(self, msg: Any, kwargs: Any) -> tuple[Any, Any]:
+        extra = kwargs.get("extra")
+        kwargs["extra"] = self.extra if not extra else {**(self.extra or {}), **extra}
+        return msg, kwargs
+
+
 def new_trace_id() -> str:
     return uuid.uuid4().hex
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from urllib.parse import urlparse
 
@@ -14,3 +15,43 @@ def politeness_delay(url: str, rps: float = 0.5) -> None:
     if now - last < min_interval:
         time.sleep(min_interval - (now - last))
     _last_visit[host] = time.time()
+
+
+async def async_politeness_delay(url: str, rps: float = 0.5) -> None:
+    """Non-blocking `politeness_delay` that keeps per-host spacing across concurrent fetches.
+
+    Each caller reserves the host's next free slot before sleeping, so coroutines fetching
+    the same host queue up `1 / rps` seconds apart instead of all waking at once.
+    """
+    host = urlparse(url).netloc
+    now = time.time()
+    min_interval = 1.0 / max(rps, 0.01)
+    slot = max(now, _last_visit.get(host, 0.0) + min_interval)
+    _last_visit[host] = slot
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
+class Throttle:
+    """Async context manager admitting at most `rps` entries per second overall.
+
+    Unlike `async_politeness_delay`, which spaces requests per host, this paces every
+    request sharing the instance, e.g. all fetches of one batch run. Entrants reserve
+    the next free slot before sleeping, so waiters are released in arrival order.
+    """
+
+    __slots__ = ("_interval", "_next")
+
+    def __init__(self, rps: float) -> None:
+        self._interval = 1.0 / max(rps, 0.01)
+        self._next = 0.0
+
+    async def __aenter__(self) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next)
+        self._next = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
@@ -1,4 +1,3 @@
-import asyncio
 from pathlib import Path
 
 from rookeen.analyzers.ner import NERAnalyzer
@@ -15,7 +14,7 @@ def test_pos_upos_counts_present_local_fixture():
         / "en_short.txt"
     ).read_text(encoding="utf-8")
     doc = nlp(text)
-    result = asyncio.run(POSAnalyzer().analyze(doc, "en"))
+    result = POSAnalyzer().analyze(doc, "en")
     assert "upos_counts" in result.results
     assert isinstance(result.results["upos_counts"], dict)
 
@@ -29,6 +28,6 @@ def test_ner_supported_flag_local_fixture():
         / "en_medium.txt"
     ).read_text(encoding="utf-8")
     doc = nlp(text)
-    result = asyncio.run(NERAnalyzer(nlp=nlp).analyze(doc, "en"))
+    result = NERAnalyzer(nlp=nlp).analyze(doc, "en")
     assert "supported" in result.results
 
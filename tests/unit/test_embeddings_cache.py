@@ -0,0 +1,53 @@
+from collections import OrderedDict
+
+import pytest
+
+from rookeen.analyzers.embeddings_backends import CachedBackend, EmbeddingBackend
+
+
+class VariantBackend(EmbeddingBackend):
+    def __init__(self, dtype: str, scale: float) -> None:
+        self.dtype = dtype
+        self.scale = scale
+        self.calls: list[list[str]] = []
+
+    def load(self) -> None:
+        pass
+
+    def embed(self, text: str) -> list[float]:
+        return [len(text) * self.scale, 1.0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return super().embed_batch(texts)
+
+    def provenance(self) -> dict[str, object]:
+        return {"backend": "unit-variant", "model": "m", "dim": 2, "dtype": self.dtype}
+
+
+@pytest.fixture(autouse=True)
+def fresh_memory(monkeypatch):
+    monkeypatch.setattr(CachedBackend, "_memory", OrderedDict())
+
+
+def test_cache_separates_variants(tmp_path):
+    fp32 = CachedBackend(VariantBackend("float32", 1.0), cache_dir=tmp_path)
+    fp16 = CachedBackend(VariantBackend("float16", 0.5), cache_dir=tmp_path)
+    assert fp32.embed("abcd") == [4.0, 1.0]
+    assert fp16.embed("abcd") == [2.0, 1.0]
+
+    # A new process (empty memory tier) reads each variant's own rows from disk
+    CachedBackend._memory.clear()
+    inner = VariantBackend("float32", 1.0)
+    assert CachedBackend(inner, cache_dir=tmp_path).embed("abcd") == [4.0, 1.0]
+    assert inner.calls == []
+
+
+def test_cache_returns_copies(tmp_path):
+    inner = VariantBackend("float32", 1.0)
+    cached = CachedBackend(inner, cache_dir=tmp_path)
+    first, dup = cached.embed_batch(["ab", "ab"])
+    assert inner.calls == [["ab"]]
+    first.append(99.0)
+    assert dup == [2.0, 1.0]
+    assert cached.embed("ab") == [2.0, 1.0]
@@ -0,0 +1,44 @@
+import spacy
+
+from rookeen.analyzers import embeddings
+from rookeen.analyzers.embeddings_backends import EmbeddingBackend, register_backend
+
+
+@register_backend("unit-counting")
+class CountingBackend(EmbeddingBackend):
+    instances = 0
+    loads = 0
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+        self.loaded = False
+
+    def load(self) -> None:
+        if not self.loaded:
+            type(self).loads += 1
+            self.loaded = True
+
+    def embed(self, text: str) -> list[float]:
+        self.load()
+        return [float(len(text))]
+
+    def provenance(self) -> dict[str, object]:
+        return {"backend": "unit-counting", "model": "none", "dim": 1, "normalized": False}
+
+
+def test_embeddings_analyzer_reuses_one_backend(monkeypatch):
+    monkeypatch.setenv("ROOKEEN_EMBEDDINGS_BACKEND", "unit-counting")
+    monkeypatch.setenv("ROOKEEN_EMBEDDINGS_CACHE", "0")
+    monkeypatch.setattr(embeddings, "_BACKENDS", {})
+    nlp = spacy.blank("en")
+    analyzer = embeddings.EmbeddingsAnalyzer()
+
+    # A CLI preload and several analyzer calls share the same loaded backend
+    embeddings.shared_backend("unit-counting").load()
+    first = analyzer.analyze_batch([nlp("a b"), nlp("abc def")], "en")
+    second = analyzer.analyze(nlp("x"), "en")
+
+    assert [r.results["vector"] for r in first] == [[3.0], [7.0]]
+    assert second.results["vector"] == [1.0]
+    assert CountingBackend.instances == 1
+    assert CountingBackend.loads == 1
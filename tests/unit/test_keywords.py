@@ -1,5 +1,3 @@
-import asyncio
-
 import spacy
 
 from rookeen.analyzers.keywords import KeywordAnalyzer
@@ -9,7 +7,18 @@ def test_keywords_returns_top_list(fixture_texts):
     analyzer = KeywordAnalyzer()
     nlp = spacy.blank("en")
     doc = nlp(fixture_texts["en_short"])
-    result = asyncio.run(analyzer.analyze(doc, "en"))
+    result = analyzer.analyze(doc, "en")
     assert result.name == "keywords"
     assert "keywords" in result.results
     assert isinstance(result.results["keywords"], list)
+
+
+def test_keywords_rake_method_scores_phrases():
+    analyzer = KeywordAnalyzer(method="rake")
+    nlp = spacy.blank("en")
+    doc = nlp("Linear algebra is fun and machine learning is hard.")
+    result = analyzer.analyze(doc, "en")
+    assert result.results["method"] == "rake"
+    phrases = dict(result.results["keywords"])
+    assert phrases["linear algebra"] == 4.0
+    assert phrases["machine learning"] == 4.0
@@ -1,5 +1,3 @@
-import asyncio
-
 import spacy
 
 from rookeen.analyzers.lexical_stats import LexicalStatsAnalyzer
@@ -11,7 +9,7 @@ def test_lexical_stats_expected_fields(fixture_texts):
     # Ensure sentence boundaries are available for doc.sents
     nlp.add_pipe("sentencizer")
     doc = nlp(fixture_texts["en_medium"])
-    result = asyncio.run(analyzer.analyze(doc, "en"))
+    result = analyzer.analyze(doc, "en")
 
     for key in (
         "total_tokens",
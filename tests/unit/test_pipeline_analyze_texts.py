@@ -0,0 +1,129 @@
+import asyncio
+import time
+from typing import ClassVar
+
+import pytest
+import spacy
+
+import rookeen.pipeline as pipeline_mod
+from rookeen.analyzers.base import BaseAnalyzer
+from rookeen.analyzers.lexical_stats import LexicalStatsAnalyzer
+from rookeen.models import AnalysisType, LinguisticAnalysisResult
+from rookeen.pipeline import AsyncLinguisticPipeline
+
+
+class CountingBatchAnalyzer(BaseAnalyzer):
+    name = "unit_batch"
+    analysis_type = AnalysisType.SENTIMENT
+    calls: ClassVar[list[tuple[str, int]]] = []
+
+    def _result(self, doc, lang):
+        return LinguisticAnalysisResult(
+            analysis_type=self.analysis_type,
+            name=self.name,
+            results={"lang": lang, "n_tokens": len(doc)},
+            processing_time=0.0,
+        )
+
+    def analyze(self, doc, lang, ctx=None):
+        return self._result(doc, lang)
+
+    def analyze_batch(self, docs, lang):
+        type(self).calls.append((lang, len(docs)))
+        return [self._result(doc, lang) for doc in docs]
+
+
+class BlockingBatchAnalyzer(CountingBatchAnalyzer):
+    name = "unit_batch_blocking"
+    blocking = True
+    calls: ClassVar[list[tuple[str, int]]] = []
+
+
+@pytest.fixture
+def fake_models(monkeypatch):
+    models = {}
+
+    def get_model(code, auto_download=False, exclude=()):
+        if code == "de":
+            raise OSError("no model for de")
+        if code not in models:
+            models[code] = spacy.blank(code)
+            models[code].add_pipe("sentencizer")
+        return models[code]
+
+    monkeypatch.setattr(pipeline_mod, "get_spacy_model", get_model)
+    # Texts are tagged with their language: "en: ...", "fr: ..."
+    monkeypatch.setattr(pipeline_mod, "detect_language", lambda text: (text[:2], 0.99))
+    CountingBatchAnalyzer.calls = []
+    BlockingBatchAnalyzer.calls = []
+    return get_model
+
+
+def _pipeline():
+    return AsyncLinguisticPipeline(
+        [LexicalStatsAnalyzer(), CountingBatchAnalyzer(), BlockingBatchAnalyzer()]
+    )
+
+
+def test_analyze_texts_keeps_order_across_languages(fake_models):
+    texts = ["en: one two", "fr: un deux trois", "en: three", "fr: quatre", "en: a b c d"]
+    out = asyncio.run(_pipeline().analyze_texts(texts, None, False))
+    assert [doc.text for doc, _, _, _ in out] == texts
+    for text, (doc, results, context, _) in zip(texts, out, strict=True):
+        assert [r.name for r in results] == ["lexical_stats", "unit_batch", "unit_batch_blocking"]
+        assert context["language"] == text[:2]
+        assert results[1].results == {"lang": text[:2], "n_tokens": len(doc)}
+    # One analyze_batch call per language group, per batch analyzer.
+    assert sorted(CountingBatchAnalyzer.calls) == [("en", 3), ("fr", 2)]
+    assert sorted(BlockingBatchAnalyzer.calls) == [("en", 3), ("fr", 2)]
+
+
+def test_analyze_texts_return_exceptions(fake_models):
+    texts = ["en: one", "de: eins zwei", "fr: un"]
+    pipeline = _pipeline()
+    with pytest.raises(OSError):
+        asyncio.run(pipeline.analyze_texts(texts, None, False))
+    out = asyncio.run(pipeline.analyze_texts(texts, None, False, return_exceptions=True))
+    assert isinstance(out[1], OSError)
+    assert out[0][0].text == "en: one"
+    assert out[2][0].text == "fr: un"
+
+
+def test_analyze_text_matches_per_analyzer_results(fake_models):
+    text = "en: The cat sat. The dog ran far away."
+    doc, results, _, timing = asyncio.run(_pipeline().analyze_text(text, None, False))
+    assert doc.text == text
+    assert timing["total_seconds"] >= 0
+    expected_doc = fake_models("en")(text)
+    expected = [
+        a.analyze(expected_doc, "en")
+        for a in (LexicalStatsAnalyzer(), CountingBatchAnalyzer(), BlockingBatchAnalyzer())
+    ]
+    assert [(r.name, r.results) for r in results] == [(r.name, r.results) for r in expected]
+
+
+def test_analyze_texts_parses_off_the_event_loop(fake_models):
+    nlp = fake_models("en")
+    pipe = nlp.pipe
+
+    def slow_pipe(texts, **kwargs):
+        time.sleep(0.3)
+        return pipe(texts, **kwargs)
+
+    nlp.pipe = slow_pipe
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await _pipeline().analyze_texts(["en: one two"], None, False)
+        ticker.cancel()
+        return ticks
+
+    assert asyncio.run(main()) >= 10
@@ -1,5 +1,3 @@
-import asyncio
-
 import spacy
 
 from rookeen.analyzers.readability import ReadabilityAnalyzer
@@ -9,7 +7,7 @@ def test_readability_has_expected_fields(fixture_texts):
     analyzer = ReadabilityAnalyzer()
     nlp = spacy.blank("en")
     doc = nlp(fixture_texts["en_medium"])
-    result = asyncio.run(analyzer.analyze(doc, "en"))
+    result = analyzer.analyze(doc, "en")
     for key in (
         "flesch_reading_ease",
         "flesch_kincaid_grade",
@@ -22,3 +20,17 @@ def test_readability_has_expected_fields(fixture_texts):
         "text_standard",
     ):
         assert key in result.results, f"missing {key}"
+
+
+def test_readability_matches_textstat(fixture_texts):
+    from textstat import textstat
+
+    analyzer = ReadabilityAnalyzer()
+    nlp = spacy.blank("en")
+    text = fixture_texts["en_medium"]
+    results = analyzer.analyze(nlp(text), "en").results
+    assert results["flesch_reading_ease"] == textstat.flesch_reading_ease(text)
+    assert results["smog_index"] == textstat.smog_index(text)
+    assert results["dale_chall_readability_score"] == textstat.dale_chall_readability_score(text)
+    assert results["difficult_words"] == textstat.difficult_words(text)
+    assert results["text_standard"] == textstat.text_standard(text, float_output=False)
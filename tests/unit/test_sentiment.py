@@ -0,0 +1,16 @@
+import pytest
+import spacy
+
+from rookeen.analyzers.sentiment import SentimentAnalyzer
+
+
+def test_sentiment_batch_matches_vader(fixture_texts):
+    vader = pytest.importorskip("vaderSentiment.vaderSentiment")
+    sia = vader.SentimentIntensityAnalyzer()
+    nlp = spacy.blank("en")
+    texts = [fixture_texts["en_short"], "The table is next to the chair.", "Not good at all!", ""]
+    texts.append("No good. Never so happy, without doubt, yet at least not bad. " * 20 + "kind of GOOD")
+    results = SentimentAnalyzer().analyze_batch([nlp(t) for t in texts], "en")
+    for text, result in zip(texts, results, strict=True):
+        assert result.results["method"] == "vader"
+        assert result.results["scores"] == sia.polarity_scores(text)
@@ -0,0 +1,10 @@
+from rookeen.cli import _run_job
+
+
+def test_run_job_returns_stderr(tmp_path, capsys):
+    reply = _run_job(["analyze-file", str(tmp_path / "missing.txt"), "--lang", "en"])
+    assert reply["return_code"] != 0
+    assert "does not exist" in reply["stderr"]
+    # The job's stderr is echoed to the worker's stderr as well
+    assert "does not exist" in capsys.readouterr().err
+
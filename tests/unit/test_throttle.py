@@ -0,0 +1,100 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from itertools import pairwise
+
+import pytest
+
+import rookeen.utils.robots as robots
+from rookeen.cli_func import _batch_async
+from rookeen.config import AnalyzeOptions, RookeenSettings
+from rookeen.utils.logging import TraceAdapter, get_logger
+from rookeen.utils.robots import Throttle, async_politeness_delay
+
+
+def _gaps(times):
+    return [b - a for a, b in pairwise(times)]
+
+
+def test_throttle_spaces_entries():
+    async def main():
+        throttle = Throttle(2)
+        entered = []
+
+        async def enter():
+            async with throttle:
+                entered.append(time.monotonic())
+
+        await asyncio.gather(*(enter() for _ in range(4)))
+        return entered
+
+    entered = asyncio.run(main())
+    assert len(entered) == 4
+    for gap in _gaps(entered):
+        assert gap == pytest.approx(0.5, abs=0.1)
+
+
+def test_async_politeness_delay_reserves_increasing_slots(monkeypatch):
+    monkeypatch.setattr(robots, "_last_visit", {})
+
+    async def main():
+        done = []
+
+        async def visit(path):
+            await async_politeness_delay(f"https://example.com/{path}", rps=10)
+            done.append(time.time())
+
+        await asyncio.gather(*(visit(i) for i in range(4)))
+        return done
+
+    done = asyncio.run(main())
+    for gap in _gaps(done):
+        assert gap == pytest.approx(0.1, abs=0.05)
+    # Another host is not delayed by the first one's queue
+    start = time.time()
+    asyncio.run(async_politeness_delay("https://other.example.org/", rps=10))
+    assert time.time() - start < 0.05
+
+
+class _FakePipeline:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fetched = 0
+
+    @asynccontextmanager
+    async def session_scope(self, concurrency=10):
+        yield
+
+    async def fetch_web_page(self, url, rate_limit=0.5, robots_policy="respect"):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+            self.fetched += 1
+            raise OSError(f"unreachable: {url}")
+        finally:
+            self.in_flight -= 1
+
+    async def analyze_web_pages(self, contents, **kwargs):
+        return []
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_batch_fetches_bounded_by_workers(tmp_path, workers):
+    pipeline = _FakePipeline()
+    urls = [f"https://host{i % 5}.example.com/{i}" for i in range(40)]
+    failures = asyncio.run(
+        _batch_async(
+            pipeline,  # type: ignore[arg-type]
+            urls,
+            str(tmp_path),
+            AnalyzeOptions(rate_limit=1000.0),
+            RookeenSettings(),
+            TraceAdapter(get_logger("rookeen.test"), "t"),
+            workers,
+        )
+    )
+    assert failures == len(urls)
+    assert pipeline.fetched == len(urls)
+    assert pipeline.max_in_flight == workers
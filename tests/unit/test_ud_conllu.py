@@ -0,0 +1,39 @@
+import sys
+import types
+
+from rookeen.export import ud_conllu
+
+CONLLU = (
+    "# text = Dogs bark.\n"
+    "1\tDogs\tdog\tNOUN\tNNS\tNumber=Plur\t2\tnsubj\t_\t_\n"
+    "2\tbark\tbark\tVERB\tVBP\tTense=Pres|Mood=Ind\t0\troot\t_\tSpaceAfter=No\n"
+    "3\t.\t.\tPUNCT\t.\t_\t2\tpunct\t_\t_"
+)
+
+
+class _StanzaDoc:
+    def __format__(self, spec: str) -> str:
+        assert spec == "C"
+        return CONLLU
+
+
+def test_text_to_conllu_serializes_stanza_doc_in_memory(monkeypatch):
+    # Stand-in stanza package so the availability check passes without the real one
+    conll_mod = types.ModuleType("stanza.utils.conll")
+    conll_mod.CoNLL = object()
+    monkeypatch.setitem(sys.modules, "stanza", types.ModuleType("stanza"))
+    monkeypatch.setitem(sys.modules, "stanza.utils", types.ModuleType("stanza.utils"))
+    monkeypatch.setitem(sys.modules, "stanza.utils.conll", conll_mod)
+    monkeypatch.setattr(
+        ud_conllu, "ensure_stanza_pipeline", lambda lang, auto_download=True: lambda text: _StanzaDoc()
+    )
+
+    def no_fallback(doc, text):
+        raise AssertionError("manual CoNLL-U fallback used")
+
+    monkeypatch.setattr(ud_conllu, "_manual_conllu_construction", no_fallback)
+
+    out = ud_conllu.text_to_conllu("Dogs bark.", "en")
+
+    # Stanza's text is kept (SpaceAfter included) with FEATS sorted and a closing blank line
+    assert out == CONLLU.replace("Tense=Pres|Mood=Ind", "Mood=Ind|Tense=Pres") + "\n\n"